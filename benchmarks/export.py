@@ -0,0 +1,78 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark: serialized size and encode/decode time per export format
+
+Usage: python -m benchmarks.export [--releases 10000]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import timeit
+
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.exporters import EXPORTERS, msgpack
+
+from benchmarks.generator import ChangelogGenerator
+
+DECODERS = {
+    "json": json.loads,
+    "compact-json": json.loads,
+    "jsonl": lambda data: [json.loads(line) for line in data.splitlines()],
+    "msgpack": msgpack.unpackb if msgpack else None,
+}
+
+
+def main():
+    """Entrypoint"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--releases", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "CHANGELOG.md")
+        ChangelogGenerator(releases=args.releases, seed=args.seed).write(file_path)
+
+        releases = list(ChangelogReader(file_path=file_path).read().values())
+
+    print(f"{'format':<14} {'size (KiB)':>12} {'encode (ms)':>12} {'decode (ms)':>12}")
+    for name, exporter in EXPORTERS.items():
+        if not DECODERS[name]:
+            print(f"{name:<14} {'not available':>12}")
+            continue
+
+        data = exporter(releases)
+        encode = min(
+            timeit.repeat(lambda: exporter(releases), number=1, repeat=args.repeat)
+        )
+        decode = min(
+            timeit.repeat(
+                lambda: DECODERS[name](data),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+
+        print(
+            f"{name:<14} {len(data) / 1024:12.1f} {encode * 1000:12.2f} {decode * 1000:12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
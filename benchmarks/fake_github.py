@@ -0,0 +1,171 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offline stand-in for the GitHub Releases API"""
+
+import json
+import random
+import re
+import threading
+import time
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+RELEASES_API = re.compile(
+    r"^/repos/(?P<repository>[^/]+/[^/]+)/releases(?:/(?P<id>[0-9]+))?$"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handles list/create/delete requests on releases"""
+
+    server: "FakeGitHubServer"
+
+    def log_message(self, *_):  # pylint: disable=W0221
+        """Silence request logging"""
+
+    def __respond(self, status, data=None):
+        body = json.dumps(data).encode() if data is not None else b""
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-RateLimit-Limit", str(self.server.rate_limit))
+        self.send_header("X-RateLimit-Remaining", str(max(self.server.remaining, 0)))
+        self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def __handle(self):
+        url = urlparse(self.path)
+        match = RELEASES_API.match(url.path)
+        self.server.record(self.command)
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        if not match:
+            return self.__respond(404, {"message": "Not Found"})
+
+        if self.server.consume_rate_limit():
+            return self.__respond(403, {"message": "API rate limit exceeded"})
+
+        if self.server.inject_error():
+            return self.__respond(500, {"message": "Server Error"})
+
+        if self.command == "GET" and not match.group("id"):
+            query = parse_qs(url.query)
+            per_page = int(query.get("per_page", ["30"])[0])
+            page = int(query.get("page", ["1"])[0])
+            return self.__respond(200, self.server.list_releases(per_page, page))
+
+        if self.command == "POST" and not match.group("id"):
+            length = int(self.headers.get("Content-Length", 0))
+            data = json.loads(self.rfile.read(length) or b"{}")
+            return self.__respond(201, self.server.create_release(data))
+
+        if self.command == "DELETE" and match.group("id"):
+            if self.server.delete_release(int(match.group("id"))):
+                return self.__respond(204)
+            return self.__respond(404, {"message": "Not Found"})
+
+        return self.__respond(405, {"message": "Method Not Allowed"})
+
+    do_GET = __handle
+    do_POST = __handle
+    do_DELETE = __handle
+
+
+class FakeGitHubServer(ThreadingHTTPServer):
+    """In-memory GitHub Releases API with latency, errors and rate limiting"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: int = 5000,
+        seed: int = 0,
+    ):
+        """Constructor"""
+
+        super().__init__(("127.0.0.1", 0), _Handler)
+
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.remaining = rate_limit
+        self.releases = []
+        self.requests = Counter()
+
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__next_id = 1
+        self.__thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to provide to the GitHub client"""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def record(self, method: str) -> None:
+        """Counts the incoming request"""
+        with self.__lock:
+            self.requests[method] += 1
+
+    def consume_rate_limit(self) -> bool:
+        """Returns True once the rate limit is exhausted"""
+        with self.__lock:
+            self.remaining -= 1
+            return self.remaining < 0
+
+    def inject_error(self) -> bool:
+        """Returns True when an error should be injected"""
+        with self.__lock:
+            return self.__random.random() < self.error_rate
+
+    def list_releases(self, per_page: int, page: int):
+        """Returns a single page of releases"""
+        with self.__lock:
+            return self.releases[(page - 1) * per_page : page * per_page]
+
+    def create_release(self, data):
+        """Stores a new release"""
+        with self.__lock:
+            release = {"id": self.__next_id, "draft": False, **data}
+            self.__next_id += 1
+            self.releases.insert(0, release)
+            return release
+
+    def delete_release(self, identifier: int) -> bool:
+        """Deletes a release, returns False if it does not exist"""
+        with self.__lock:
+            remaining = [r for r in self.releases if r["id"] != identifier]
+            deleted = len(remaining) != len(self.releases)
+            self.releases = remaining
+            return deleted
+
+    def __enter__(self):
+        self.__thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        super().__exit__(*args)
@@ -0,0 +1,214 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Deterministic synthetic changelogs for tests and benchmarks"""
+
+import datetime
+import random
+
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+from changelogmanager.change_types import TypesOfChange
+
+WORDS = (
+    "api cache client command component configuration crash data default "
+    "dependency documentation entry error export file format handler index "
+    "layout memory option output parser performance release request section "
+    "server support timeout validation version warning"
+).split()
+
+FIRST_DATE = datetime.date(1900, 1, 1)
+
+# Layout errors to inject: (kind, rule reported by the ChangelogReader)
+ERROR_KINDS = [
+    ("change-type", "change-type"),
+    ("semver", "semver"),
+    ("release-metadata", "release-metadata"),
+    ("release-date", "release-date"),
+    ("heading-depth", "heading-depth"),
+    ("block-quote", "entry-format"),
+    ("numbered-list", "entry-format"),
+    ("sub-list", "entry-format"),
+]
+
+HEADING_ERRORS = ("semver", "release-metadata", "release-date")
+
+
+@dataclass
+class InjectedError:
+    """Layout error injected at a known position"""
+
+    line: int
+    rule: str
+    version: str
+
+
+class ChangelogGenerator:  # pylint: disable=R0902
+    """Generates realistic changelogs of any size, deterministically from a seed
+
+    The lines are generated lazily, allowing files of millions of lines to be
+    written without keeping them in memory. The positions of injected errors and
+    the generated versions are available once the lines have been generated.
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        releases: int = 100,
+        *,
+        max_entries: int = 4,
+        line_length: Tuple[int, int] = (20, 100),
+        errors: int = 0,
+        unreleased: bool = True,
+        seed: int = 0,
+    ):
+        """Constructor"""
+
+        if errors > releases:
+            raise ValueError("At most one error per release can be injected")
+
+        self.releases = releases
+        self.max_entries = max_entries
+        self.line_length = line_length
+        self.error_count = errors
+        self.unreleased = unreleased
+        self.seed = seed
+
+        self.errors: List[InjectedError] = []
+        self.versions: List[str] = []
+        self.line_count = 0
+
+    def __message(self, rng: random.Random) -> str:
+        length = rng.randint(*self.line_length)
+        words = [rng.choice(WORDS).capitalize()]
+        current = len(words[0])
+        while current < length:
+            words.append(rng.choice(WORDS))
+            current += len(words[-1]) + 1
+        return " ".join(words)
+
+    def __release_versions(self, rng: random.Random) -> List[Tuple[str, str]]:
+        """Returns (version, release date) pairs, newest first"""
+
+        major, minor, patch = 0, 1, 0
+        date = datetime.date(2022, 3, 14)
+        versions = []
+        for _ in range(self.releases):
+            versions.append((f"{major}.{minor}.{patch}", date.isoformat()))
+            date = max(date - datetime.timedelta(days=rng.randint(0, 2)), FIRST_DATE)
+
+            bump = rng.random()
+            if bump < 0.05:
+                major, minor, patch = major + 1, 0, 0
+            elif bump < 0.4:
+                minor, patch = minor + 1, 0
+            else:
+                patch += 1
+
+        # Versions were generated oldest first, dates newest first
+        dates = [date for _, date in versions]
+        return [
+            (version, dates[index])
+            for index, (version, _) in enumerate(reversed(versions))
+        ]
+
+    def __release(self, rng, heading, error) -> Iterator[Tuple[str, str]]:
+        """Yields (line, purpose) pairs of a release, injecting the optional error"""
+
+        yield heading, "error" if error in HEADING_ERRORS else "heading"
+
+        change_types = rng.sample(TypesOfChange, rng.randint(1, len(TypesOfChange)))
+        for index, change_type in enumerate(
+            sorted(change_types, key=TypesOfChange.index)
+        ):
+            if index:
+                yield "\n", "blank"
+
+            yield f"### {change_type.title()}\n", "category"
+            for _ in range(rng.randint(1, self.max_entries)):
+                yield f"- {self.__message(rng)}\n", "entry"
+
+        if error in ("heading-depth", "block-quote", "numbered-list", "sub-list"):
+            yield {
+                "heading-depth": "#### Details\n",
+                "block-quote": f"- > {self.__message(rng)}\n",
+                "numbered-list": f"- 1. {self.__message(rng)}\n",
+                "sub-list": f"- * {self.__message(rng)}\n",
+            }[error], "error"
+
+        if error == "change-type":
+            yield "### Improved\n", "error"
+            yield f"- {self.__message(rng)}\n", "entry"
+
+    def __heading(self, version: str, date: str, error: str) -> str:
+        if error == "semver":
+            return f"## [{version.rsplit('.', 1)[0]}] - {date}\n"
+        if error == "release-metadata":
+            return f"## [{version}]\n"
+        if error == "release-date":
+            return f"## [{version}] - {date.replace('-', '/')}\n"
+        return f"## [{version}] - {date}\n"
+
+    def lines(self) -> Iterator[str]:
+        """Yields all lines of the changelog"""
+
+        rng = random.Random(self.seed)
+        self.errors = []
+        self.line_count = 0
+
+        releases = self.__release_versions(rng)
+        self.versions = [version for version, _ in releases]
+
+        injected = dict(
+            (index, rng.choice(ERROR_KINDS))
+            for index in rng.sample(range(self.releases), self.error_count)
+        )
+
+        def emit(line):
+            self.line_count += 1
+            return line
+
+        yield emit("# Changelog\n")
+        yield emit(
+            "All notable changes to this project will be documented in this file.\n"
+        )
+
+        if self.unreleased:
+            yield emit("\n")
+            for line, _ in self.__release(rng, "## [Unreleased]\n", None):
+                yield emit(line)
+
+        for index, (version, date) in enumerate(releases):
+            kind, rule = injected.get(index, (None, None))
+            yield emit("\n")
+
+            heading = self.__heading(version, date, kind)
+            for line, purpose in self.__release(rng, heading, kind):
+                yield emit(line)
+
+                if purpose == "error":
+                    self.errors.append(
+                        InjectedError(line=self.line_count, rule=rule, version=version)
+                    )
+
+    def write(self, file_path: str) -> int:
+        """Writes the changelog to the file, returns the number of lines"""
+
+        with open(file_path, "w", encoding="UTF-8") as file_handle:
+            file_handle.writelines(self.lines())
+
+        return self.line_count
+
+    def __str__(self) -> str:
+        return "".join(self.lines())
@@ -0,0 +1,78 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark: GitHub release workflow against an offline API stand-in
+
+Usage: python -m benchmarks.github_load [--releases 1000] [--latency 0.005]
+"""
+
+import argparse
+import statistics
+import time
+
+from changelogmanager.changelog import Changelog
+from changelogmanager.github import GitHub
+from changelogmanager.profiling import TRACER
+
+from benchmarks.fake_github import FakeGitHubServer
+
+
+def percentile(durations, fraction):
+    """Returns the requested percentile of the sorted durations"""
+    return durations[min(int(len(durations) * fraction), len(durations) - 1)]
+
+
+def main():
+    """Entrypoint"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--releases", type=int, default=1000)
+    parser.add_argument("--drafts", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    TRACER.enabled = True
+
+    changelog = Changelog(
+        file_path="CHANGELOG.md",
+        changelog={"unreleased": {"version": "unreleased", "added": ["Feature"]}},
+    )
+
+    with FakeGitHubServer(
+        latency=args.latency, error_rate=args.error_rate, seed=args.seed
+    ) as server:
+        for index in range(args.releases):
+            server.create_release(
+                {"tag_name": f"v0.0.{index}", "draft": index < args.drafts}
+            )
+
+        github = GitHub(repository="owner/project", token="secret", api_url=server.url)
+
+        start = time.perf_counter()
+        github.delete_draft_releases()
+        github.create_release(changelog=changelog, draft=True)
+        duration = time.perf_counter() - start
+
+    latencies = sorted(request["duration"] for request in TRACER.requests())
+    print(f"{'requests':<12} {dict(server.requests)}")
+    print(f"{'total':<12} {duration * 1000:10.2f} ms")
+    print(f"{'mean':<12} {statistics.mean(latencies) * 1000:10.2f} ms")
+    for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+        print(f"{name:<12} {percentile(latencies, fraction) * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark: memory held by many parsed changelogs
+
+Usage: python -m benchmarks.memory [--components 100] [--releases 200]
+"""
+
+import argparse
+import os
+import tempfile
+import tracemalloc
+
+import keepachangelog
+
+from changelogmanager.changelog_reader import ChangelogReader
+
+from benchmarks.generator import ChangelogGenerator
+
+
+def retained(load, file_paths) -> int:
+    """Returns the memory (in bytes) held by the loaded changelogs"""
+
+    tracemalloc.start()
+    changelogs = [load(file_path) for file_path in file_paths]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del changelogs
+    return size
+
+
+def main():
+    """Entrypoint"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--components", type=int, default=100)
+    parser.add_argument("--releases", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_paths = []
+        for index in range(args.components):
+            file_path = os.path.join(directory, f"CHANGELOG-{index}.md")
+            ChangelogGenerator(releases=args.releases, seed=index).write(file_path)
+            file_paths.append(file_path)
+
+        results = {
+            "keepachangelog.to_dict": retained(
+                lambda file_path: keepachangelog.to_dict(
+                    file_path, show_unreleased=True
+                ),
+                file_paths,
+            ),
+            "ChangelogReader.read": retained(
+                lambda file_path: ChangelogReader(file_path=file_path).read(),
+                file_paths,
+            ),
+        }
+
+    baseline = results["keepachangelog.to_dict"]
+    for name, size in results.items():
+        print(
+            f"{name:<24} {size / 1024 / 1024:10.2f} MiB"
+            f" {(size / baseline - 1) * 100:+8.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
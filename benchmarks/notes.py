@@ -0,0 +1,83 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark: rendering release notes for many releases
+
+Usage: python -m benchmarks.notes [--releases 10000]
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+
+from changelogmanager.change_types import CATEGORIES
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.templates import TEMPLATES, render_release_notes
+
+from benchmarks.generator import ChangelogGenerator
+
+
+def concatenated_release_notes(release):
+    """Release notes built through string concatenation (previous implementation)"""
+
+    body = "## What's changed" + os.linesep + os.linesep
+    body += os.linesep.join(
+        [
+            f"### :{category.emoji}: {category.title}"
+            + os.linesep
+            + os.linesep.join([f"* {message}" for message in release[identifier]])
+            for identifier, category in CATEGORIES.items()
+            if identifier in release
+        ]
+    )
+    return body
+
+
+def main():
+    """Entrypoint"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--releases", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "CHANGELOG.md")
+        ChangelogGenerator(releases=args.releases, seed=args.seed).write(file_path)
+
+        releases = list(ChangelogReader(file_path=file_path).read().values())
+
+    def run(render):
+        return min(
+            timeit.repeat(
+                lambda: [render(release) for release in releases],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+
+    results = {"concatenation": run(concatenated_release_notes)}
+    for template in TEMPLATES:
+        results[f"template:{template}"] = run(
+            lambda release, name=template: render_release_notes(release, name)
+        )
+
+    for name, duration in results.items():
+        print(f"{name:<20} {duration * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
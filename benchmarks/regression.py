@@ -0,0 +1,214 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark: performance regression gate
+
+Times the parse, validate, render and export paths on fixed-size (generated)
+changelogs and compares the throughput against a stored JSON baseline.
+
+Usage: python -m benchmarks.regression [--baseline FILE] [--update] [--threshold 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import timeit
+
+from typing import Callable, Mapping, Sequence
+
+import keepachangelog
+
+from changelogmanager.changelog import Changelog
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.exporters import EXPORTERS
+from changelogmanager.templates import render_release_notes
+
+from benchmarks.generator import ChangelogGenerator
+
+BASELINE_FORMAT = 1
+SIZES = {"small": 200, "large": 5000}
+
+
+def scenarios(file_path: str) -> Mapping[str, Callable[[], None]]:
+    """Returns the operations to time on the provided changelog"""
+
+    reader = ChangelogReader(file_path=file_path)
+    changelog = Changelog(
+        file_path=file_path, changelog=reader.read(), sources=reader.sources()
+    )
+    changelog.add("fixed", "Modified the Unreleased section")
+    releases = list(changelog.get().values())
+    output = os.path.join(os.path.dirname(file_path), "output.md")
+
+    def render():
+        with open(output, "w", encoding="UTF-8") as file_handle:
+            changelog.render(file_handle)
+
+    return {
+        "parse": lambda: keepachangelog.to_dict(file_path, show_unreleased=True),
+        "validate": reader.validate_layout,
+        "read": reader.read,
+        "render": render,
+        "export": lambda: EXPORTERS["json"](releases),
+        "notes": lambda: [render_release_notes(release) for release in releases],
+    }
+
+
+def measure(repeat: int) -> Mapping[str, Mapping]:
+    """Returns the throughput (lines per second) of every scenario and size"""
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size, releases in SIZES.items():
+            file_path = os.path.join(directory, f"CHANGELOG-{size}.md")
+            lines = ChangelogGenerator(releases=releases, seed=0).write(file_path)
+
+            for name, operation in scenarios(file_path).items():
+                duration = min(timeit.repeat(operation, number=1, repeat=repeat))
+                results[f"{name}/{size}"] = {
+                    "lines": lines,
+                    "seconds": duration,
+                    "lines_per_second": lines / duration,
+                }
+
+    return results
+
+
+def compare(
+    baseline: Mapping[str, Mapping], results: Mapping[str, Mapping], threshold: float
+) -> Sequence[str]:
+    """Returns the scenarios of which the throughput regressed beyond the threshold"""
+
+    return [
+        name
+        for name, result in results.items()
+        if name in baseline
+        and result["lines_per_second"]
+        < baseline[name]["lines_per_second"] * (1 - threshold)
+    ]
+
+
+def report(
+    baseline: Mapping[str, Mapping],
+    results: Mapping[str, Mapping],
+    regressions: Sequence[str],
+) -> str:
+    """Returns a table comparing the results against the baseline"""
+
+    rows = [
+        f"{'scenario':<16} {'baseline':>14} {'current':>14} {'change':>8}",
+        f"{'':<16} {'(lines/s)':>14} {'(lines/s)':>14}",
+    ]
+    for name, result in results.items():
+        current = result["lines_per_second"]
+        if name not in baseline:
+            rows.append(f"{name:<16} {'-':>14} {current:14,.0f} {'new':>8}")
+            continue
+
+        previous = baseline[name]["lines_per_second"]
+        change = f"{(current / previous - 1) * 100:+.1f}%"
+        marker = "  REGRESSION" if name in regressions else ""
+        rows.append(
+            f"{name:<16} {previous:14,.0f} {current:14,.0f} {change:>8}{marker}"
+        )
+
+    return "\n".join(rows)
+
+
+def load_baseline(file_path: str) -> Mapping[str, Mapping]:
+    """Reads the stored baseline, empty when not available"""
+
+    try:
+        with open(file_path, "r", encoding="UTF-8") as file_handle:
+            baseline = json.load(file_handle)
+    except FileNotFoundError:
+        return {}
+
+    if baseline.get("format") != BASELINE_FORMAT:
+        return {}
+
+    return baseline["results"]
+
+
+def store(file_path: str, results: Mapping[str, Mapping]) -> None:
+    """Stores the results (as baseline)"""
+
+    os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+    with open(file_path, "w", encoding="UTF-8") as file_handle:
+        json.dump(
+            {
+                "format": BASELINE_FORMAT,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            },
+            file_handle,
+            indent=4,
+        )
+
+
+def main():
+    """Entrypoint"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--baseline", default="build/benchmark-baseline.json")
+    parser.add_argument("--output", default=None, help="Store the current results")
+    parser.add_argument(
+        "--update", action="store_true", help="Replace the baseline with the results"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed throughput decrease (fraction) before failing",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    if not baseline and not args.update:
+        print(
+            f"No baseline found in {args.baseline}, nothing compared "
+            "(create the baseline using --update)"
+        )
+        return 2
+
+    results = measure(args.repeat)
+    regressions = compare(baseline, results, args.threshold)
+
+    print(report(baseline, results, regressions))
+
+    if args.output:
+        store(args.output, results)
+
+    if args.update:
+        store(args.baseline, results)
+        print(f"\nBaseline stored in {args.baseline}")
+        return 0
+
+    if regressions:
+        print(
+            f"\n{len(regressions)} scenario(s) regressed by more than "
+            f"{args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark: rendering a changelog to Markdown
+
+Usage: python -m benchmarks.render [--releases 10000]
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+
+import keepachangelog
+
+from changelogmanager.changelog import Changelog
+from changelogmanager.changelog_reader import ChangelogReader
+
+from benchmarks.generator import ChangelogGenerator
+
+
+def main():
+    """Entrypoint"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--releases", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "CHANGELOG.md")
+        ChangelogGenerator(releases=args.releases, seed=args.seed).write(file_path)
+
+        reader = ChangelogReader(file_path=file_path)
+        content = keepachangelog.to_dict(file_path, show_unreleased=True)
+        changelog = Changelog(
+            file_path=file_path, changelog=content, sources=reader.sources()
+        )
+        changelog.add("fixed", "Modified the Unreleased section")
+
+        def legacy():
+            with open(file_path, "w", encoding="UTF-8") as file_handle:
+                file_handle.write(keepachangelog.from_dict(changelog.get()))
+
+        results = {
+            "keepachangelog.from_dict": min(
+                timeit.repeat(legacy, number=1, repeat=args.repeat)
+            ),
+            "Changelog.write_to_file": min(
+                timeit.repeat(changelog.write_to_file, number=1, repeat=args.repeat)
+            ),
+        }
+
+    for name, duration in results.items():
+        print(f"{name:<28} {duration * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
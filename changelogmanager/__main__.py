@@ -18,12 +18,13 @@ import sys
 from click import ClickException
 import llvm_diagnostics as logging
 from changelogmanager import cli
+from changelogmanager.diagnostics import StructuredFormatter, close_formatter
 
 
 def main():
     """Entrypoint"""
     try:
-        cli.main(None, None, None, None, None)
+        cli.main.main(standalone_mode=False)
     # Exit gracefully in case an Warning or Information exception was raised
     except (logging.Info, logging.Warning) as exc_info:
         exc_info.report()
@@ -36,9 +37,16 @@ def main():
 
     # Failure
     except ClickException as exc_info:
-        exc_info.show()
+        if isinstance(logging.formatters.get_config(), StructuredFormatter):
+            logging.Error(message=exc_info.format_message()).report()
+        else:
+            exc_info.show()
         sys.exit(1)
 
+    # Complete structured (JSON/SARIF) diagnostics output
+    finally:
+        close_formatter()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,157 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Multi-component Aggregation"""
+
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Mapping, Optional, Sequence
+
+from changelogmanager.change_types import UNRELEASED_ENTRY
+from changelogmanager.changelog import Changelog, render_release
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.fragments import Fragment, collect_fragments
+
+
+@dataclass
+class ComponentChangelog:
+    """Changelog of a single component, including the time it took to load"""
+
+    name: str
+    changelog: Changelog
+    duration: float
+
+
+def load_component(component: Mapping) -> ComponentChangelog:
+    """Reads (and validates) the changelog of a single component"""
+
+    start = time.perf_counter()
+
+    file_path = component["changelog"]
+    reader = ChangelogReader(file_path=file_path)
+    changelog = Changelog(
+        file_path=file_path, changelog=reader.read(), sources=reader.sources
+    )
+
+    return ComponentChangelog(
+        name=component["name"],
+        changelog=changelog,
+        duration=time.perf_counter() - start,
+    )
+
+
+def load_components(
+    components: Sequence[Mapping], jobs: Optional[int] = None
+) -> List[ComponentChangelog]:
+    """Reads the changelogs of all components concurrently (in configuration order)"""
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(load_component, components))
+
+
+@dataclass
+class ComponentRelease:
+    """Release of a single component, prepared in memory"""
+
+    name: str
+    changelog: Changelog
+    previous_version: Optional[str]
+    version: Optional[str]
+    fragments: List[Fragment]
+
+
+def prepare_release(component: Mapping) -> ComponentRelease:
+    """Releases the [Unreleased] section (and fragments) of a component in memory"""
+
+    changelog = load_component(component).changelog
+    fragments = (
+        collect_fragments(component["fragments"]) if component.get("fragments") else []
+    )
+
+    for fragment in fragments:
+        changelog.add(change_type=fragment.change_type, message=fragment.message)
+
+    if UNRELEASED_ENTRY not in changelog.get():
+        return ComponentRelease(
+            name=component["name"],
+            changelog=changelog,
+            previous_version=None,
+            version=None,
+            fragments=fragments,
+        )
+
+    previous_version = str(changelog.version()) if len(changelog.get()) > 1 else None
+    changelog.release()
+
+    return ComponentRelease(
+        name=component["name"],
+        changelog=changelog,
+        previous_version=previous_version,
+        version=str(changelog.version()),
+        fragments=fragments,
+    )
+
+
+def prepare_releases(
+    components: Sequence[Mapping], jobs: Optional[int] = None
+) -> List[ComponentRelease]:
+    """Prepares the releases of all components concurrently"""
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(prepare_release, components))
+
+
+def aggregate(
+    components: Sequence[ComponentChangelog], releases: int = 0
+) -> Mapping[str, List[Mapping]]:
+    """Combines the [Unreleased] section and the latest releases of all components"""
+
+    report = {}
+    for component in components:
+        selection = []
+        released = 0
+        for version, release in component.changelog.get().items():
+            if version != UNRELEASED_ENTRY:
+                if released >= releases:
+                    break
+                released += 1
+
+            selection.append(release)
+
+        report[component.name] = selection
+
+    return report
+
+
+def aggregate_to_markdown(report: Mapping[str, List[Mapping]]) -> str:
+    """Renders the aggregated report in Markdown format"""
+
+    content = [f"# Changes across {len(report)} components\n"]
+    for name, selection in report.items():
+        content.append(f"\n## {name}\n")
+
+        if not selection:
+            content.append("\nNo changes\n")
+
+        for release in selection:
+            # Nest the releases one level deeper, below the component heading
+            content.append(
+                render_release(release)
+                .replace("\n### ", "\n#### ")
+                .replace("\n## ", "\n### ")
+            )
+
+    return "".join(content)
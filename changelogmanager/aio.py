@@ -0,0 +1,276 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous API"""
+
+import asyncio
+import json
+import os
+import time
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Mapping, Optional, Sequence
+
+from changelogmanager.change_types import DEFAULT_CHANGELOG_FILE
+from changelogmanager.changelog import Changelog
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.github import (
+    GITHUB_API_URL,
+    GitHub,
+    HttpMethods,
+    ReleasePages,
+    release_data,
+    request_failure,
+    request_headers,
+    request_url,
+)
+from changelogmanager.profiling import TRACER
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+# Failures of the HTTP client, none without `aiohttp` (e.g. a provided session)
+CLIENT_ERRORS = (aiohttp.ClientError,) if aiohttp else ()
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_REQUESTS = 8
+
+
+def read_changelog(file_path: str) -> Changelog:
+    """Reads (and validates) the changelog, keeping the original Markdown"""
+
+    reader = ChangelogReader(file_path=file_path)
+    return Changelog(
+        file_path=file_path, changelog=reader.read(), sources=reader.sources
+    )
+
+
+class AsyncChangelogs:
+    """Reads and writes changelogs without blocking the event loop
+
+    File I/O (and validation) is offloaded to a bounded executor, writes to
+    the same changelog are serialized.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        executor: Optional[Executor] = None,
+    ):
+        """Constructor"""
+
+        self.__owns_executor = executor is None
+        self.__executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="changelogmanager"
+        )
+        self.__locks = {}
+
+    def get_executor(self) -> Executor:
+        """Returns the executor used for blocking operations"""
+        return self.__executor
+
+    async def run(self, function: Callable, *args, **kwargs):
+        """Runs the (blocking) function in the executor"""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.__executor, partial(function, *args, **kwargs)
+        )
+
+    def __lock(self, file_path: str) -> asyncio.Lock:
+        return self.__locks.setdefault(os.path.abspath(file_path), asyncio.Lock())
+
+    async def read(self, file_path: str = DEFAULT_CHANGELOG_FILE) -> Changelog:
+        """Reads (and validates) the changelog"""
+
+        async with self.__lock(file_path):
+            return await self.run(read_changelog, file_path)
+
+    async def write(self, changelog: Changelog) -> None:
+        """Stores the changelog"""
+
+        async with self.__lock(changelog.get_file_path()):
+            await self.run(changelog.write_to_file)
+
+    async def write_to_json(self, changelog: Changelog, file: str, **kwargs) -> None:
+        """Exports the changelog, see `Changelog.write_to_json()`"""
+        await self.run(changelog.write_to_json, file, **kwargs)
+
+    async def close(self) -> None:
+        """Shuts down the executor, if created by this instance"""
+
+        # Waiting for the pending operations must not block the event loop
+        if self.__owns_executor:
+            await asyncio.to_thread(self.__executor.shutdown)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+class AsyncGitHub:  # pylint: disable=R0902
+    """GitHub client for use within an event loop
+
+    Uses `aiohttp` when installed (`pip install keepachangelog-manager[aio]`),
+    otherwise the requests are performed by `GitHub` within the executor.
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        repository: str,
+        token: str,
+        api_url: str = GITHUB_API_URL,
+        *,
+        changelogs: Optional[AsyncChangelogs] = None,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+        session=None,
+    ):
+        """Constructor"""
+
+        self.__repository = repository
+        self.__api_url = api_url
+        self.__headers = request_headers(token)
+        self.__owns_changelogs = changelogs is None
+        self.__changelogs = changelogs or AsyncChangelogs()
+        self.__max_requests = max_requests
+        self.__semaphore = None
+        self.__session = session
+        self.__owns_session = session is None
+        self.__github = (
+            None
+            if aiohttp or session
+            else GitHub(repository=repository, token=token, api_url=api_url)
+        )
+
+    def __limit(self) -> asyncio.Semaphore:
+        """Limits the number of concurrent requests (created within the event loop)"""
+
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.__max_requests)
+
+        return self.__semaphore
+
+    async def __request(
+        self, api: str, method: HttpMethods, data: Optional[Mapping] = None
+    ):
+        url = request_url(self.__api_url, self.__repository, api)
+
+        if self.__session is None:
+            self.__session = aiohttp.ClientSession()
+
+        start = time.perf_counter()
+        try:
+            async with self.__limit(), self.__session.request(
+                method.value,
+                url,
+                headers=self.__headers,
+                params=(
+                    {key: str(value) for key, value in data.items()}
+                    if method == HttpMethods.GET and data
+                    else None
+                ),
+                json=data if method != HttpMethods.GET else None,
+                raise_for_status=True,
+            ) as response:
+                body = await response.read()
+        except CLIENT_ERRORS as client_error:
+            raise request_failure(url=url, method=method, data=data) from client_error
+        finally:
+            TRACER.record_request(
+                method=method.value, url=url, duration=time.perf_counter() - start
+            )
+
+        return json.loads(body) if body else None
+
+    async def __blocking(self, function: Callable, *args, **kwargs):
+        """Performs the request(s) using the blocking client, within the executor"""
+
+        async with self.__limit():
+            return await self.__changelogs.run(function, *args, **kwargs)
+
+    async def get_releases(self) -> Sequence:
+        """Retrieves available releases"""
+
+        if self.__github:
+            return await self.__blocking(self.__github.get_releases)
+
+        pages = ReleasePages()
+        while not pages.complete:
+            pages.add(
+                await self.__request(
+                    method=HttpMethods.GET, api="releases", data=pages.query()
+                )
+            )
+
+        return pages.releases
+
+    async def delete_release(self, release: Mapping) -> None:
+        """Deletes a release"""
+
+        if self.__github:
+            await self.__blocking(self.__github.delete_release, release)
+            return
+
+        await self.__request(
+            method=HttpMethods.DELETE, api=f"releases/{release.get('id')}"
+        )
+
+    async def delete_draft_releases(self) -> None:
+        """Deletes all releases marked as 'Draft', concurrently"""
+
+        releases = await self.get_releases()
+
+        await asyncio.gather(
+            *[self.delete_release(rel) for rel in releases if rel.get("draft")]
+        )
+
+    async def create_release(
+        self, changelog: Changelog, draft: bool, version: Optional[str] = None
+    ) -> None:
+        """Creates a new release on GitHub"""
+
+        if self.__github:
+            await self.__blocking(
+                self.__github.create_release,
+                changelog=changelog,
+                draft=draft,
+                version=version,
+            )
+            return
+
+        await self.__request(
+            method=HttpMethods.POST,
+            api="releases",
+            data=release_data(changelog=changelog, draft=draft, version=version),
+        )
+
+    async def close(self) -> None:
+        """Closes the HTTP session and executor, if created by this instance"""
+
+        if self.__session is not None and self.__owns_session:
+            await self.__session.close()
+
+        if self.__owns_changelogs:
+            await self.__changelogs.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -55,3 +55,9 @@ CATEGORIES = {
 }
 
 TypesOfChange = list(CATEGORIES.keys())
+
+# Version core to bump, per type of change
+BUMPS = {identifier: category.bump for identifier, category in CATEGORIES.items()}
+
+# Type of change per (title-cased) heading
+CHANGE_HEADINGS = {identifier.title(): identifier for identifier in TypesOfChange}
@@ -14,37 +14,134 @@
 
 """Changelog"""
 
-import json
+import io
 import os
+import shutil
+import tempfile
 
 from collections import OrderedDict
 from datetime import datetime
-from typing import Mapping, Optional
+from typing import (
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
 
-import keepachangelog
 import llvm_diagnostics as logging
 from semantic_version import Version
 
 from changelogmanager.change_types import (
-    CATEGORIES,
+    BUMPS,
     DEFAULT_CHANGELOG_FILE,
     UNRELEASED_ENTRY,
     VersionCore,
 )
+from changelogmanager.exporters import EXPORTERS
+from changelogmanager.profiling import TRACER
+from changelogmanager.versions import get_version
 
 
 INITIAL_VERSION = Version("0.0.1")
 
+CHANGELOG_HEADER = """# Changelog
+All notable changes to this project will be documented in this file.
+
+The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.1.0/),
+and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
+"""
+
+
+def render_release(release: Mapping) -> str:
+    """Renders a single release according to the Keep a Changelog standard"""
+
+    metadata = release["metadata"]
+    content = [f"\n## [{metadata['version'].capitalize()}]"]
+
+    if metadata.get("release_date"):
+        content.append(f" - {metadata['release_date']}")
+
+    uncategorized = release.get("uncategorized", [])
+    content.extend(f"\n* {entry}" for entry in uncategorized)
+    if uncategorized:
+        content.append("\n")
+
+    for category, entries in release.items():
+        if category in ["metadata", "uncategorized"]:
+            continue
+
+        content.append(f"\n### {category.capitalize()}")
+        content.extend(f"\n- {entry}" for entry in entries)
+        content.append("\n")
+
+    return "".join(content)
+
+
+def determine_bump(change_types: Iterable[str]) -> VersionCore:
+    """Returns the version core to bump for the provided types of change"""
+
+    bump_type = VersionCore.PATCH
+    for change_type in change_types:
+        bump = BUMPS.get(change_type, VersionCore.PATCH)
+        if bump.value > bump_type.value:
+            bump_type = bump
+
+    return bump_type
+
+
+def bump_version(version: Version, bump_type: VersionCore) -> Version:
+    """Bumps the provided version core"""
+
+    if bump_type == VersionCore.MAJOR:
+        return version.next_major()
+
+    if bump_type == VersionCore.MINOR:
+        return version.next_minor()
+
+    return version.next_patch()
+
+
+def suggest_future_versions(
+    batch: Iterable[Tuple[Optional[Version], Iterable[str]]],
+) -> List[Version]:
+    """Suggests future versions for many (last version, types of change) pairs"""
+
+    return [
+        (
+            bump_version(version, determine_bump(change_types))
+            if version
+            else INITIAL_VERSION
+        )
+        for version, change_types in batch
+    ]
+
 
 class Changelog:
     """Changelog"""
 
     def __init__(
-        self, file_path: str = DEFAULT_CHANGELOG_FILE, changelog: Optional[str] = None
+        self,
+        file_path: str = DEFAULT_CHANGELOG_FILE,
+        changelog: Optional[str] = None,
+        sources: Optional[
+            Union[Mapping[str, str], Callable[[], Mapping[str, str]]]
+        ] = None,
     ):
-        """Constructor"""
+        """Constructor
+
+        The optional `sources` map versions onto their original Markdown, which is
+        written as-is for releases that were not modified. When provided as a
+        callable, the sources are only collected once the changelog is written.
+        """
         self.__changelog_file_path = file_path
         self.__changelog = changelog if changelog else {}
+        self.__sources = sources if sources else {}
+        self.__modified = set()
 
     def get_file_path(self):
         """Returns the path to the changelog file"""
@@ -52,6 +149,10 @@ class Changelog:
 
     def add(self, change_type: str, message: str) -> None:
         """Adds a new message to the specified change identifier in the Changelog"""
+        self.add_entries([(change_type, message)])
+
+    def add_entries(self, entries: Iterable[Tuple[str, str]]) -> int:
+        """Adds all (change identifier, message) pairs, returns the number of entries"""
 
         changelog = OrderedDict(self.__changelog.copy())
 
@@ -64,13 +165,20 @@ class Changelog:
                 }
             },
         )
-        changelog[UNRELEASED_ENTRY].setdefault(change_type, [])
-        changelog[UNRELEASED_ENTRY][change_type].append(message)
+
+        count = 0
+        unreleased = changelog[UNRELEASED_ENTRY]
+        for change_type, message in entries:
+            unreleased.setdefault(change_type, []).append(message)
+            count += 1
 
         # Ensure that the new entry is on top
         changelog.move_to_end(UNRELEASED_ENTRY, last=False)
 
         self.__changelog = changelog.copy()
+        self.__modified.add(UNRELEASED_ENTRY)
+
+        return count
 
     def exists(self):
         """Verifies if the Changelog file exists"""
@@ -105,7 +213,7 @@ class Changelog:
 
         try:
             _version = (
-                Version(override_version)
+                get_version(override_version)
                 if override_version
                 else self.suggest_future_version()
             )
@@ -146,6 +254,7 @@ class Changelog:
             return changelog
 
         self.__changelog = update_unreleased_version(self.__changelog, _version)
+        self.__modified.add(UNRELEASED_ENTRY)
 
     def version(self) -> Version:
         """Returns the last released version"""
@@ -161,9 +270,9 @@ class Changelog:
                     message="Only an Unreleased version is available",
                 )
 
-            return Version(list(self.__changelog)[1])
+            return get_version(list(self.__changelog)[1])
 
-        return Version(list(self.__changelog)[0])
+        return get_version(list(self.__changelog)[0])
 
     def previous_version(self) -> Version:
         """Returns the previously released version"""
@@ -180,9 +289,9 @@ class Changelog:
                     message="No previous versions available",
                 )
 
-            return Version(list(self.__changelog)[2])
+            return get_version(list(self.__changelog)[2])
 
-        return Version(list(self.__changelog)[1])
+        return get_version(list(self.__changelog)[1])
 
     def suggest_future_version(self) -> Version:
         """Suggests a future version based on the [Unreleased]-changes"""
@@ -190,36 +299,74 @@ class Changelog:
         if self.__has_only_unreleased_version():
             return INITIAL_VERSION
 
-        def determine_version(unreleased: Mapping, prev_version: Version):
-            bump_type = VersionCore.PATCH
-            for identifier, category in CATEGORIES.items():
-                if identifier in unreleased and category.bump.value > bump_type.value:
-                    bump_type = category.bump
+        bump_type = determine_bump(self.get(UNRELEASED_ENTRY).keys())
 
-            if bump_type == VersionCore.MAJOR:
-                return prev_version.next_major()
+        return bump_version(self.version(), bump_type)
 
-            if bump_type == VersionCore.MINOR:
-                return prev_version.next_minor()
+    def write_to_json(
+        self, file: str, version: Optional[str] = None, export_format: str = "json"
+    ) -> None:
+        """Stores the Changelog file in JSON (or any other export) format"""
 
-            return prev_version.next_patch()
+        releases = [self.get(version=version)] if version else list(self.get().values())
 
-        return determine_version(self.get(UNRELEASED_ENTRY), self.version())
+        with TRACER.phase("export"):
+            output = EXPORTERS[export_format](releases)
 
-    def write_to_json(self, file: str, version: Optional[str] = None) -> None:
-        """Stores the Changelog file in JSON format"""
+        with TRACER.phase("write"), open(file, "wb") as file_handle:
+            file_handle.write(output)
 
-        content = self.get(version=version)
-        json_data = [value for _, value in content.items()]
-
-        with open(file, "w", encoding="UTF-8") as file_handle:
-            file_handle.write(json.dumps(json_data, indent=4))
+        TRACER.count("bytes_written", len(output))
 
     def write_to_file(self) -> None:
         """Updates CHANGELOG.md based on the Keep a Changelog standard"""
 
-        with open(self.__changelog_file_path, "w", encoding="UTF-8") as file_handle:
-            file_handle.write(self.__str__())
+        # Collect the original Markdown before the file gets truncated
+        sources = self.__get_sources()
+
+        with TRACER.phase("render"), open(
+            self.__changelog_file_path, "w", encoding="UTF-8"
+        ) as file_handle:
+            self.__render(file_handle, sources)
+
+        TRACER.count("bytes_written", os.path.getsize(self.__changelog_file_path))
+
+    def render(self, file_handle: TextIO) -> None:
+        """Streams the Keep a Changelog representation to the file handle"""
+        self.__render(file_handle, self.__get_sources())
+
+    def __get_sources(self) -> Mapping[str, str]:
+        """Returns the original Markdown of the releases that were not modified"""
+
+        if callable(self.__sources):
+            self.__sources = dict(self.__sources())
+
+        return {
+            version: source
+            for version, source in self.__sources.items()
+            if version not in self.__modified
+        }
+
+    def __render(self, file_handle: TextIO, sources: Mapping[str, str]) -> None:
+        file_handle.write(CHANGELOG_HEADER)
+
+        for version, release in self.__changelog.items():
+            if version in sources:
+                file_handle.write("\n")
+                file_handle.write(sources[version])
+            else:
+                file_handle.write(render_release(release))
+
+        urls = [
+            f"[{release['metadata']['version'].capitalize()}]: {release['metadata']['url']}"
+            for release in self.__changelog.values()
+            if release["metadata"].get("url")
+        ]
+
+        if urls:
+            file_handle.write("\n")
+            file_handle.write("\n".join(urls))
+            file_handle.write("\n")
 
     def __has_only_unreleased_version(self):
         """Returns True when the changelog only contains an Unreleased version"""
@@ -228,4 +375,37 @@ class Changelog:
     def __str__(self):
         """String representation"""
 
-        return keepachangelog.from_dict(self.__changelog)
+        output = io.StringIO()
+        self.render(output)
+        return output.getvalue()
+
+
+def write_to_files(changelogs: Sequence[Changelog]) -> None:
+    """Updates multiple changelog files as a batch
+
+    All files are rendered to temporary files first; the originals are only
+    replaced once every changelog has been rendered successfully.
+    """
+
+    temporary_files = []
+    try:
+        for changelog in changelogs:
+            file_path = changelog.get_file_path()
+            directory = os.path.dirname(os.path.abspath(file_path))
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="UTF-8", dir=directory, suffix=".tmp", delete=False
+            ) as file_handle:
+                temporary_files.append(file_handle.name)
+                changelog.render(file_handle)
+
+            # Temporary files are owner-only, retain the mode of the replaced file
+            if os.path.exists(file_path):
+                shutil.copymode(file_path, file_handle.name)
+
+        for changelog, temporary_file in zip(changelogs, temporary_files):
+            os.replace(temporary_file, changelog.get_file_path())
+    except BaseException:
+        for temporary_file in temporary_files:
+            if os.path.exists(temporary_file):
+                os.remove(temporary_file)
+        raise
@@ -15,20 +15,174 @@
 """Changelog Reader"""
 
 import datetime
+import hashlib
+import mmap
 import os
 import re
+import sys
 
-from typing import Mapping
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 import keepachangelog
 import llvm_diagnostics as logging
-from semantic_version import Version
 
 from changelogmanager.change_types import (
+    CHANGE_HEADINGS,
     DEFAULT_CHANGELOG_FILE,
-    TypesOfChange,
     UNRELEASED_ENTRY,
 )
+from changelogmanager.profiling import TRACER
+from changelogmanager.validation_cache import ValidationCache
+from changelogmanager.versions import parse_version, precedence_key
+
+RELEASE_HEADING = re.compile(r"^## \[([^\]]*)\]")
+RELEASE_DATE = re.compile(rb"\] - ([0-9]{4}-[0-9]{2}-[0-9]{2})")
+LINK_REFERENCE = re.compile(r"^\[(.*)\]: (.*)$")
+
+
+@dataclass
+class Section:
+    """Consecutive lines belonging to a single release (or the preamble)"""
+
+    start: int
+    lines: Sequence[str]
+
+    @property
+    def end(self) -> int:
+        """Returns the line number of the last line in the section"""
+        return self.start + max(len(self.lines), 1) - 1
+
+    def version(self) -> Optional[str]:
+        """Returns the (lower-cased) version of the release heading, if any"""
+        match = RELEASE_HEADING.match(self.lines[0]) if self.lines else None
+        return match.group(1).lower() if match else None
+
+    def digest(self) -> str:
+        """Returns a hash of the section contents, independent of its position"""
+        return hashlib.sha256("".join(self.lines).encode("UTF-8")).hexdigest()
+
+    def overlaps(self, first: int, last: int) -> bool:
+        """Verifies if the provided line range touches this section"""
+        return self.start <= last and first <= self.end
+
+
+def split_sections(lines: Sequence[str]) -> List[Section]:
+    """Splits the lines of a changelog on its release (`## `) headings"""
+
+    sections = []
+    start = 0
+    for index, line in enumerate(lines):
+        if index > start and line.startswith("## "):
+            sections.append(Section(start=start + 1, lines=lines[start:index]))
+            start = index
+
+    if start < len(lines):
+        sections.append(Section(start=start + 1, lines=lines[start:]))
+
+    return sections
+
+
+def intern_release(release: Mapping) -> Dict:
+    """Shares the category names and release date of a parsed release
+
+    Parsing creates new strings for every release, holding many (component)
+    changelogs in memory benefits from using a single instance of each.
+    """
+
+    metadata = release.get("metadata")
+    if metadata and isinstance(metadata.get("release_date"), str):
+        metadata["release_date"] = sys.intern(metadata["release_date"])
+
+    # Replacing the keys requires a new mapping, retaining the order of categories
+    return {sys.intern(category): entries for category, entries in release.items()}
+
+
+@dataclass
+class ReleaseOffset:
+    """Location of a release section within the changelog file"""
+
+    version: str
+    start: int
+    end: int
+    line: int
+    end_line: int
+
+
+def _release_offsets(mapped: mmap.mmap) -> List[ReleaseOffset]:
+    """Locates the release headings in the (memory mapped) file by byte search"""
+
+    starts = [0] if mapped[:4] == b"## [" else []
+
+    position = mapped.find(b"\n## [")
+    while position != -1:
+        starts.append(position + 1)
+        position = mapped.find(b"\n## [", position + 1)
+
+    offsets = []
+    line = 1
+    for index, start in enumerate(starts):
+        end = starts[index + 1] if index + 1 < len(starts) else len(mapped)
+        previous = starts[index - 1] if index else 0
+        line += mapped[previous:start].count(b"\n")
+        lines = mapped[start:end].count(b"\n")
+
+        # A final line without line ending still counts as a line
+        if end == len(mapped) and not mapped[end - 1 : end] == b"\n":
+            lines += 1
+
+        closing = mapped.find(b"]", start, end)
+        if closing == -1:
+            continue
+
+        offsets.append(
+            ReleaseOffset(
+                version=mapped[start + 4 : closing].decode("UTF-8").lower(),
+                start=start,
+                end=end,
+                line=line,
+                end_line=line + max(lines, 1) - 1,
+            )
+        )
+
+    return offsets
+
+
+def select_releases(
+    offsets: Sequence[ReleaseOffset],
+    version: Optional[str] = None,
+    latest: Optional[int] = None,
+    since: Optional[str] = None,
+) -> List[ReleaseOffset]:
+    """Selects a specific version, the latest releases and/or the releases after `since`"""
+
+    if since and str(since).lower() == UNRELEASED_ENTRY:
+        raise logging.Warning(
+            message="Unable to select the releases after the Unreleased version"
+        )
+
+    versions = [offset.version for offset in offsets]
+    for requested in (version, since):
+        if requested and str(requested).lower() not in versions:
+            raise logging.Warning(
+                message=f"Version '{requested}' not available in the Changelog"
+            )
+
+    if version:
+        return [offsets[versions.index(str(version).lower())]]
+
+    released = [offset for offset in offsets if offset.version != UNRELEASED_ENTRY]
+
+    if since:
+        released = released[
+            : [offset.version for offset in released].index(str(since).lower())
+        ]
+
+    if latest is not None:
+        released = released[:latest]
+
+    return released
 
 
 class ChangelogReader:
@@ -37,10 +191,12 @@ class ChangelogReader:
     def __init__(
         self,
         file_path: str = DEFAULT_CHANGELOG_FILE,
+        cache: Optional[ValidationCache] = None,
     ):
         """Constructor"""
 
         self.__file_path = file_path
+        self.__cache = cache
 
     def read(self):
         """Reads the CHANGELOG.md file and checks for validity"""
@@ -48,7 +204,10 @@ class ChangelogReader:
         if not os.path.isfile(self.__file_path):
             return {}
 
-        errors = self.validate_layout()
+        TRACER.count("bytes_read", os.path.getsize(self.__file_path))
+
+        with TRACER.phase("validate_layout"):
+            errors = self.validate_layout()
 
         if errors:
             raise logging.Error(
@@ -56,19 +215,82 @@ class ChangelogReader:
                 message=f"{errors} errors detected in the layout",
             )
 
-        changelog = keepachangelog.to_dict(self.__file_path, show_unreleased=True)
+        with TRACER.phase("parse"):
+            changelog = keepachangelog.to_dict(self.__file_path, show_unreleased=True)
+            for version, release in list(changelog.items()):
+                changelog[version] = intern_release(release)
+
+        with TRACER.phase("validate_contents"):
+            self.validate_contents(changelog)
+
+        return changelog
+
+    def release_offsets(self) -> List[ReleaseOffset]:
+        """Returns the location of each release, without decoding the file"""
+
+        if not os.path.isfile(self.__file_path) or not os.path.getsize(
+            self.__file_path
+        ):
+            return []
+
+        with open(self.__file_path, "rb") as file_handle, mmap.mmap(
+            file_handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            return _release_offsets(mapped)
+
+    def read_releases(self, offsets: Sequence[ReleaseOffset]) -> Mapping:
+        """Reads (and validates) only the releases at the provided offsets"""
+
+        changelog = OrderedDict()
+        if not offsets:
+            return changelog
+
+        with open(self.__file_path, "rb") as file_handle, mmap.mmap(
+            file_handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            for offset in offsets:
+                lines = (
+                    mapped[offset.start : offset.end]
+                    .decode("UTF-8")
+                    .splitlines(keepends=True)
+                )
+                TRACER.count("bytes_read", offset.end - offset.start)
+
+                errors = self.validate_sections([Section(offset.line, lines)])
+
+                if errors:
+                    raise logging.Error(
+                        file_path=self.__file_path,
+                        message=f"{errors} errors detected in the layout",
+                    )
+
+                release = keepachangelog.to_dict(lines, show_unreleased=True)
+                changelog[offset.version] = intern_release(release[offset.version])
 
         self.validate_contents(changelog)
 
         return changelog
 
+    def read_release(self, version: str) -> Mapping:
+        """Reads (and validates) a single release, without parsing the whole file"""
+
+        offsets = [
+            offset for offset in self.release_offsets() if offset.version == version
+        ]
+
+        if not offsets:
+            raise logging.Warning(
+                file_path=self.__file_path,
+                message=f"Version '{version}' not available in the Changelog",
+            )
+
+        return self.read_releases(offsets[:1])[version]
+
     def __validate_change_heading(self, line_number, line, depth, content):
         """Check if acceptable keywords are present"""
 
-        accepted_types = [change_type.title() for change_type in TypesOfChange]
-
-        if content not in accepted_types:
-            friendly_types = ", ".join(accepted_types)
+        if content not in CHANGE_HEADINGS:
+            friendly_types = ", ".join(CHANGE_HEADINGS)
 
             yield logging.Error(
                 file_path=self.__file_path,
@@ -101,7 +323,7 @@ class ChangelogReader:
 
         # Verify that the version is valid SemVer syntax
         try:
-            version = Version(version)
+            parse_version(version)
         except ValueError:
             yield logging.Error(
                 file_path=self.__file_path,
@@ -235,22 +457,148 @@ class ChangelogReader:
                     message=rule["error"],
                 )
 
+    def __validate_lines(self, first_line_number, lines):
+        for line_number, line in enumerate(lines, start=first_line_number):
+            yield from self.__validate_heading(line_number, line)
+            yield from self.__validate_entry(line_number, line)
+
+    def sections(self) -> List[Section]:
+        """Returns the changelog file split up into release sections"""
+
+        with open(self.__file_path, "r", encoding="UTF-8") as file_handle:
+            return split_sections(file_handle.readlines())
+
+    def sources(self) -> Mapping[str, str]:
+        """Returns the original Markdown of each release, keyed by version
+
+        Releases which cannot be reproduced as-is (duplicated versions, sections
+        containing link references) are omitted.
+        """
+
+        if not os.path.isfile(self.__file_path):
+            return {}
+
+        sources = {}
+        ambiguous = set()
+        for section in self.sections():
+            version = section.version()
+            if not version:
+                continue
+
+            lines = list(section.lines)
+            while lines and not lines[-1].strip():
+                lines.pop()
+
+            if version in sources or any(
+                LINK_REFERENCE.match(line.strip(" \n")) for line in lines
+            ):
+                ambiguous.add(version)
+
+            sources[version] = "".join(lines)
+            if not sources[version].endswith("\n"):
+                sources[version] += "\n"
+
+        return {
+            version: source
+            for version, source in sources.items()
+            if version not in ambiguous
+        }
+
     def validate_layout(self):
         """Validates the changelog file according to KeepAChangelog conventions"""
 
-        line_number = 1
+        if self.__cache is not None:
+            with open(self.__file_path, "r", encoding="UTF-8") as file_handle:
+                lines = file_handle.readlines()
+
+            TRACER.count("lines_read", len(lines))
+            return self.validate_sections(split_sections(lines))
+
+        line_number = 0
         errors = []
         with open(self.__file_path, "r", encoding="UTF-8") as file_handle:
-            for line in file_handle:
-                errors.extend(list(self.__validate_heading(line_number, line)))
-                errors.extend(list(self.__validate_entry(line_number, line)))
-                line_number += 1
+            for line_number, line in enumerate(file_handle, start=1):
+                errors.extend(self.__validate_heading(line_number, line))
+                errors.extend(self.__validate_entry(line_number, line))
+
+        TRACER.count("lines_read", line_number)
 
         for error in errors:
             error.report()
 
         return len(errors)
 
+    def validate_sections(self, sections: Sequence[Section]):
+        """Validates the layout of the provided sections only
+
+        Sections known to be valid by the validation cache (if any) are skipped.
+        """
+
+        errors = []
+        for section in sections:
+            if self.__cache is None:
+                errors.extend(self.__validate_lines(section.start, section.lines))
+                continue
+
+            digest = section.digest()
+            if digest in self.__cache:
+                TRACER.count("sections_cached")
+                continue
+
+            section_errors = list(self.__validate_lines(section.start, section.lines))
+            if not section_errors:
+                self.__cache.add(digest)
+
+            errors.extend(section_errors)
+
+        if self.__cache is not None:
+            self.__cache.save()
+
+        for error in errors:
+            error.report()
+
+        return len(errors)
+
+    def validate_changes(self, line_ranges: Sequence[Tuple[int, int]]):
+        """Validates the sections touched by the provided (inclusive) line ranges
+
+        Only the layout of the affected release sections is verified, the
+        ordering of versions is checked against the adjacent releases.
+        """
+
+        if not os.path.isfile(self.__file_path):
+            return
+
+        sections = self.sections()
+        affected = [
+            index
+            for index, section in enumerate(sections)
+            if any(section.overlaps(first, last) for first, last in line_ranges)
+        ]
+
+        errors = self.validate_sections([sections[index] for index in affected])
+
+        if errors:
+            raise logging.Error(
+                file_path=self.__file_path,
+                message=f"{errors} errors detected in the layout",
+            )
+
+        self.validate_adjacent_versions(sections, affected)
+
+    def validate_adjacent_versions(
+        self, sections: Sequence[Section], indices: Sequence[int]
+    ):
+        """Validates the ordering of the indexed sections against their neighbours"""
+
+        for index in indices:
+            versions = OrderedDict(
+                (section.version(), None)
+                for section in sections[max(index - 1, 0) : index + 2]
+                if section.version()
+            )
+            self.validate_contents(versions)
+
     def validate_contents(self, changelog: Mapping):
         """Validates the contents of the CHANGELOG.md file"""
 
@@ -269,11 +617,91 @@ class ChangelogReader:
                     )
                     message.report()
             else:
-                new_version = Version(version)
-                if prev_version and prev_version <= new_version:
-                    message.message = f"Versions are incorrectly ordered: {prev_version} -> {new_version}"  # pylint: disable=C0301
+                if prev_version and precedence_key(prev_version) <= precedence_key(
+                    version
+                ):
+                    message.message = f"Versions are incorrectly ordered: {prev_version} -> {version}"  # pylint: disable=C0301
                     message.report()
 
-                prev_version = new_version
+                prev_version = version
 
             is_first_entry = False
+
+    def lint_history(self) -> int:
+        """Lints the release history in a single pass, returns the number of warnings"""
+
+        if not os.path.isfile(self.__file_path) or not os.path.getsize(
+            self.__file_path
+        ):
+            return 0
+
+        warnings = 0
+        released = {}
+        newer_version = None
+        newer_date = None
+
+        def report(mapped: mmap.mmap, offset: ReleaseOffset, message: str):
+            heading_end = mapped.find(b"\n", offset.start, offset.end)
+            logging.Warning(
+                file_path=self.__file_path,
+                line=mapped[
+                    offset.start : heading_end if heading_end != -1 else offset.end
+                ].decode("UTF-8"),
+                line_number=logging.Range(start=offset.line),
+                message=message,
+            ).report()
+
+        with open(self.__file_path, "rb") as file_handle, mmap.mmap(
+            file_handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            for offset in _release_offsets(mapped):
+                if offset.version in released:
+                    report(
+                        mapped,
+                        offset,
+                        f"Duplicate version '{offset.version}', already listed on line {released[offset.version]}",  # pylint: disable=C0301
+                    )
+                    warnings += 1
+                    continue
+
+                released[offset.version] = offset.line
+
+                try:
+                    version = parse_version(offset.version)
+                except ValueError:
+                    continue
+
+                match = RELEASE_DATE.match(
+                    mapped, offset.start + 4 + len(offset.version)
+                )
+                release_date = match.group(1).decode("UTF-8") if match else None
+
+                if newer_version and precedence_key(newer_version) > precedence_key(
+                    offset.version
+                ):
+                    newer = parse_version(newer_version)
+                    if not version.prerelease and not newer.prerelease:
+                        expected = version.patch + 1 if newer[:2] == version[:2] else 0
+                        if newer.patch > expected:
+                            report(
+                                mapped,
+                                offset,
+                                f"Gap in patch versions: {offset.version} -> {newer_version}",
+                            )
+                            warnings += 1
+
+                    if release_date and newer_date and release_date > newer_date:
+                        report(
+                            mapped,
+                            offset,
+                            "Release dates are not in order of versions: "
+                            f"{offset.version} ({release_date}) -> "
+                            f"{newer_version} ({newer_date})",
+                        )
+                        warnings += 1
+
+                if not version.prerelease or not newer_version:
+                    newer_version = offset.version
+                    newer_date = release_date
+
+        return warnings
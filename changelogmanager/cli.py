@@ -14,18 +14,69 @@
 
 """ Changelog Manager """
 
-from typing import Mapping, Optional
+import cProfile
+import itertools
+import json
+import os
+
+from typing import Any, Callable, List, Mapping, Optional, Sequence, TextIO
 
 import inquirer
 
-from click import group, option, pass_context, Choice, File
+from click import (
+    echo,
+    group,
+    option,
+    pass_context,
+    Choice,
+    File,
+    IntRange,
+    UsageError,
+)
 import llvm_diagnostics as logging
 
-from changelogmanager.change_types import TypesOfChange
-from changelogmanager.changelog import Changelog
-from changelogmanager.changelog_reader import ChangelogReader
-from changelogmanager.config import get_component_from_config
-from changelogmanager.github import GitHub
+from changelogmanager.aggregate import (
+    aggregate,
+    aggregate_to_markdown,
+    load_components,
+    prepare_releases,
+)
+from changelogmanager.change_types import UNRELEASED_ENTRY, TypesOfChange
+from changelogmanager.changelog import (
+    Changelog,
+    suggest_future_versions,
+    write_to_files,
+)
+from changelogmanager.changelog_reader import (
+    ChangelogReader,
+    ReleaseOffset,
+    select_releases,
+)
+from changelogmanager.config import (
+    get_component_from_config,
+    get_components_from_config,
+)
+from changelogmanager.exporters import EXPORTERS
+from changelogmanager.diagnostics import FORMATTERS
+from changelogmanager.fragments import (
+    collect_fragments,
+    remove_fragments,
+    write_fragment,
+)
+from changelogmanager.git import (
+    changed_line_ranges,
+    classify_commits,
+    commit_messages,
+)
+from changelogmanager.github import GITHUB_API_URL, GitHub
+from changelogmanager.index import ChangelogIndex
+from changelogmanager.pipeline import STATE_SUFFIX, release_pipeline
+from changelogmanager.profiling import TRACE_ENVIRONMENT_VARIABLE, TRACER
+from changelogmanager.server import QUERIES, ChangelogServer, query
+from changelogmanager.templates import TEMPLATES, render_release_notes
+from changelogmanager.validation_cache import ValidationCache
+from changelogmanager.versions import get_version
+from changelogmanager.watch import ChangelogWatcher
 
 VERSION_REFERENCES = ["previous", "current", "future"]
 
@@ -36,46 +87,155 @@ VERSION_REFERENCES = ["previous", "current", "future"]
 @option(
     "-f",
     "--error-format",
-    type=Choice(["llvm", "github"]),
+    type=Choice(list(FORMATTERS)),
     default="llvm",
     help="Type of formatting to apply to error messages",
 )
 @option("--input-file", default="CHANGELOG.md", help="Changelog file to work with")
+@option(
+    "--use-index/--no-index",
+    default=False,
+    help="Maintain a sidecar index (<changelog>.idx) to read only the required releases",
+)
+@option(
+    "--fragment-dir",
+    default=None,
+    help="Directory to store new entries in (as separate files), until released",
+)
+@option(
+    "--validation-cache",
+    default=None,
+    envvar="CHANGELOGMANAGER_VALIDATION_CACHE",
+    help="File to remember valid release sections in, only re-validating modified ones",
+)
+@option(
+    "--profile",
+    default=None,
+    envvar=TRACE_ENVIRONMENT_VARIABLE,
+    help="Stores the time spent per phase (in JSON format) in the provided file",
+)
+@option("--profile-dump", default=None, help="Stores cProfile statistics in the file")
 @pass_context
-def main(
+def main(  # pylint: disable=R0913,R0917
     ctx: Mapping,
     config: Optional[File],
     component: str,
     error_format: bool,
     input_file: str,
+    use_index: bool,
+    fragment_dir: Optional[str],
+    validation_cache: Optional[str],
+    profile: Optional[str],
+    profile_dump: Optional[str],
 ) -> int:
     """(Keep a) Changelog Manager"""
 
     # Pass changelog configuration to sub-commands
     ctx.ensure_object(dict)
 
-    logging.config(
-        logging.formatters.Llvm()
-        if error_format == "llvm"
-        else logging.formatters.GitHub()
+    if profile:
+        TRACER.enabled = True
+        ctx.call_on_close(lambda: TRACER.write(profile))
+
+    if profile_dump:
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def dump_statistics():
+            profiler.disable()
+            profiler.dump_stats(profile_dump)
+
+        ctx.call_on_close(dump_statistics)
+
+    logging.config(FORMATTERS[error_format]())
+
+    ctx.obj["config"] = config
+    ctx.obj["component"] = component
+    ctx.obj["input_file"] = input_file
+    ctx.obj["fragment_dir"] = fragment_dir
+    ctx.obj["use_index"] = use_index
+    ctx.obj["validation_cache"] = (
+        ValidationCache(validation_cache) if validation_cache else None
     )
 
-    if config:
-        component = get_component_from_config(config=config, component=component)
-        changelog = ChangelogReader(file_path=component.get("changelog")).read()
+
+def get_file_path(ctx: Mapping) -> str:
+    """Resolves the path to the changelog of the selected component"""
+
+    if "file_path" not in ctx.obj:
+        if ctx.obj["config"]:
+            component = get_component_from_config(
+                config=ctx.obj["config"], component=ctx.obj["component"]
+            )
+            ctx.obj["file_path"] = component.get("changelog")
+        else:
+            ctx.obj["file_path"] = ctx.obj["input_file"]
+
+    return ctx.obj["file_path"]
+
+
+def get_components(ctx: Mapping) -> Sequence[Mapping]:
+    """Resolves all components, or only the selected changelog without configuration"""
+
+    if ctx.obj["config"]:
+        return get_components_from_config(ctx.obj["config"])
+
+    return [{"name": ctx.obj["component"], "changelog": get_file_path(ctx)}]
+
+
+def get_fragment_dir(ctx: Mapping) -> Optional[str]:
+    """Resolves the fragment directory, if any, of the selected component"""
+
+    if not ctx.obj["fragment_dir"] and ctx.obj["config"]:
+        component = get_component_from_config(
+            config=ctx.obj["config"], component=ctx.obj["component"]
+        )
+        return component.get("fragments")
+
+    return ctx.obj["fragment_dir"]
+
+
+def get_reader(ctx: Mapping, file_path: str) -> ChangelogReader:
+    """Returns a reader for the changelog, using the validation cache if requested"""
+    return ChangelogReader(file_path=file_path, cache=ctx.obj["validation_cache"])
+
+
+def load_changelog(ctx: Mapping) -> Changelog:
+    """Reads (and validates) the selected changelog upon first use"""
+
+    if "changelog" not in ctx.obj:
+        file_path = get_file_path(ctx)
+        reader = get_reader(ctx, file_path)
         ctx.obj["changelog"] = Changelog(
-            file_path=component.get("changelog"), changelog=changelog
+            file_path=file_path, changelog=reader.read(), sources=reader.sources
         )
-    else:
-        changelog = ChangelogReader(file_path=input_file).read()
-        ctx.obj["changelog"] = Changelog(file_path=input_file, changelog=changelog)
+
+    return ctx.obj["changelog"]
+
+
+def load_releases(
+    ctx: Mapping, select: Callable[[Sequence[ReleaseOffset]], Sequence[ReleaseOffset]]
+) -> Changelog:
+    """Reads only the selected releases, using the sidecar index when enabled"""
+
+    file_path = get_file_path(ctx)
+    reader = get_reader(ctx, file_path)
+    offsets = (
+        ChangelogIndex(file_path=file_path).offsets()
+        if ctx.obj["use_index"]
+        else reader.release_offsets()
+    )
+
+    return Changelog(
+        file_path=file_path, changelog=reader.read_releases(select(offsets))
+    )
 
 
 @main.command()
 @pass_context
 def create(ctx: Mapping) -> None:
     """Command to create a new (empty) CHANGELOG.md"""
-    changelog = ctx.obj["changelog"]
+    changelog = load_changelog(ctx)
 
     if changelog.exists():
         raise logging.Info(
@@ -93,11 +253,28 @@ def create(ctx: Mapping) -> None:
     default="current",
     help="Which version to retrieve",
 )
+@option(
+    "--batch",
+    type=File("r"),
+    default=None,
+    help="JSON file ('-' for stdin) with many last versions and types of change",
+)
 @pass_context
-def version(ctx: Mapping, reference: str) -> None:
+def version(ctx: Mapping, reference: str, batch: Optional[TextIO]) -> None:
     """Command to retrieve versions from a CHANGELOG.md"""
 
-    changelog = ctx.obj["changelog"]
+    if batch:
+        if reference != "future":
+            raise UsageError("--batch can only be used with '--reference future'")
+
+        print(json.dumps(suggest_batch_versions(json.load(batch)), indent=4))
+        return
+
+    if ctx.obj["use_index"]:
+        # At most the [Unreleased], current and previous releases are required
+        changelog = load_releases(ctx, select=lambda offsets: offsets[:3])
+    else:
+        changelog = load_changelog(ctx)
 
     if reference == "current":
         print(changelog.version())
@@ -109,11 +286,190 @@ def version(ctx: Mapping, reference: str) -> None:
         print(changelog.suggest_future_version())
 
 
+def batch_change_types(changes: Any) -> List[str]:
+    """Returns the types of change of a batch entry, raises ValueError when unknown"""
+
+    if isinstance(changes, Mapping):
+        # [Unreleased] section, including its metadata
+        changes = [change_type for change_type in changes if change_type != "metadata"]
+    elif not isinstance(changes, list):
+        raise ValueError("Changes MUST be an [Unreleased] section or a list")
+
+    for change_type in changes:
+        if change_type not in TypesOfChange:
+            raise ValueError(f"Unknown type of change: {change_type}")
+
+    return changes
+
+
+def suggest_batch_versions(batch: Sequence[Mapping]) -> Sequence[Mapping]:
+    """Suggests the future version for each entry of the batch
+
+    Each entry contains the last released `version` (or `null`) and the `changes`,
+    being either an [Unreleased] section or a list of types of change.
+    """
+
+    try:
+        versions = suggest_future_versions(
+            (
+                get_version(entry["version"]) if entry.get("version") else None,
+                batch_change_types(entry.get("changes", [])),
+            )
+            for entry in batch
+        )
+    except (AttributeError, KeyError, TypeError, ValueError) as exc_info:
+        raise logging.Error(message="Incorrect batch format") from exc_info
+
+    return [
+        {"name": entry.get("name"), "version": str(future_version)}
+        for entry, future_version in zip(batch, versions)
+    ]
+
+
 @main.command()
+@option(
+    "--since",
+    default=None,
+    help="Only validate the changes made since the provided Git revision",
+)
+@option(
+    "--extended",
+    is_flag=True,
+    default=False,
+    help="Lint the release history for duplicate versions, patch gaps and release dates",
+)
 @pass_context
-def validate(_: Mapping) -> None:
+def validate(ctx: Mapping, since: Optional[str], extended: bool) -> None:
     """Command to validate the CHANGELOG.md for inconsistencies"""
 
+    file_path = get_file_path(ctx)
+
+    if not since:
+        load_changelog(ctx)
+    else:
+        line_ranges = changed_line_ranges(file_path=file_path, since=since)
+        get_reader(ctx, file_path).validate_changes(line_ranges)
+
+    if extended:
+        get_reader(ctx, file_path).lint_history()
+
+
+@main.command()
+@option(
+    "--interval",
+    type=float,
+    default=0.5,
+    help="Interval (in seconds) between checks for modifications",
+)
+@pass_context
+def watch(ctx: Mapping, interval: float) -> None:
+    """Command to re-validate the CHANGELOG.md whenever it is modified"""
+
+    try:
+        ChangelogWatcher(file_path=get_file_path(ctx)).watch(interval=interval)
+    except KeyboardInterrupt:
+        pass
+
+
+@main.command()
+@option("--socket", "socket_path", required=True, help="Unix socket to listen on")
+@pass_context
+def serve(ctx: Mapping, socket_path: str) -> None:
+    """Serves queries on the changelog(s) kept in memory"""
+
+    components = {
+        component["name"]: component["changelog"] for component in get_components(ctx)
+    }
+
+    with ChangelogServer(socket_path=socket_path, components=components) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+@main.command(name="query")
+@option("--socket", "socket_path", required=True, help="Unix socket of the server")
+@option(
+    "-q",
+    "--query",
+    "query_type",
+    type=Choice(QUERIES),
+    default="current",
+    help="Information to retrieve",
+)
+@option("--version", "version_", default=None, help="Version to retrieve")
+@pass_context
+def query_server(
+    ctx: Mapping, socket_path: str, query_type: str, version_: Optional[str]
+) -> None:
+    """Queries a running `serve` process"""
+
+    result = query(
+        socket_path=socket_path,
+        request={
+            "component": ctx.obj["component"],
+            "query": query_type,
+            "version": version_,
+        },
+    )
+
+    print(result if isinstance(result, str) else json.dumps(result, indent=4))
+
+
+@main.command(name="aggregate")
+@option(
+    "--releases",
+    type=int,
+    default=0,
+    help="Number of latest releases to include per component",
+)
+@option(
+    "--format",
+    "output_format",
+    type=Choice(["markdown", "json"]),
+    default="markdown",
+    help="Format of the report",
+)
+@option("--file-name", default=None, help="Filename of the report, defaults to stdout")
+@option(
+    "-j",
+    "--jobs",
+    type=int,
+    default=None,
+    help="Number of changelogs to load in parallel",
+)
+@pass_context
+def aggregate_components(  # pylint: disable=R0913
+    ctx: Mapping,
+    releases: int,
+    output_format: str,
+    file_name: Optional[str],
+    jobs: Optional[int],
+) -> None:
+    """Combines the changes of all components into a single report"""
+
+    components = load_components(get_components(ctx), jobs=jobs)
+
+    for component in components:
+        echo(
+            f"{component.name}: loaded in {component.duration * 1000:.1f} ms", err=True
+        )
+
+    report = aggregate(components, releases=releases)
+    output = (
+        aggregate_to_markdown(report)
+        if output_format == "markdown"
+        else json.dumps(report, indent=4)
+    )
+
+    if not file_name:
+        print(output)
+        return
+
+    with open(file_name, "w", encoding="UTF-8") as file_handle:
+        file_handle.write(output)
+
 
 @main.command()
 @option(
@@ -121,14 +477,78 @@ def validate(_: Mapping) -> None:
     default=None,
     help="Version to release, defaults to auto-resolve",
 )
+@option(
+    "--all-components",
+    is_flag=True,
+    default=False,
+    help="Release all components listed in the configuration file at once",
+)
+@option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Only show the versions to release (with --all-components)",
+)
+@option(
+    "-j",
+    "--jobs",
+    type=int,
+    default=None,
+    help="Number of components to prepare in parallel",
+)
 @pass_context
-def release(ctx: Mapping, override_version: Optional[str]) -> None:
+def release(  # pylint: disable=R0913
+    ctx: Mapping,
+    override_version: Optional[str],
+    all_components: bool,
+    dry_run: bool,
+    jobs: Optional[int],
+) -> None:
     """Release changes added to [Unreleased] block"""
 
-    changelog = ctx.obj["changelog"]
+    if all_components:
+        if override_version:
+            raise UsageError("--override-version can not be used with --all-components")
+
+        release_all_components(ctx, dry_run=dry_run, jobs=jobs)
+        return
+
+    changelog = load_changelog(ctx)
+
+    fragment_dir = get_fragment_dir(ctx)
+    fragments = collect_fragments(fragment_dir) if fragment_dir else []
+
+    for fragment in fragments:
+        changelog.add(change_type=fragment.change_type, message=fragment.message)
+
     changelog.release(override_version)
 
     changelog.write_to_file()
+    remove_fragments(fragments)
+
+
+def release_all_components(ctx: Mapping, dry_run: bool, jobs: Optional[int]) -> None:
+    """Validates and releases all components, only writing once all succeeded"""
+
+    releases = prepare_releases(get_components(ctx), jobs=jobs)
+
+    for component in releases:
+        if not component.version:
+            print(f"{component.name}: nothing to release")
+        else:
+            print(
+                f"{component.name}: {component.previous_version or '-'}"
+                f" -> {component.version}"
+            )
+
+    if dry_run:
+        return
+
+    updated = [component for component in releases if component.version]
+    write_to_files([component.changelog for component in updated])
+
+    for component in updated:
+        remove_fragments(component.fragments)
 
 
 @main.command()
@@ -137,11 +557,78 @@ def release(ctx: Mapping, override_version: Optional[str]) -> None:
     default="CHANGELOG.json",
     help="Filename of the JSON output",
 )
+@option("--version", "version_", default=None, help="Only export the specified version")
+@option(
+    "--latest",
+    type=IntRange(min=0),
+    default=None,
+    help="Only export the latest N releases",
+)
+@option("--since", default=None, help="Only export the releases after this version")
+@option(
+    "--format",
+    "export_format",
+    type=Choice(list(EXPORTERS)),
+    default="json",
+    help="Output format",
+)
 @pass_context
-def to_json(ctx: Mapping, file_name: str) -> None:
+def to_json(  # pylint: disable=R0913,R0917
+    ctx: Mapping,
+    file_name: str,
+    version_: Optional[str],
+    latest: Optional[int],
+    since: Optional[str],
+    export_format: str,
+) -> None:
     """Exports the contents of the CHANGELOG.md to a JSON file"""
-    changelog = ctx.obj["changelog"]
-    changelog.write_to_json(file=file_name)
+
+    if version_ is not None and (latest is not None or since is not None):
+        raise UsageError("'--version' cannot be combined with '--latest' or '--since'")
+
+    if version_ is None and latest is None and since is None:
+        changelog = load_changelog(ctx)
+    else:
+        # Only the selected releases are read from the file
+        changelog = load_releases(
+            ctx,
+            select=lambda offsets: select_releases(
+                offsets, version=version_, latest=latest, since=since
+            ),
+        )
+
+    changelog.write_to_json(file=file_name, export_format=export_format)
+
+
+@main.command()
+@option(
+    "--version",
+    "version_",
+    default="unreleased",
+    help="Version to generate the release notes for",
+)
+@option(
+    "--template",
+    type=Choice(list(TEMPLATES)),
+    default="github",
+    help="Layout of the release notes",
+)
+@option("--file-name", default=None, help="Filename of the output, defaults to stdout")
+@pass_context
+def notes(ctx: Mapping, version_: str, template: str, file_name: Optional[str]) -> None:
+    """Generates the release notes of a single version"""
+
+    changelog = load_releases(
+        ctx, select=lambda offsets: select_releases(offsets, version=version_)
+    )
+    output = render_release_notes(changelog.get(version_.lower()), template=template)
+
+    if not file_name:
+        print(output)
+        return
+
+    with open(file_name, "w", encoding="UTF-8") as file_handle:
+        file_handle.write(output)
 
 
 @main.command()
@@ -182,13 +669,69 @@ def add(ctx: Mapping, change_type: str, message: str) -> None:
     changelog_entry.setdefault("message", message)
     changelog_entry.setdefault("confirm", "Yes")
 
-    changelog = ctx.obj["changelog"]
+    fragment_dir = get_fragment_dir(ctx)
+    if fragment_dir:
+        if changelog_entry["confirm"] == "Yes":
+            write_fragment(
+                directory=fragment_dir,
+                change_type=changelog_entry["change_type"],
+                message=changelog_entry["message"],
+            )
+        return
+
+    changelog = load_changelog(ctx)
     changelog.add(change_type=changelog_entry["change_type"], message=changelog_entry["message"])
 
     if changelog_entry["confirm"] == "Yes":
         changelog.write_to_file()
 
 
+@main.command(name="from-git")
+@option(
+    "--repository",
+    default=".",
+    help="Path to the Git repository to read the history from",
+)
+@option(
+    "--since",
+    default=None,
+    help="Only add the commits made since this revision (e.g. the last release tag)",
+)
+@pass_context
+def from_git(ctx: Mapping, repository: str, since: Optional[str]) -> None:
+    """Adds all Conventional Commits from the Git history to the [Unreleased] section"""
+
+    entries = classify_commits(commit_messages(repository=repository, since=since))
+
+    # Only the matching entries are kept, the history itself is streamed
+    first = next(entries, None)
+    if first is None:
+        raise logging.Info(message="No Conventional Commits found in the Git history")
+
+    changelog = load_changelog(ctx)
+
+    # Commits imported before are already present in the [Unreleased] section
+    known = {
+        (change_type, message)
+        for change_type, messages in changelog.get().get(UNRELEASED_ENTRY, {}).items()
+        if change_type != "metadata"
+        for message in messages
+    }
+
+    def new_entries():
+        for entry in itertools.chain([first], entries):
+            if entry not in known:
+                known.add(entry)
+                yield entry
+
+    if not changelog.add_entries(new_entries()):
+        raise logging.Info(
+            message="All Conventional Commits are already in the [Unreleased] section"
+        )
+
+    changelog.write_to_file()
+
+
 @main.command()
 @option("-r", "--repository", required=True, help="Repository")
 @option("-t", "--github-token", required=True, help="Github Token")
@@ -197,12 +740,109 @@ def add(ctx: Mapping, change_type: str, message: str) -> None:
     default=True,
     help="Update/Create the GitHub Release in either Draft or Release state",
 )
+@option(
+    "--api-url",
+    default=GITHUB_API_URL,
+    envvar="GITHUB_API_URL",
+    help="Base URL of the GitHub API",
+)
 @pass_context
-def github_release(ctx, repository: str, github_token: str, draft: bool) -> None:
+def github_release(
+    ctx, repository: str, github_token: str, draft: bool, api_url: str
+) -> None:
     """Deletes all releases marked as 'Draft' on GitHub and creates a new 'Draft'-release"""
 
-    changelog = ctx.obj["changelog"]
+    changelog = load_changelog(ctx)
 
-    github = GitHub(repository=repository, token=github_token)
+    github = GitHub(repository=repository, token=github_token, api_url=api_url)
     github.delete_draft_releases()
     github.create_release(changelog=changelog, draft=draft)
+
+
+@main.command(name="release-pipeline")
+@option(
+    "--override-version",
+    default=None,
+    help="Version to release, defaults to auto-resolve",
+)
+@option(
+    "--state-file",
+    default=None,
+    help="File recording the completed stages (default: <changelog>.release-state)",
+)
+@option(
+    "--restart",
+    is_flag=True,
+    default=False,
+    help="Discard the state of a previous (failed) run",
+)
+@option(
+    "--git-repository",
+    default=None,
+    help="Commit and tag the release in this Git repository",
+)
+@option("-r", "--repository", default=None, help="Publish the release on GitHub")
+@option("-t", "--github-token", default=None, help="Github Token")
+@option(
+    "--draft/--release",
+    default=True,
+    help="Create the GitHub Release in either Draft or Release state",
+)
+@option(
+    "--api-url",
+    default=GITHUB_API_URL,
+    envvar="GITHUB_API_URL",
+    help="Base URL of the GitHub API",
+)
+@option("--export", default=None, help="Export the released changelog to this file")
+@option(
+    "--export-format",
+    type=Choice(list(EXPORTERS)),
+    default="json",
+    help="Format of the export",
+)
+@pass_context
+def release_pipeline_(  # pylint: disable=R0913,R0917
+    ctx: Mapping,
+    override_version: Optional[str],
+    state_file: Optional[str],
+    restart: bool,
+    git_repository: Optional[str],
+    repository: Optional[str],
+    github_token: Optional[str],
+    draft: bool,
+    api_url: str,
+    export: Optional[str],
+    export_format: str,
+) -> None:
+    """Releases, tags and publishes in resumable stages"""
+
+    if repository and not github_token:
+        raise UsageError("--github-token is required to publish on GitHub")
+
+    file_path = get_file_path(ctx)
+    state_file = state_file or file_path + STATE_SUFFIX
+
+    if restart and os.path.exists(state_file):
+        os.remove(state_file)
+
+    pipeline = release_pipeline(
+        file_path=file_path,
+        state_file=state_file,
+        override_version=override_version,
+        fragment_dir=get_fragment_dir(ctx),
+        repository=git_repository,
+        github=(
+            GitHub(repository=repository, token=github_token, api_url=api_url)
+            if repository
+            else None
+        ),
+        draft=draft,
+        export=export,
+        export_format=export_format,
+    )
+
+    if pipeline.completed():
+        print(f"Resuming, completed: {', '.join(pipeline.completed())}")
+
+    pipeline.run(on_complete=lambda stage: print(f"{stage}: done"))
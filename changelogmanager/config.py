@@ -14,11 +14,22 @@
 
 """Configuration Management"""
 
+import hashlib
+import os
+import threading
+
 from typing import Mapping, Sequence
 
 import yaml
 import llvm_diagnostics as logging
 
+from changelogmanager.profiling import TRACER
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
 
 def validate_configuration(file_path: str, config: Mapping):
     """Verifies if the provided configuration file is accoriding to expectations"""
@@ -34,20 +45,73 @@ def validate_configuration(file_path: str, config: Mapping):
             )
 
 
-def get_component_from_config(config: str, component: str):
-    """Retrieves a specific component from the configuration file"""
-    with open(config, "r", encoding="UTF-8") as file_handle:
-        configuration = yaml.safe_load(file_handle)
+class ProjectConfig:
+    """Validated project configuration with lookup of components by name"""
+
+    __cache = {}
+    __lock = threading.Lock()
+
+    def __init__(self, file_path: str, configuration: Mapping):
+        """Constructor"""
+
+        validate_configuration(file_path, configuration)
+
+        self.__file_path = file_path
+        self.__components = configuration["project"]["components"]
+        self.__by_name = {}
+        for component in self.__components:
+            # The first definition wins, in line with a linear search
+            self.__by_name.setdefault(component["name"], component)
+
+    @classmethod
+    def load(cls, file_path: str) -> "ProjectConfig":
+        """Loads the configuration file, reusing the parsed result while unchanged"""
+
+        key = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        signature = (stat.st_size, stat.st_mtime_ns)
 
-    validate_configuration(config, configuration)
+        with cls.__lock:
+            cached = cls.__cache.get(key)
 
-    project = configuration.get("project")
+        if cached and cached[0] == signature:
+            return cached[2]
 
-    def filter_component(components: Sequence, name: str) -> Mapping:
-        for component in components:
-            if component.get("name") == name:
-                return component
+        with TRACER.phase("load_config"), open(file_path, "rb") as file_handle:
+            contents = file_handle.read()
+            digest = hashlib.sha256(contents).hexdigest()
 
-        raise logging.Error(file_path=config, message=f"Unknown component name: {name}")
+            # Only touched, the contents are unchanged
+            if cached and cached[1] == digest:
+                project = cached[2]
+            else:
+                project = cls(file_path, yaml.load(contents, Loader=SafeLoader))
 
-    return filter_component(project.get("components"), component)
+        with cls.__lock:
+            cls.__cache[key] = (signature, digest, project)
+
+        return project
+
+    def components(self) -> Sequence[Mapping]:
+        """Returns all components in order of definition"""
+        return self.__components
+
+    def component(self, name: str) -> Mapping:
+        """Returns the component with the provided name"""
+
+        try:
+            return self.__by_name[name]
+        except KeyError:
+            raise logging.Error(
+                file_path=self.__file_path, message=f"Unknown component name: {name}"
+            ) from None
+
+
+def get_components_from_config(config: str) -> Sequence[Mapping]:
+    """Retrieves all components from the configuration file"""
+    return ProjectConfig.load(config).components()
+
+
+def get_component_from_config(config: str, component: str):
+    """Retrieves a specific component from the configuration file"""
+    return ProjectConfig.load(config).component(component)
@@ -0,0 +1,231 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Structured Diagnostics Formatters"""
+
+import json
+import sys
+import threading
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Mapping, Optional
+
+import llvm_diagnostics as logging
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# Rule identifiers, based on the (start of the) diagnostic message
+RULES = [
+    ("Incompatible change type", "change-type"),
+    ("Missing version tag", "version-tag"),
+    ("Incompatible version", "semver"),
+    ("Missing metadata", "release-metadata"),
+    ("Incompatible release date", "release-date"),
+    ("Heading depth", "heading-depth"),
+    ("Block quotes are not permitted", "entry-format"),
+    ("Numbered lists are not permitted", "entry-format"),
+    ("Sub-lists are not permitted", "entry-format"),
+    ("Versions are incorrectly ordered", "version-order"),
+    ("Unreleased version should be on top", "unreleased-position"),
+    ("Duplicate version", "duplicate-version"),
+    ("Gap in patch versions", "patch-gap"),
+    ("Release dates are not in order", "release-date-order"),
+]
+
+LEVELS = {
+    logging.Level.ERROR: "error",
+    logging.Level.WARNING: "warning",
+    logging.Level.NOTE: "note",
+}
+
+
+def get_rule(message: str) -> str:
+    """Returns the identifier of the rule which resulted in the message"""
+
+    for prefix, rule in RULES:
+        if message.startswith(prefix):
+            return rule
+
+    return "general"
+
+
+class StructuredFormatter(ABC):
+    """Formats all diagnostics as a single document, completed by `close()`
+
+    Every formatted diagnostic is the next part of the document, being written
+    to `stderr` by the reporter; the newlines in between are insignificant.
+    """
+
+    def __init__(self):
+        """Constructor"""
+
+        self.__lock = threading.Lock()
+        self.__count = 0
+        self.__closed = False
+        self.__levels = Counter()
+        self.__rules = Counter()
+        self.__files = Counter()
+
+    @abstractmethod
+    def header(self) -> str:
+        """Returns the start of the document"""
+
+    @abstractmethod
+    def entry(self, diagnostic: Mapping) -> Any:
+        """Returns the document entry for a single diagnostic"""
+
+    @abstractmethod
+    def footer(self, statistics: Mapping) -> str:
+        """Returns the end of the document"""
+
+    def statistics(self) -> Mapping:
+        """Returns the number of diagnostics per level, rule and file"""
+        return {
+            "total": self.__count,
+            "levels": dict(self.__levels),
+            "rules": dict(self.__rules),
+            "files": dict(self.__files),
+        }
+
+    def format(self, message: Any) -> str:
+        """Returns the next part of the document, containing the message"""
+
+        diagnostic = {
+            "level": LEVELS[message.level],
+            "rule": get_rule(message.message),
+            "message": message.message,
+            "file": message.file_path,
+            "line": message.line_number.start if message.line else None,
+            "column": message.column_number.start if message.line else None,
+            "end_column": (
+                message.column_number.end()
+                if message.line and message.column_number.range
+                else None
+            ),
+        }
+
+        with self.__lock:
+            if self.__closed:
+                return ""
+
+            text = ("," if self.__count else self.header()) + json.dumps(
+                self.entry(diagnostic)
+            )
+
+            self.__count += 1
+            self.__levels[diagnostic["level"]] += 1
+            self.__rules[diagnostic["rule"]] += 1
+            if diagnostic["file"]:
+                self.__files[diagnostic["file"]] += 1
+
+        return text
+
+    def close(self) -> str:
+        """Returns the end of the document, including the statistics"""
+
+        with self.__lock:
+            if self.__closed:
+                return ""
+
+            self.__closed = True
+            return ("" if self.__count else self.header()) + self.footer(
+                self.statistics()
+            )
+
+
+class Json(StructuredFormatter):
+    """JSON Formatter"""
+
+    def header(self) -> str:
+        """Returns the start of the document"""
+        return '{"diagnostics": ['
+
+    def entry(self, diagnostic: Mapping) -> Any:
+        """Returns the document entry for a single diagnostic"""
+        return diagnostic
+
+    def footer(self, statistics: Mapping) -> str:
+        """Returns the end of the document"""
+        return f'], "statistics": {json.dumps(statistics)}}}'
+
+
+class Sarif(StructuredFormatter):
+    """Static Analysis Results Interchange Format (SARIF) Formatter"""
+
+    def header(self) -> str:
+        """Returns the start of the document"""
+        return (
+            f'{{"$schema": "{SARIF_SCHEMA}", "version": "2.1.0", '
+            '"runs": [{"results": ['
+        )
+
+    def entry(self, diagnostic: Mapping) -> Any:
+        """Returns the document entry for a single diagnostic"""
+
+        result = {
+            "ruleId": diagnostic["rule"],
+            "level": diagnostic["level"],
+            "message": {"text": diagnostic["message"]},
+        }
+
+        if diagnostic["file"]:
+            location = {"artifactLocation": {"uri": diagnostic["file"]}}
+            if diagnostic["line"]:
+                location["region"] = {
+                    "startLine": diagnostic["line"],
+                    "startColumn": diagnostic["column"],
+                }
+                if diagnostic["end_column"]:
+                    location["region"]["endColumn"] = diagnostic["end_column"]
+
+            result["locations"] = [{"physicalLocation": location}]
+
+        return result
+
+    def footer(self, statistics: Mapping) -> str:
+        """Returns the end of the document"""
+
+        tool = {
+            "driver": {
+                "name": "changelogmanager",
+                "informationUri": (
+                    "https://github.com/tomtom-international/keepachangelog-manager"
+                ),
+                "rules": [{"id": rule} for rule in sorted(statistics["rules"])],
+            }
+        }
+
+        return (
+            f'], "tool": {json.dumps(tool)}, '
+            f'"properties": {{"statistics": {json.dumps(statistics)}}}}}]}}'
+        )
+
+
+FORMATTERS = {
+    "llvm": logging.formatters.Llvm,
+    "github": logging.formatters.GitHub,
+    "json": Json,
+    "sarif": Sarif,
+}
+
+
+def close_formatter(formatter: Optional[Any] = None) -> None:
+    """Completes the document of a structured formatter, if configured"""
+
+    formatter = formatter or logging.formatters.get_config()
+    if isinstance(formatter, StructuredFormatter):
+        text = formatter.close()
+        if text:
+            print(text, file=sys.stderr)
@@ -0,0 +1,63 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Export Formats"""
+
+import json
+
+from typing import Callable, Mapping, Sequence
+
+import llvm_diagnostics as logging
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+
+def export_json(releases: Sequence[Mapping]) -> bytes:
+    """Indented JSON array of releases"""
+    return json.dumps(releases, indent=4).encode("UTF-8")
+
+
+def export_compact_json(releases: Sequence[Mapping]) -> bytes:
+    """JSON array of releases without any whitespace"""
+    return json.dumps(releases, separators=(",", ":")).encode("UTF-8")
+
+
+def export_json_lines(releases: Sequence[Mapping]) -> bytes:
+    """One compact JSON document per release"""
+    return "".join(
+        json.dumps(release, separators=(",", ":")) + "\n" for release in releases
+    ).encode("UTF-8")
+
+
+def export_msgpack(releases: Sequence[Mapping]) -> bytes:
+    """MessagePack array of releases (requires the `msgpack` package)"""
+
+    if msgpack is None:
+        raise logging.Error(
+            message="The 'msgpack' format requires the msgpack package: "
+            "pip install keepachangelog-manager[msgpack]"
+        )
+
+    return msgpack.packb(releases)
+
+
+EXPORTERS: Mapping[str, Callable[[Sequence[Mapping]], bytes]] = {
+    "json": export_json,
+    "compact-json": export_compact_json,
+    "jsonl": export_json_lines,
+    "msgpack": export_msgpack,
+}
@@ -0,0 +1,101 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Changelog Fragments"""
+
+import os
+import re
+import time
+import uuid
+
+from dataclasses import dataclass
+from typing import List
+
+import llvm_diagnostics as logging
+
+from changelogmanager.change_types import TypesOfChange
+
+FRAGMENT_NAME = re.compile(r"^(?P<identifier>[^.]+)\.(?P<change_type>[^.]+)\.md$")
+
+
+@dataclass
+class Fragment:
+    """Single changelog entry stored in a separate file"""
+
+    file_path: str
+    change_type: str
+    message: str
+
+
+def write_fragment(directory: str, change_type: str, message: str) -> str:
+    """Stores the entry in a new, uniquely named, file in the fragment directory"""
+
+    os.makedirs(directory, exist_ok=True)
+
+    # Time-ordered, unique names: concurrent branches never touch the same file
+    file_name = f"{time.time_ns()}-{uuid.uuid4().hex[:8]}.{change_type}.md"
+    file_path = os.path.join(directory, file_name)
+
+    with open(file_path, "x", encoding="UTF-8") as file_handle:
+        file_handle.write(message + "\n")
+
+    return file_path
+
+
+def collect_fragments(directory: str) -> List[Fragment]:
+    """Retrieves all fragments, in order of creation, in a single directory scan"""
+
+    if not os.path.isdir(directory):
+        return []
+
+    with os.scandir(directory) as entries:
+        names = sorted(entry.name for entry in entries if entry.is_file())
+
+    fragments = []
+    for name in names:
+        file_path = os.path.join(directory, name)
+        match = FRAGMENT_NAME.match(name)
+
+        # Files such as `.gitkeep` or `README.md` are not fragments
+        if name.startswith(".") or not match:
+            continue
+
+        if match.group("change_type") not in TypesOfChange:
+            raise logging.Error(
+                file_path=file_path,
+                message=(
+                    "Incompatible fragment name, MUST be '<name>.<type>.md' with <type>"
+                    f" one of: {', '.join(TypesOfChange)}"
+                ),
+            )
+
+        with open(file_path, "r", encoding="UTF-8") as file_handle:
+            message = file_handle.read().strip()
+
+        fragments.append(
+            Fragment(
+                file_path=file_path,
+                change_type=match.group("change_type"),
+                message=message,
+            )
+        )
+
+    return fragments
+
+
+def remove_fragments(fragments: List[Fragment]) -> None:
+    """Removes the fragments once they are merged into the changelog"""
+
+    for fragment in fragments:
+        os.remove(fragment.file_path)
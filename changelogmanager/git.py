@@ -0,0 +1,220 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Git"""
+
+import re
+import subprocess  # nosec
+
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import llvm_diagnostics as logging
+
+HUNK_HEADER = re.compile(r"^@@ -[0-9]+(?:,[0-9]+)? \+([0-9]+)(?:,([0-9]+))? @@")
+CONVENTIONAL_COMMIT = re.compile(r"^([a-zA-Z]+)(?:\([^)]*\))?(!?): *(.+)$")
+BREAKING_CHANGE = re.compile(r"^BREAKING[ -]CHANGE: ", re.MULTILINE)
+
+# Conventional Commit types and their corresponding type of change
+COMMIT_TYPES = {
+    "feat": "added",
+    "fix": "fixed",
+    "perf": "changed",
+    "refactor": "changed",
+    "deprecate": "deprecated",
+    "remove": "removed",
+    "security": "security",
+}
+
+# Breaking changes, of any type, require a major version bump
+BREAKING_CHANGE_TYPE = "removed"
+
+# Separates the commits in the (streamed) Git log output
+RECORD_SEPARATOR = "\x1e"
+
+
+def parse_changed_lines(diff: str) -> List[Tuple[int, int]]:
+    """Extracts the (inclusive) line ranges of the new file from a unified diff"""
+
+    line_ranges = []
+    for line in diff.splitlines():
+        match = HUNK_HEADER.match(line)
+        if not match:
+            continue
+
+        start = int(match.group(1))
+        count = int(match.group(2)) if match.group(2) is not None else 1
+
+        # Pure deletions are reported against the line preceding the removal
+        line_ranges.append((max(start, 1), max(start + count - 1, start, 1)))
+
+    return line_ranges
+
+
+def changed_line_ranges(file_path: str, since: str) -> List[Tuple[int, int]]:
+    """Returns the line ranges of `file_path` changed since the provided revision"""
+
+    try:
+        result = subprocess.run(  # nosec
+            ["git", "diff", "--no-color", "--unified=0", since, "--", file_path],
+            capture_output=True,
+            check=True,
+            encoding="UTF-8",
+        )
+    except (OSError, subprocess.CalledProcessError) as exc_info:
+        raise logging.Error(
+            file_path=file_path,
+            message=f"Unable to determine the changes since '{since}'",
+        ) from exc_info
+
+    return parse_changed_lines(result.stdout)
+
+
+def commit_messages(repository: str, since: Optional[str] = None) -> Iterator[str]:
+    """Streams the messages (subject and body) of all (non-merge) commits, oldest first"""
+
+    def split_messages(lines: Iterable[str]) -> Iterator[str]:
+        message = None
+        for line in lines:
+            if line.startswith(RECORD_SEPARATOR):
+                if message is not None:
+                    yield message.strip()
+                message = line[1:]
+            elif message is not None:
+                message += line
+
+        if message is not None:
+            yield message.strip()
+
+    revisions = f"{since}..HEAD" if since else "HEAD"
+    try:
+        with subprocess.Popen(  # nosec
+            [
+                "git",
+                "log",
+                "--no-merges",
+                "--reverse",
+                f"--format={RECORD_SEPARATOR}%B",
+                revisions,
+            ],
+            cwd=repository,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="UTF-8",
+            errors="replace",
+        ) as process:
+            try:
+                yield from split_messages(process.stdout)
+            except GeneratorExit:
+                # Abandoned early, do not wait for the remaining history
+                process.kill()
+                raise
+    except OSError as exc_info:
+        raise logging.Error(
+            file_path=repository, message="Unable to read the Git history"
+        ) from exc_info
+
+    if process.returncode:
+        raise logging.Error(
+            file_path=repository,
+            message=f"Unable to read the Git history of '{revisions}'",
+        )
+
+
+def classify_commits(messages: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Maps Conventional Commit messages onto (type of change, message) pairs
+
+    Breaking changes (`!` or a `BREAKING CHANGE:` footer) are mapped onto the
+    only type of change resulting in a major version bump.
+    """
+
+    for message in messages:
+        subject, _, body = message.partition("\n")
+        match = CONVENTIONAL_COMMIT.match(subject)
+        if not match:
+            continue
+
+        if match.group(2) or BREAKING_CHANGE.search(body):
+            yield BREAKING_CHANGE_TYPE, match.group(3)
+            continue
+
+        change_type = COMMIT_TYPES.get(match.group(1).lower())
+        if change_type:
+            yield change_type, match.group(3)
+
+
+def tag_exists(repository: str, tag: str) -> bool:
+    """Verifies if the tag is already present in the repository"""
+
+    result = subprocess.run(  # nosec
+        ["git", "rev-parse", "--quiet", "--verify", f"refs/tags/{tag}"],
+        cwd=repository,
+        capture_output=True,
+        check=False,
+    )
+    return result.returncode == 0
+
+
+def commit_and_tag(
+    repository: str, paths: Sequence[str], tag: str, message: str
+) -> None:
+    """Commits the changes to the provided paths and tags the resulting commit
+
+    An existing tag is only accepted when it points at HEAD, with all changes
+    to the provided paths committed (i.e. when resuming a completed release).
+    """
+
+    def git(*args, check=True):
+        return subprocess.run(  # nosec
+            ["git", *args],
+            cwd=repository,
+            capture_output=True,
+            check=check,
+            encoding="UTF-8",
+        )
+
+    if tag_exists(repository, tag):
+        try:
+            tagged = git("rev-parse", f"{tag}^{{commit}}").stdout
+            released = tagged == git("rev-parse", "HEAD").stdout and not (
+                git("status", "--porcelain", "--", *paths).stdout
+            )
+        except (OSError, subprocess.CalledProcessError) as exc_info:
+            raise logging.Error(
+                file_path=repository,
+                message=f"Unable to verify the release tag '{tag}'",
+            ) from exc_info
+
+        if not released:
+            raise logging.Error(
+                file_path=repository,
+                message=(
+                    f"Release tag '{tag}' already exists, "
+                    "but does not point at the release commit"
+                ),
+            )
+        return
+
+    try:
+        git("add", "--all", "--", *paths)
+
+        # Nothing to commit when the release commit was already made
+        if git("diff", "--cached", "--quiet", "--", *paths, check=False).returncode:
+            git("commit", "--message", message, "--", *paths)
+
+        git("tag", "--annotate", "--message", message, tag)
+    except (OSError, subprocess.CalledProcessError) as exc_info:
+        raise logging.Error(
+            file_path=repository,
+            message=f"Unable to create the release tag '{tag}'",
+        ) from exc_info
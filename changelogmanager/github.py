@@ -15,19 +15,23 @@
 """GitHub"""
 
 import json
-import os
+import time
 
 from enum import Enum
 from textwrap import dedent
 from typing import Mapping, Optional, Sequence
 from urllib.error import URLError
+from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
 import llvm_diagnostics as logging
-from changelogmanager.change_types import CATEGORIES, UNRELEASED_ENTRY
+from changelogmanager.change_types import UNRELEASED_ENTRY
 from changelogmanager.changelog import Changelog
+from changelogmanager.profiling import TRACER
+from changelogmanager.templates import render_release_notes
 
 RELEASES_CHUNK_SIZE = 100
+GITHUB_API_URL = "https://api.github.com"
 
 
 class HttpMethods(Enum):
@@ -38,31 +42,105 @@ class HttpMethods(Enum):
     DELETE = "DELETE"
 
 
+def request_failure(url: str, method: HttpMethods, data: Optional[Mapping]):
+    """Returns the error to raise for a failing GitHub request"""
+
+    return logging.Error(
+        message=dedent(
+            f"""
+        Failure during GitHub request:
+          URL:    {url}
+          Method: {method.value}
+          Data:   {data}"""
+        )
+    )
+
+
+def request_headers(token: str) -> Mapping:
+    """Returns the headers to send with every GitHub request"""
+
+    return {
+        "Accept": "application/vnd.github.v3+json",
+        "Authorization": f"token {token}",
+    }
+
+
+def request_url(api_url: str, repository: str, api: str) -> str:
+    """Returns the URL of the repository API"""
+    return f"{api_url.rstrip('/')}/repos/{repository}/{api}"
+
+
+class ReleasePages:
+    """Collects the available releases, retrieved page by page"""
+
+    def __init__(self):
+        """Constructor"""
+
+        self.releases = []
+        self.complete = False
+        self.__page = 1
+
+    def query(self) -> Mapping:
+        """Returns the query parameters of the next page"""
+        return {"per_page": RELEASES_CHUNK_SIZE, "page": self.__page}
+
+    def add(self, page: Sequence) -> None:
+        """Adds the releases of the retrieved page"""
+
+        self.releases.extend(page)
+        self.complete = len(page) < RELEASES_CHUNK_SIZE
+        self.__page += 1
+
+
+def release_data(
+    changelog: Changelog, draft: bool, version: Optional[str] = None
+) -> Mapping:
+    """Returns the GitHub release to create for the [Unreleased] changes
+
+    Provide the `version` to publish a release already present in the changelog.
+    """
+
+    release = changelog.get(str(version) if version else UNRELEASED_ENTRY)
+    tag = f"v{version or changelog.suggest_future_version()}"
+    return {
+        "tag_name": tag,
+        "name": f"Release {tag}",
+        "draft": draft,
+        "body": render_release_notes(release),
+    }
+
+
 class GitHub:
     """GitHub"""
 
-    def __init__(self, repository: str, token: str):
+    def __init__(self, repository: str, token: str, api_url: str = GITHUB_API_URL):
         """Constructor"""
 
         self.__repository = repository
-        self.__headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "Authorization": f"token {token}",
-        }
+        self.__api_url = api_url
+        self.__headers = request_headers(token)
 
     def __github_request(
         self, api: str, method: HttpMethods, data: Optional[Mapping] = None
     ):
-        url = f"https://api.github.com/repos/{self.__repository}/{api}"
+        url = request_url(self.__api_url, self.__repository, api)
+        body = None
+
+        # GitHub ignores request bodies for GET requests, use query parameters
+        if method == HttpMethods.GET and data:
+            url = f"{url}?{urlencode(data)}"
+        elif data is not None:
+            body = json.dumps(data).encode()
 
         request = Request(
             method=method.value,
             url=url,
-            data=json.dumps(data).encode(),
+            data=body,
             headers=self.__headers,
         )
 
         response = []
+        start = time.perf_counter()
         try:
             with urlopen(request) as resp:  # nosec
                 response = resp.read().decode()
@@ -72,39 +150,24 @@ class GitHub:
 
             return json.loads(response)
         except URLError as url_error:
-            raise logging.Error(
-                message=dedent(
-                    f"""
-                Failure during GitHub request:
-                  URL:    {url}
-                  Method: {method.value}
-                  Data:   {data}"""
-                )
-            ) from url_error
+            raise request_failure(url=url, method=method, data=data) from url_error
+        finally:
+            TRACER.record_request(
+                method=method.value, url=url, duration=time.perf_counter() - start
+            )
 
     def get_releases(self) -> Sequence:
         """Retrieves available releases"""
-        releases = []
-        index = 1
-
-        while True:
-            data = self.__github_request(
-                method=HttpMethods.GET,
-                api="releases",
-                data={
-                    "per_page": RELEASES_CHUNK_SIZE,
-                    "page": index,
-                },
-            )
-
-            releases.extend(data)
 
-            if len(data) < RELEASES_CHUNK_SIZE:
-                break
-
-            index = index + 1
+        pages = ReleasePages()
+        while not pages.complete:
+            pages.add(
+                self.__github_request(
+                    method=HttpMethods.GET, api="releases", data=pages.query()
+                )
+            )
 
-        return releases
+        return pages.releases
 
     def delete_draft_releases(self) -> None:
         """Deletes all releases marked as 'Draft'"""
@@ -122,32 +185,13 @@ class GitHub:
             method=HttpMethods.DELETE, api=f"releases/{release.get('id')}"
         )
 
-    def create_release(self, changelog: Changelog, draft: bool):
+    def create_release(
+        self, changelog: Changelog, draft: bool, version: Optional[str] = None
+    ):
         """Creates a new release on GitHub"""
 
-        def generate_release_notes(release: Mapping):
-            body = "## What's changed" + os.linesep + os.linesep
-            body += os.linesep.join(
-                [
-                    f"### :{category.emoji}: {category.title}"
-                    + os.linesep
-                    + os.linesep.join(
-                        [f"* {message}" for message in release[identifier]]
-                    )
-                    for identifier, category in CATEGORIES.items()
-                    if identifier in release
-                ]
-            )
-            return body
-
-        version = f"v{changelog.suggest_future_version()}"
         self.__github_request(
             method=HttpMethods.POST,
             api="releases",
-            data={
-                "tag_name": version,
-                "name": f"Release {version}",
-                "draft": draft,
-                "body": generate_release_notes(changelog.get(UNRELEASED_ENTRY)),
-            },
+            data=release_data(changelog=changelog, draft=draft, version=version),
         )
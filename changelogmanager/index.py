@@ -0,0 +1,134 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Changelog Index"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import re
+
+from typing import List, Mapping, Optional
+
+from changelogmanager.changelog_reader import ChangelogReader, ReleaseOffset
+
+INDEX_SUFFIX = ".idx"
+INDEX_FORMAT = 1
+
+RELEASE_DATE = re.compile(rb"^## \[[^\]]*\][ -]*\(?([0-9]{4}-[0-9]{2}-[0-9]{2})")
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(file_path: str) -> str:
+    """Returns the SHA-256 hash of the file contents"""
+
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class ChangelogIndex:
+    """Sidecar file mapping each version onto its byte and line range"""
+
+    def __init__(self, file_path: str, index_path: Optional[str] = None):
+        """Constructor"""
+
+        self.__file_path = file_path
+        self.__index_path = index_path or file_path + INDEX_SUFFIX
+
+    def get_index_path(self) -> str:
+        """Returns the path to the sidecar index file"""
+        return self.__index_path
+
+    def __load(self) -> Optional[Mapping]:
+        try:
+            with open(self.__index_path, "r", encoding="UTF-8") as file_handle:
+                index = json.load(file_handle)
+        except (OSError, ValueError):
+            return None
+
+        return index if index.get("format") == INDEX_FORMAT else None
+
+    def __store(self, index: Mapping) -> None:
+        try:
+            with open(self.__index_path, "w", encoding="UTF-8") as file_handle:
+                json.dump(index, file_handle)
+        except OSError:
+            # The index is an optimization only, a read-only location is fine
+            pass
+
+    def __build(self, stat: os.stat_result, digest: str) -> Mapping:
+        offsets = ChangelogReader(file_path=self.__file_path).release_offsets()
+
+        releases = []
+        with open(self.__file_path, "rb") as file_handle:
+            for offset in offsets:
+                file_handle.seek(offset.start)
+                match = RELEASE_DATE.match(file_handle.readline())
+
+                releases.append(
+                    {
+                        **dataclasses.asdict(offset),
+                        "release_date": match.group(1).decode() if match else None,
+                    }
+                )
+
+        return {
+            "format": INDEX_FORMAT,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+            "releases": releases,
+        }
+
+    def releases(self) -> List[Mapping]:
+        """Returns the indexed releases, regenerating the index when outdated"""
+
+        if not os.path.isfile(self.__file_path):
+            return []
+
+        stat = os.stat(self.__file_path)
+        index = self.__load()
+
+        if (
+            index
+            and index["size"] == stat.st_size
+            and index["mtime_ns"] == stat.st_mtime_ns
+        ):
+            return index["releases"]
+
+        # Only the modification time changed: confirm using the file contents
+        digest = file_digest(self.__file_path)
+        if index and index["sha256"] == digest:
+            index["mtime_ns"] = stat.st_mtime_ns
+        else:
+            index = self.__build(stat, digest)
+
+        self.__store(index)
+
+        return index["releases"]
+
+    def offsets(self) -> List[ReleaseOffset]:
+        """Returns the location of each release"""
+
+        fields = [field.name for field in dataclasses.fields(ReleaseOffset)]
+
+        return [
+            ReleaseOffset(**{field: release[field] for field in fields})
+            for release in self.releases()
+        ]
@@ -0,0 +1,250 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Release Pipeline"""
+
+import json
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Mapping, MutableMapping, Optional, Sequence
+
+import llvm_diagnostics as logging
+
+from changelogmanager.change_types import UNRELEASED_ENTRY
+from changelogmanager.changelog import Changelog
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.fragments import collect_fragments, remove_fragments
+from changelogmanager.git import commit_and_tag
+from changelogmanager.github import GitHub
+
+STATE_FORMAT = 1
+STATE_SUFFIX = ".release-state"
+
+
+@dataclass
+class Stage:
+    """Single step of a pipeline, run once all stages it depends on completed
+
+    The action receives the (persisted) pipeline context, values stored in it
+    must be JSON serializable.
+    """
+
+    name: str
+    action: Callable[[MutableMapping], None]
+    after: Sequence[str] = field(default_factory=list)
+
+
+class Pipeline:
+    """Runs stages in order of their dependencies, recording each completed stage
+
+    Independent stages run concurrently. When a stage fails, the completed
+    stages are skipped on the next run, resuming at the failed stage.
+    """
+
+    def __init__(self, stages: Sequence[Stage], state_file: str):
+        """Constructor"""
+
+        names = [stage.name for stage in stages]
+        for stage in stages:
+            unknown = [name for name in stage.after if name not in names]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown {unknown}")
+
+        self.__stages = stages
+        self.__state_file = state_file
+        self.__lock = threading.Lock()
+        self.__state = self.__load()
+
+    def __load(self) -> Mapping:
+        try:
+            with open(self.__state_file, "r", encoding="UTF-8") as file_handle:
+                state = json.load(file_handle)
+        except FileNotFoundError:
+            return {"format": STATE_FORMAT, "completed": [], "context": {}}
+        except (OSError, ValueError) as exc_info:
+            raise logging.Error(
+                file_path=self.__state_file, message="Unable to read pipeline state"
+            ) from exc_info
+
+        if state.get("format") != STATE_FORMAT:
+            raise logging.Error(
+                file_path=self.__state_file, message="Incompatible pipeline state"
+            )
+
+        return state
+
+    def __store(self) -> None:
+        temporary_path = f"{self.__state_file}.tmp"
+        with open(temporary_path, "w", encoding="UTF-8") as file_handle:
+            json.dump(self.__state, file_handle, indent=4)
+        os.replace(temporary_path, self.__state_file)
+
+    def get_state_file(self) -> str:
+        """Returns the path to the state file"""
+        return self.__state_file
+
+    def completed(self) -> List[str]:
+        """Returns the names of the completed stages"""
+        return list(self.__state["completed"])
+
+    def context(self) -> MutableMapping:
+        """Returns the values stored by the stages"""
+        return self.__state["context"]
+
+    def __run_stage(
+        self, stage: Stage, on_complete: Optional[Callable[[str], None]]
+    ) -> str:
+        stage.action(self.context())
+
+        with self.__lock:
+            self.__state["completed"].append(stage.name)
+            self.__store()
+
+            if on_complete:
+                on_complete(stage.name)
+
+        return stage.name
+
+    def run(
+        self,
+        jobs: Optional[int] = None,
+        on_complete: Optional[Callable[[str], None]] = None,
+    ) -> List[str]:
+        """Runs all pending stages, returns the names of the stages run"""
+
+        pending = [s for s in self.__stages if s.name not in self.completed()]
+        executed = []
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            while pending:
+                done = self.completed()
+                ready = [s for s in pending if all(n in done for n in s.after)]
+                if not ready:
+                    raise logging.Error(
+                        message="Pipeline stages contain a circular dependency"
+                    )
+
+                futures = [
+                    executor.submit(self.__run_stage, s, on_complete) for s in ready
+                ]
+
+                # Let all concurrent stages finish, before reporting a failure
+                errors = [future.exception() for future in futures]
+                executed.extend(f.result() for f, e in zip(futures, errors) if not e)
+                for error in errors:
+                    if error:
+                        raise error
+
+                pending = [s for s in pending if s not in ready]
+
+        # Completed, the next run starts a new release
+        if os.path.exists(self.__state_file):
+            os.remove(self.__state_file)
+
+        return executed
+
+
+def release_pipeline(  # pylint: disable=R0913,R0914
+    file_path: str,
+    *,
+    state_file: Optional[str] = None,
+    override_version: Optional[str] = None,
+    fragment_dir: Optional[str] = None,
+    repository: Optional[str] = None,
+    github: Optional[GitHub] = None,
+    draft: bool = True,
+    export: Optional[str] = None,
+    export_format: str = "json",
+) -> Pipeline:
+    """Creates the validate -> bump -> write -> tag -> publish/export pipeline
+
+    The tag stage (committing and tagging the release in the Git `repository`),
+    publishing to `github` and the `export` are only included when requested.
+    """
+
+    def load() -> Changelog:
+        reader = ChangelogReader(file_path=file_path)
+        return Changelog(
+            file_path=file_path, changelog=reader.read(), sources=reader.sources
+        )
+
+    def load_unreleased():
+        changelog = load()
+        fragments = collect_fragments(fragment_dir) if fragment_dir else []
+
+        changelog.add_entries((f.change_type, f.message) for f in fragments)
+        return changelog, fragments
+
+    def validate(_):
+        changelog, _ = load_unreleased()
+        if UNRELEASED_ENTRY not in changelog.get():
+            raise logging.Error(
+                file_path=file_path,
+                message="Unable to release without [Unreleased] section",
+            )
+
+    def bump(context):
+        changelog, _ = load_unreleased()
+        changelog.release(override_version)
+        context["version"] = str(changelog.version())
+
+    def write(context):
+        changelog, fragments = load_unreleased()
+
+        # Resumed after the release was written, but before the stage was completed
+        if context["version"] in changelog.get():
+            remove_fragments(fragments)
+            return
+
+        changelog.release(context["version"])
+        changelog.write_to_file()
+        remove_fragments(fragments)
+
+    def tag(context):
+        commit_and_tag(
+            repository=repository,
+            paths=[os.path.abspath(file_path)]
+            + ([os.path.abspath(fragment_dir)] if fragment_dir else []),
+            tag=f"v{context['version']}",
+            message=f"Release v{context['version']}",
+        )
+
+    def publish(context):
+        github.delete_draft_releases()
+        github.create_release(changelog=load(), draft=draft, version=context["version"])
+
+    def export_release(_):
+        load().write_to_json(file=export, export_format=export_format)
+
+    stages = [
+        Stage(name="validate", action=validate),
+        Stage(name="bump", action=bump, after=["validate"]),
+        Stage(name="write", action=write, after=["bump"]),
+    ]
+
+    previous = "write"
+    if repository:
+        stages.append(Stage(name="tag", action=tag, after=["write"]))
+        previous = "tag"
+
+    if github:
+        stages.append(Stage(name="publish", action=publish, after=[previous]))
+
+    if export:
+        stages.append(Stage(name="export", action=export_release, after=["write"]))
+
+    return Pipeline(stages=stages, state_file=state_file or file_path + STATE_SUFFIX)
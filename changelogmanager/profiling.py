@@ -0,0 +1,99 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Profiling"""
+
+import json
+import time
+
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import List, Mapping
+
+TRACE_ENVIRONMENT_VARIABLE = "CHANGELOGMANAGER_TRACE"
+
+
+class Tracer:
+    """Records wall time per phase, I/O counters and HTTP request latencies"""
+
+    def __init__(self):
+        """Constructor"""
+
+        self.enabled = False
+        self.__phases = defaultdict(list)
+        self.__counters = defaultdict(int)
+        self.__requests = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """Measures the wall time spent in the enclosed block"""
+
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__phases[name].append(time.perf_counter() - start)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increments the named counter"""
+
+        if self.enabled:
+            self.__counters[name] += value
+
+    def record_request(self, method: str, url: str, duration: float) -> None:
+        """Records the latency of a single HTTP request"""
+
+        if self.enabled:
+            self.__requests.append({"method": method, "url": url, "duration": duration})
+
+    def requests(self) -> List[Mapping]:
+        """Returns the recorded HTTP requests, in order of completion"""
+        return list(self.__requests)
+
+    def summary(self) -> Mapping:
+        """Returns the recorded measurements (in milliseconds)"""
+
+        latencies = sorted(request["duration"] for request in self.__requests)
+
+        return {
+            "phases": {
+                name: {
+                    "calls": len(durations),
+                    "total_ms": sum(durations) * 1000,
+                    "max_ms": max(durations) * 1000,
+                }
+                for name, durations in self.__phases.items()
+            },
+            "counters": dict(self.__counters),
+            "http": {
+                "requests": len(latencies),
+                "total_ms": sum(latencies) * 1000,
+                "max_ms": latencies[-1] * 1000 if latencies else 0,
+                "median_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0,
+            },
+        }
+
+    def write(self, file: str) -> None:
+        """Stores the summary in JSON format"""
+
+        with open(file, "w", encoding="UTF-8") as file_handle:
+            file_handle.write(json.dumps(self.summary(), indent=4))
+
+
+# Global tracer, disabled unless profiling is requested
+TRACER = Tracer()
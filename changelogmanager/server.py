@@ -0,0 +1,183 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Changelog Server"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+
+from typing import Any, Mapping
+
+import llvm_diagnostics as logging
+
+from changelogmanager.changelog import Changelog
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.templates import render_release_notes
+
+QUERIES = ["current", "previous", "future", "json", "notes"]
+
+
+class ChangelogCache:  # pylint: disable=R0903
+    """Keeps parsed changelogs resident, re-reading them once modified"""
+
+    def __init__(self, components: Mapping[str, str]):
+        """Constructor"""
+
+        self.__components = components
+        self.__changelogs = {}
+        self.__lock = threading.Lock()
+
+    def get(self, component: str) -> Changelog:
+        """Returns the (cached) changelog of the provided component"""
+
+        if component not in self.__components:
+            raise logging.Error(message=f"Unknown component name: {component}")
+
+        file_path = self.__components[component]
+
+        try:
+            modification_time = os.stat(file_path).st_mtime_ns
+        except FileNotFoundError:
+            modification_time = None
+
+        with self.__lock:
+            cached_time, changelog = self.__changelogs.get(component, (None, None))
+
+            if changelog is None or cached_time != modification_time:
+                changelog = Changelog(
+                    file_path=file_path,
+                    changelog=ChangelogReader(file_path=file_path).read(),
+                )
+                self.__changelogs[component] = (modification_time, changelog)
+
+        return changelog
+
+
+def handle_query(cache: ChangelogCache, request: Mapping) -> Any:
+    """Answers a single query using the cached changelogs"""
+
+    changelog = cache.get(request.get("component", "default"))
+    query_type = request.get("query", "current")
+
+    if query_type == "current":
+        return str(changelog.version())
+
+    if query_type == "previous":
+        return str(changelog.previous_version())
+
+    if query_type == "future":
+        return str(changelog.suggest_future_version())
+
+    if query_type == "json":
+        return changelog.get(version=request.get("version"))
+
+    if query_type == "notes":
+        return render_release_notes(
+            changelog.get(version=request.get("version")),
+            template=request.get("template", "github"),
+        )
+
+    raise logging.Error(message=f"Unknown query: {query_type}")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handles newline-delimited JSON queries"""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, Mapping):
+                    raise TypeError("Requests MUST be JSON objects")
+
+                response = {"result": handle_query(self.server.cache, request)}
+            except (logging.Info, logging.Warning, logging.Error) as exc_info:
+                response = {"error": exc_info.message, "level": exc_info.level.name}
+            except (AttributeError, TypeError, ValueError):
+                response = {"error": "Malformed request"}
+
+            self.wfile.write(json.dumps(response).encode("UTF-8") + b"\n")
+            self.wfile.flush()
+
+
+def is_stale_socket(socket_path: str) -> bool:
+    """Verifies that the path is a socket which no server is listening on"""
+
+    if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+        return False
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except ConnectionRefusedError:
+            return True
+
+    return False
+
+
+class ChangelogServer(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server answering changelog queries"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, components: Mapping[str, str]):
+        """Constructor"""
+
+        # Only replace sockets left behind by a server that is no longer running
+        if os.path.exists(socket_path):
+            if not is_stale_socket(socket_path):
+                raise logging.Error(
+                    file_path=socket_path,
+                    message="Unable to replace a file or socket of a running server",
+                )
+            os.unlink(socket_path)
+
+        self.cache = ChangelogCache(components=components)
+        super().__init__(socket_path, _RequestHandler)
+
+    def server_close(self):
+        super().server_close()
+
+        if os.path.exists(self.server_address) and is_stale_socket(self.server_address):
+            os.unlink(self.server_address)
+
+
+def query(socket_path: str, request: Mapping) -> Any:
+    """Sends a single query to a running changelog server"""
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except OSError as exc_info:
+            raise logging.Error(
+                message=f"Unable to connect to the changelog server at '{socket_path}'"
+            ) from exc_info
+
+        connection.sendall(json.dumps(request).encode("UTF-8") + b"\n")
+
+        with connection.makefile("rb") as response_handle:
+            response = json.loads(response_handle.readline())
+
+    if "error" in response:
+        exception = {
+            logging.Level.NOTE.name: logging.Info,
+            logging.Level.WARNING.name: logging.Warning,
+        }.get(response.get("level"), logging.Error)
+        raise exception(message=response["error"])
+
+    return response["result"]
@@ -0,0 +1,124 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Release Notes Templates"""
+
+import os
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Mapping, Tuple
+
+import llvm_diagnostics as logging
+
+from changelogmanager.change_types import CATEGORIES
+
+
+@dataclass(frozen=True)
+class Template:
+    """Layout of release notes
+
+    The `category` format receives the `identifier`, `identifier_title`, `emoji`
+    and `title` of a category; the `entry` format contains a single `{message}`.
+    """
+
+    header: str
+    category: str
+    entry: str
+    category_separator: str = os.linesep
+    entry_separator: str = os.linesep
+
+
+TEMPLATES = {
+    "github": Template(
+        header="## What's changed" + os.linesep + os.linesep,
+        category="### :{emoji}: {title}" + os.linesep,
+        entry="* {message}",
+    ),
+    "markdown": Template(
+        header="",
+        category="### {identifier_title}\n",
+        entry="- {message}",
+        category_separator="\n\n",
+        entry_separator="\n",
+    ),
+    "slack": Template(
+        header="*What's changed*\n\n",
+        category=":{emoji}: *{title}*\n",
+        entry="• {message}",
+        category_separator="\n\n",
+        entry_separator="\n",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Template with the category headings and entry layout resolved upfront"""
+
+    header: str
+    categories: Tuple[Tuple[str, str], ...]
+    category_separator: str
+    entry_prefix: str
+    entry_joiner: str
+    entry_suffix: str
+
+    def render(self, release: Mapping) -> str:
+        """Renders the release notes of a single release"""
+
+        prefix, joiner, suffix = self.entry_prefix, self.entry_joiner, self.entry_suffix
+        return self.header + self.category_separator.join(
+            [
+                heading + prefix + joiner.join(release[identifier]) + suffix
+                for identifier, heading in self.categories
+                if identifier in release
+            ]
+        )
+
+
+@lru_cache(maxsize=None)
+def compile_template(name: str) -> CompiledTemplate:
+    """Compiles (and caches) the named template"""
+
+    if name not in TEMPLATES:
+        raise logging.Error(message=f"Unknown template: {name}")
+
+    template = TEMPLATES[name]
+    entry_prefix, entry_suffix = template.entry.split("{message}", maxsplit=1)
+
+    return CompiledTemplate(
+        header=template.header,
+        categories=tuple(
+            (
+                identifier,
+                template.category.format(
+                    identifier=identifier,
+                    identifier_title=identifier.title(),
+                    emoji=category.emoji,
+                    title=category.title,
+                ),
+            )
+            for identifier, category in CATEGORIES.items()
+        ),
+        category_separator=template.category_separator,
+        entry_prefix=entry_prefix,
+        entry_joiner=entry_suffix + template.entry_separator + entry_prefix,
+        entry_suffix=entry_suffix,
+    )
+
+
+def render_release_notes(release: Mapping, template: str = "github") -> str:
+    """Renders the release notes of a release using a named template"""
+
+    return compile_template(template).render(release)
@@ -0,0 +1,80 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Validation Cache"""
+
+import json
+import os
+import threading
+
+from typing import Mapping
+
+# Increment whenever the layout rules change, invalidating all cached results
+CACHE_FORMAT = 1
+CACHE_LIMIT = 100000
+
+
+class ValidationCache:
+    """Digests of release sections known to pass the layout validation"""
+
+    def __init__(self, file_path: str):
+        """Constructor"""
+
+        self.__file_path = file_path
+        self.__digests = self.__load()
+        self.__modified = False
+
+    def get_file_path(self) -> str:
+        """Returns the path to the cache file"""
+        return self.__file_path
+
+    def __load(self) -> Mapping[str, None]:
+        try:
+            with open(self.__file_path, "r", encoding="UTF-8") as file_handle:
+                cache = json.load(file_handle)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(cache, dict) or cache.get("format") != CACHE_FORMAT:
+            return {}
+
+        return dict.fromkeys(cache.get("sections", []))
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self.__digests
+
+    def add(self, digest: str) -> None:
+        """Marks the section with the provided digest as valid"""
+
+        if digest not in self.__digests:
+            self.__digests[digest] = None
+            self.__modified = True
+
+    def save(self) -> None:
+        """Stores the cache, if modified, keeping only the most recent entries"""
+
+        if not self.__modified:
+            return
+
+        digests = list(self.__digests)[-CACHE_LIMIT:]
+        temporary_path = f"{self.__file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="UTF-8") as file_handle:
+                json.dump({"format": CACHE_FORMAT, "sections": digests}, file_handle)
+            os.replace(temporary_path, self.__file_path)
+        except OSError:
+            # The cache is an optimization only, a read-only location is fine
+            return
+
+        self.__modified = False
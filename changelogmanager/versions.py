@@ -0,0 +1,86 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Semantic Versions"""
+
+import re
+
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+from semantic_version import Version
+
+SEMVER = re.compile(
+    r"^(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)"
+    r"(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?"
+    r"(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$"
+)
+
+CACHE_SIZE = 65536
+
+# Release versions take precedence over any pre-release version
+RELEASE = ((2, 0, ""),)
+
+
+class SemVer(NamedTuple):
+    """Parsed SemVer version"""
+
+    major: int
+    minor: int
+    patch: int
+    prerelease: Tuple[str, ...]
+    build: Tuple[str, ...]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_version(version: str) -> SemVer:
+    """Parses (and memoizes) a SemVer version, raises ValueError when incompatible"""
+
+    match = SEMVER.match(version)
+    if not match:
+        raise ValueError(f"Invalid version string: '{version}'")
+
+    prerelease = tuple(match.group(4).split(".")) if match.group(4) else ()
+    for identifier in prerelease:
+        if identifier.isdigit() and len(identifier) > 1 and identifier[0] == "0":
+            raise ValueError(f"Invalid leading zero in identifier '{identifier}'")
+
+    return SemVer(
+        major=int(match.group(1)),
+        minor=int(match.group(2)),
+        patch=int(match.group(3)),
+        prerelease=prerelease,
+        build=tuple(match.group(5).split(".")) if match.group(5) else (),
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def precedence_key(version: str) -> Tuple:
+    """Returns a key ordering versions by SemVer precedence (ignoring build metadata)"""
+
+    parsed = parse_version(version)
+    prerelease = tuple(
+        (0, int(identifier), "") if identifier.isdigit() else (1, 0, identifier)
+        for identifier in parsed.prerelease
+    )
+
+    return (parsed.major, parsed.minor, parsed.patch, prerelease or RELEASE)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_version(version: str) -> Version:
+    """Returns the (memoized) `semantic_version.Version` of the version string"""
+
+    parse_version(version)
+    return Version(version)
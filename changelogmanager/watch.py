@@ -0,0 +1,88 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Watch Mode"""
+
+import os
+import time
+
+from typing import Optional
+
+from changelogmanager.changelog_reader import ChangelogReader
+
+
+class ChangelogWatcher:
+    """Keeps the sections of a changelog in memory, re-validating them on change"""
+
+    def __init__(self, file_path: str):
+        """Constructor"""
+
+        self.__file_path = file_path
+        self.__reader = ChangelogReader(file_path=file_path)
+        self.__modification_time = None
+        self.__digests = set()
+
+    def poll(self) -> Optional[int]:
+        """Validates the modified sections, returns `None` if the file is unchanged"""
+
+        try:
+            modification_time = os.stat(self.__file_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        if modification_time == self.__modification_time:
+            return None
+
+        self.__modification_time = modification_time
+
+        sections = self.__reader.sections()
+        digests = [section.digest() for section in sections]
+        changed = [
+            index
+            for index, digest in enumerate(digests)
+            if digest not in self.__digests
+        ]
+
+        # Only remember valid sections, invalid sections are re-validated on every poll
+        valid = {digest for digest in digests if digest in self.__digests}
+        errors = 0
+        for index in changed:
+            section_errors = self.__reader.validate_sections([sections[index]])
+            if not section_errors:
+                valid.add(digests[index])
+
+            errors += section_errors
+
+        self.__digests = valid
+
+        if not errors:
+            self.__reader.validate_adjacent_versions(sections, changed)
+
+        return errors
+
+    def watch(self, interval: float) -> None:
+        """Polls the changelog file until interrupted"""
+
+        while True:
+            start = time.perf_counter()
+            errors = self.poll()
+
+            if errors is not None:
+                elapsed = (time.perf_counter() - start) * 1000
+                print(
+                    f"{self.__file_path}: {errors} errors detected ({elapsed:.1f} ms)",
+                    flush=True,
+                )
+
+            time.sleep(interval)
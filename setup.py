@@ -43,6 +43,10 @@ setup(
         "llvm-diagnostics>=3.0.1,<4",
         'inquirer>=3.4.0,<4',
     ),
+    extras_require={
+        "msgpack": ["msgpack>=1.0.0,<2"],
+        "aio": ["aiohttp>=3.8.0,<4"],
+    },
     setup_requires=(
         "setuptools_scm",
         "setuptools_scm_git_archive",
@@ -0,0 +1,127 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from changelogmanager.aggregate import (
+    aggregate,
+    aggregate_to_markdown,
+    load_components,
+    prepare_releases,
+)
+from changelogmanager.changelog import write_to_files
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.fragments import write_fragment
+
+from .utils import (
+    changelog_file,
+    get_changelog_expectations,
+    released_only_changelog_file,
+)
+
+
+def test_aggregate(changelog_file, released_only_changelog_file):
+    """Verifies that the changes of all components are combined"""
+
+    components = load_components(
+        [
+            {"name": "Service", "changelog": str(changelog_file)},
+            {"name": "Client", "changelog": str(released_only_changelog_file)},
+        ],
+        jobs=2,
+    )
+
+    assert [component.name for component in components] == ["Service", "Client"]
+
+    expectations = get_changelog_expectations()
+
+    assert aggregate(components) == {
+        "Service": [expectations["unreleased"]],
+        "Client": [],
+    }
+    assert aggregate(components, releases=1) == {
+        "Service": [expectations["unreleased"], expectations["1.0.0"]],
+        "Client": [expectations["1.0.0"]],
+    }
+
+
+def test_aggregate_to_markdown(changelog_file, released_only_changelog_file):
+    """Verifies the Markdown layout of the aggregated report"""
+
+    components = load_components(
+        [
+            {"name": "Service", "changelog": str(changelog_file)},
+            {"name": "Client", "changelog": str(released_only_changelog_file)},
+        ]
+    )
+
+    assert aggregate_to_markdown(aggregate(components)) == (
+        """\
+# Changes across 2 components
+
+## Service
+
+### [Unreleased]
+#### Added
+- New feature
+
+#### Changed
+- Changed another feature
+
+## Client
+
+No changes
+"""
+    )
+
+
+@pytest.mark.freeze_time("2100-12-03 12:34:56")
+def test_release_all_components(tmp_path, changelog_file, released_only_changelog_file):
+    """Verifies that all components are released as a batch"""
+
+    service = tmp_path / "service.md"
+    service.write_text(changelog_file.read_text("UTF-8"), encoding="UTF-8")
+    client = tmp_path / "client.md"
+    client.write_text(released_only_changelog_file.read_text("UTF-8"), encoding="UTF-8")
+    fragments = tmp_path / "client.d"
+    write_fragment(str(fragments), "fixed", "Fixed another bug")
+
+    releases = prepare_releases(
+        [
+            {"name": "Service", "changelog": str(service)},
+            {"name": "Client", "changelog": str(client), "fragments": str(fragments)},
+        ]
+    )
+
+    assert [(r.name, r.previous_version, r.version) for r in releases] == [
+        ("Service", "1.0.0", "1.1.0"),
+        ("Client", "1.0.0", "1.0.1"),
+    ]
+
+    # Nothing is written until requested
+    assert (
+        ChangelogReader(file_path=str(service)).read() == get_changelog_expectations()
+    )
+
+    write_to_files([release.changelog for release in releases])
+
+    assert ChangelogReader(file_path=str(service)).read() == get_changelog_expectations(
+        released=True
+    )
+    assert list(ChangelogReader(file_path=str(client)).read()) == [
+        "1.0.1",
+        "1.0.0",
+        "0.9.4",
+    ]
+    assert not [path for path in tmp_path.iterdir() if path.suffix == ".tmp"]
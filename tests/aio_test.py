@@ -0,0 +1,206 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+import llvm_diagnostics as logging
+
+from benchmarks.fake_github import FakeGitHubServer
+from changelogmanager.aio import AsyncChangelogs, AsyncGitHub
+
+from .utils import changelog_file, get_changelog_expectations
+
+
+@pytest.mark.freeze_time("2100-12-03 12:34:56")
+def test_read_write(tmp_path, changelog_file):
+    """Verifies reading and writing changelogs from within an event loop"""
+
+    paths = []
+    for index in range(4):
+        paths.append(str(tmp_path / f"CHANGELOG-{index}.md"))
+        (tmp_path / f"CHANGELOG-{index}.md").write_text(
+            changelog_file.read_text("UTF-8"), encoding="UTF-8"
+        )
+
+    async def release(changelogs, file_path):
+        changelog = await changelogs.read(file_path)
+        changelog.release()
+        await changelogs.write(changelog)
+        return await changelogs.read(file_path)
+
+    async def run():
+        async with AsyncChangelogs(max_workers=2) as changelogs:
+            return await asyncio.gather(
+                *[release(changelogs, file_path) for file_path in paths]
+            )
+
+    for changelog in asyncio.run(run()):
+        assert changelog.get() == get_changelog_expectations(released=True)
+
+
+def test_close_does_not_block():
+    """Verifies that pending operations are awaited without blocking the event loop"""
+
+    async def run():
+        changelogs = AsyncChangelogs(max_workers=1)
+        pending = threading.Event()
+        changelogs.get_executor().submit(pending.wait, 5)
+
+        closing = asyncio.create_task(changelogs.close())
+        await asyncio.sleep(0.1)
+        assert not closing.done()
+
+        pending.set()
+        await closing
+
+    asyncio.run(run())
+
+
+def test_github(changelog_file):
+    """Verifies the GitHub workflow from within an event loop"""
+
+    async def run(server, changelog):
+        async with AsyncGitHub(
+            repository="owner/project", token="secret", api_url=server.url
+        ) as github:
+            await github.delete_draft_releases()
+            await github.create_release(changelog=changelog, draft=True)
+            return await github.get_releases()
+
+    with FakeGitHubServer() as server:
+        for index in range(150):
+            server.create_release({"tag_name": f"v0.0.{index}", "draft": index < 10})
+
+        changelog = asyncio.run(AsyncChangelogs().read(str(changelog_file)))
+        releases = asyncio.run(run(server, changelog))
+
+        assert len(releases) == 141
+        assert releases[0]["tag_name"] == "v1.1.0"
+        assert server.requests["DELETE"] == 10
+
+
+def test_github_failure():
+    """Verifies that failing requests are reported"""
+
+    async def run(server):
+        async with AsyncGitHub(
+            repository="owner/project", token="secret", api_url=server.url
+        ) as github:
+            await github.get_releases()
+
+    with FakeGitHubServer(error_rate=1.0) as server:
+        with pytest.raises(logging.Error):
+            asyncio.run(run(server))
+
+
+class FakeResponse:
+    """Response of the `FakeSession`"""
+
+    def __init__(self, body):
+        self.__body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def read(self) -> bytes:
+        """Returns the response body"""
+        return json.dumps(self.__body).encode() if self.__body is not None else b""
+
+
+class FakeSession:
+    """In-memory replacement of an `aiohttp.ClientSession`"""
+
+    def __init__(self, releases):
+        self.releases = releases
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        """Records the request, returning the response of the GitHub API"""
+
+        self.requests.append((method, url, kwargs))
+
+        if method == "GET":
+            page, per_page = int(kwargs["params"]["page"]), int(
+                kwargs["params"]["per_page"]
+            )
+            return FakeResponse(self.releases[(page - 1) * per_page : page * per_page])
+
+        if method == "DELETE":
+            release_id = int(url.rsplit("/", 1)[1])
+            self.releases = [r for r in self.releases if r["id"] != release_id]
+            return FakeResponse(None)
+
+        self.releases.insert(0, dict(kwargs["json"], id=len(self.releases)))
+        return FakeResponse(self.releases[0])
+
+
+def test_github_session(changelog_file):
+    """Verifies the requests performed using the (aiohttp) session"""
+
+    session = FakeSession([{"id": index, "draft": index < 10} for index in range(150)])
+
+    async def run(changelog):
+        async with AsyncGitHub(
+            repository="owner/project",
+            token="secret",
+            api_url="https://github.example.com/api/",
+            session=session,
+        ) as github:
+            await github.delete_draft_releases()
+            await github.create_release(changelog=changelog, draft=True)
+            return await github.get_releases()
+
+    changelog = asyncio.run(AsyncChangelogs().read(str(changelog_file)))
+    releases = asyncio.run(run(changelog))
+
+    assert len(releases) == 141
+    assert releases[0]["tag_name"] == "v1.1.0"
+
+    method, url, kwargs = session.requests[0]
+    assert (method, url) == (
+        "GET",
+        "https://github.example.com/api/repos/owner/project/releases",
+    )
+    assert kwargs["params"] == {"per_page": "100", "page": "1"}
+    assert kwargs["headers"]["Authorization"] == "token secret"
+    assert [method for method, _, _ in session.requests].count("DELETE") == 10
+
+
+def test_github_aiohttp():
+    """Verifies the requests performed using aiohttp, including failures"""
+
+    pytest.importorskip("aiohttp")
+
+    async def run(server):
+        async with AsyncGitHub(
+            repository="owner/project", token="secret", api_url=server.url
+        ) as github:
+            return await github.get_releases()
+
+    with FakeGitHubServer() as server:
+        for index in range(150):
+            server.create_release({"tag_name": f"v0.0.{index}"})
+
+        assert len(asyncio.run(run(server))) == 150
+
+    with FakeGitHubServer(error_rate=1.0) as server:
+        with pytest.raises(logging.Error):
+            asyncio.run(run(server))
@@ -0,0 +1,313 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import llvm_diagnostics as logging
+
+from changelogmanager.change_types import TypesOfChange
+from changelogmanager.changelog_reader import (
+    ChangelogReader,
+    select_releases,
+    split_sections,
+)
+from changelogmanager.git import parse_changed_lines
+from changelogmanager.profiling import Tracer
+
+from .utils import changelog_file, get_changelog_expectations
+
+
+def test_split_sections(changelog_file):
+    """Verifies that a changelog is split up on its release headings"""
+
+    sections = ChangelogReader(file_path=changelog_file).sections()
+
+    assert [section.version() for section in sections] == [
+        None,
+        "unreleased",
+        "1.0.0",
+        "0.9.4",
+    ]
+    assert [(section.start, section.end) for section in sections] == [
+        (1, 2),
+        (3, 9),
+        (10, 16),
+        (17, 19),
+    ]
+
+
+def test_split_sections_without_preamble():
+    """Verifies that no empty preamble is created"""
+
+    sections = split_sections(["## [1.0.0] - 2022-03-14\n", "### Added\n"])
+
+    assert len(sections) == 1
+    assert sections[0].version() == "1.0.0"
+
+
+def test_parse_changed_lines():
+    """Verifies that the changed line ranges are extracted from a diff"""
+
+    diff = """\
+diff --git a/CHANGELOG.md b/CHANGELOG.md
+--- a/CHANGELOG.md
++++ b/CHANGELOG.md
+@@ -3,0 +4,2 @@ All notable changes
++### Added
++- New feature
+@@ -20 +22 @@
+-- Old
++- New
+@@ -30,2 +31,0 @@
+"""
+
+    assert parse_changed_lines(diff) == [(4, 5), (22, 22), (31, 31)]
+
+
+def test_validate_changes_only_affected_sections(tmp_path):
+    """Verifies that errors outside of the changed lines are ignored"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(
+        """\
+# Changelog
+
+## [Unreleased]
+### Added
+- New feature
+
+## [1.0.0] - 2022-03-14
+### Invalid
+- Historic mistake
+""",
+        encoding="UTF-8",
+    )
+
+    reader = ChangelogReader(file_path=str(changelog))
+    reader.validate_changes([(5, 5)])
+
+    with pytest.raises(logging.Error) as exc_info:
+        reader.validate_changes([(9, 9)])
+
+    assert str(exc_info.value.message) == "1 errors detected in the layout"
+
+
+def test_validate_changes_adjacent_ordering(tmp_path, mocker):
+    """Verifies that the ordering is verified against adjacent releases"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(
+        """\
+# Changelog
+
+## [0.9.0] - 2022-03-14
+### Added
+- New feature
+
+## [1.0.0] - 2022-03-13
+### Fixed
+- Some bug
+""",
+        encoding="UTF-8",
+    )
+
+    report = mocker.patch.object(logging.Warning, "report", autospec=True)
+
+    ChangelogReader(file_path=str(changelog)).validate_changes([(5, 5)])
+
+    report.assert_called_once()
+    assert (
+        report.call_args.args[0].message
+        == "Versions are incorrectly ordered: 0.9.0 -> 1.0.0"
+    )
+
+
+def test_release_offsets(changelog_file):
+    """Verifies that the release headings are located"""
+
+    offsets = ChangelogReader(file_path=changelog_file).release_offsets()
+    content = changelog_file.read_binary()
+
+    assert [(offset.version, offset.line) for offset in offsets] == [
+        ("unreleased", 3),
+        ("1.0.0", 10),
+        ("0.9.4", 17),
+    ]
+    assert content[offsets[1].start : offsets[1].end].startswith(b"## [1.0.0]")
+    assert offsets[-1].end == len(content)
+
+
+def test_read_release(changelog_file):
+    """Verifies that a single release can be read"""
+
+    reader = ChangelogReader(file_path=changelog_file)
+
+    assert reader.read_release("1.0.0") == get_changelog_expectations()["1.0.0"]
+
+    with pytest.raises(logging.Warning) as exc_info:
+        reader.read_release("123.456.789")
+
+    assert (
+        str(exc_info.value.message)
+        == "Version '123.456.789' not available in the Changelog"
+    )
+
+
+def test_read_release_validates_layout(tmp_path):
+    """Verifies that the layout of the requested release is validated"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(
+        "# Changelog\n\n## [1.0.0] - 2022-03-14\n### Invalid\n- Entry\n",
+        encoding="UTF-8",
+    )
+
+    with pytest.raises(logging.Error) as exc_info:
+        ChangelogReader(file_path=str(changelog)).read_release("1.0.0")
+
+    assert str(exc_info.value.message) == "1 errors detected in the layout"
+
+
+def test_release_offsets_empty_file(tmp_path):
+    """Verifies that empty (or missing) files contain no releases"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    assert ChangelogReader(file_path=str(changelog)).release_offsets() == []
+
+    changelog.write_text("", encoding="UTF-8")
+    assert ChangelogReader(file_path=str(changelog)).release_offsets() == []
+
+
+def test_select_releases(changelog_file):
+    """Verifies the selection of releases to read"""
+
+    offsets = ChangelogReader(file_path=changelog_file).release_offsets()
+
+    def select(**kwargs):
+        return [offset.version for offset in select_releases(offsets, **kwargs)]
+
+    assert select() == ["1.0.0", "0.9.4"]
+    assert select(version="unreleased") == ["unreleased"]
+    assert select(version="0.9.4") == ["0.9.4"]
+    assert select(latest=1) == ["1.0.0"]
+    assert select(since="0.9.4") == ["1.0.0"]
+    assert select(since="1.0.0") == []
+
+    with pytest.raises(logging.Warning) as exc_info:
+        select(since="123.456.789")
+
+    assert (
+        str(exc_info.value.message)
+        == "Version '123.456.789' not available in the Changelog"
+    )
+
+    with pytest.raises(logging.Warning) as exc_info:
+        select(since="Unreleased")
+
+    assert (
+        str(exc_info.value.message)
+        == "Unable to select the releases after the Unreleased version"
+    )
+
+
+def test_read_shares_strings(tmp_path):
+    """Verifies that category names and dates are shared among releases"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(
+        "# Changelog\n\n"
+        "## [1.1.0] - 2022-03-14\n### Added\n- Feature\n\n"
+        "## [1.0.0] - 2022-03-14\n### Added\n- Feature\n",
+        encoding="UTF-8",
+    )
+
+    for releases in (
+        ChangelogReader(file_path=str(changelog)).read(),
+        ChangelogReader(file_path=str(changelog)).read_releases(
+            ChangelogReader(file_path=str(changelog)).release_offsets()
+        ),
+    ):
+        first, second = releases.values()
+        assert [key for key in first if key == "added"][0] is TypesOfChange[0]
+        assert [key for key in second if key == "added"][0] is TypesOfChange[0]
+        assert first["metadata"]["release_date"] is second["metadata"]["release_date"]
+
+
+def test_lint_history(tmp_path, mocker):
+    """Verifies the duplicate versions, patch gaps and release date ordering"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(
+        """\
+# Changelog
+
+## [Unreleased]
+### Added
+- New feature
+
+## [2.1.0] - 2022-03-10
+
+## [2.0.1] - 2022-03-14
+
+## [1.2.4] - 2022-03-01
+
+## [1.2.1] - 2022-02-01
+
+## [1.2.1] - 2022-01-01
+
+## [1.2.0-rc.1] - 2021-12-01
+
+## [1.1.0] - 2021-11-01
+""",
+        encoding="UTF-8",
+    )
+
+    report = mocker.patch.object(logging.Warning, "report", autospec=True)
+
+    assert ChangelogReader(file_path=str(changelog)).lint_history() == 5
+    assert [
+        (call.args[0].line_number.start, call.args[0].message)
+        for call in report.call_args_list
+    ] == [
+        (
+            9,
+            "Release dates are not in order of versions: 2.0.1 (2022-03-14) -> 2.1.0 (2022-03-10)",  # pylint: disable=C0301
+        ),
+        (11, "Gap in patch versions: 1.2.4 -> 2.0.1"),
+        (13, "Gap in patch versions: 1.2.1 -> 1.2.4"),
+        (15, "Duplicate version '1.2.1', already listed on line 13"),
+        (19, "Gap in patch versions: 1.1.0 -> 1.2.1"),
+    ]
+
+
+def test_lint_history_clean(changelog_file, mocker):
+    """Verifies that a consistent history passes the lint"""
+
+    report = mocker.patch.object(logging.Warning, "report", autospec=True)
+
+    assert ChangelogReader(file_path=changelog_file).lint_history() == 0
+    report.assert_not_called()
+
+
+def test_validate_layout_counts_lines(changelog_file, mocker):
+    """Verifies that the lines are counted while streaming the file"""
+
+    tracer = Tracer()
+    tracer.enabled = True
+    mocker.patch("changelogmanager.changelog_reader.TRACER", tracer)
+
+    assert ChangelogReader(file_path=changelog_file).validate_layout() == 0
+    assert tracer.summary()["counters"] == {
+        "lines_read": len(changelog_file.read_text("UTF-8").splitlines())
+    }
@@ -12,18 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import json
+import os
+import stat
+
 from typing import Sequence
+import keepachangelog
 import pytest
 
 import llvm_diagnostics as logging
 from semantic_version import Version
 
 from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.cli import suggest_batch_versions
 from changelogmanager.change_types import CATEGORIES, VersionCore
 from changelogmanager.changelog import (
     DEFAULT_CHANGELOG_FILE,
+    INITIAL_VERSION,
     UNRELEASED_ENTRY,
     Changelog,
+    suggest_future_versions,
+    write_to_files,
 )
 
 from .utils import empty_changelog_file, changelog_file, released_only_changelog_file, unreleased_changelog_file, get_changelog_expectations
@@ -89,6 +99,28 @@ def test_add_second_change(changelog_file):
     }
 
 
+def test_add_entries(changelog_file):
+    """Verifies that many changes are added at once"""
+
+    changelog = Changelog(
+        file_path=changelog_file,
+        changelog=ChangelogReader(file_path=changelog_file).read(),
+    )
+
+    count = changelog.add_entries(
+        (change_type, f"Change {index}")
+        for index, change_type in enumerate(["fixed", "added", "fixed"])
+    )
+
+    assert count == 3
+    assert changelog.get(UNRELEASED_ENTRY) == {
+        "metadata": {"release_date": None, "version": "unreleased"},
+        "added": ["New feature", "Change 1"],
+        "changed": ["Changed another feature"],
+        "fixed": ["Change 0", "Change 2"],
+    }
+
+
 def test_exists(changelog_file):
     """Verifies changelog file existance"""
 
@@ -373,3 +405,173 @@ def test_suggest_future_version_cascade(changelog_file):
     validate_version("1.1.1", _patch_types)
     validate_version("1.2.0", _minor_types)
     validate_version("2.0.0", _major_types)
+
+
+def test_render_matches_keepachangelog(changelog_file):
+    """Verifies that the native renderer produces the Keep a Changelog layout"""
+
+    content = keepachangelog.to_dict(changelog_file, show_unreleased=True)
+
+    assert str(Changelog(changelog=content)) == keepachangelog.from_dict(content)
+
+
+def test_render_preserves_untouched_releases(tmp_path):
+    """Verifies that unmodified releases are written byte-for-byte"""
+
+    changelog_path = tmp_path / "CHANGELOG.md"
+    changelog_path.write_text(
+        """\
+# Changelog
+
+## [Unreleased]
+### Added
+- New feature
+
+## [1.0.0] - 2022-03-14
+### Fixed
+* Fixed some   bug  
+""",
+        encoding="UTF-8",
+    )
+
+    reader = ChangelogReader(file_path=changelog_path)
+    changelog = Changelog(
+        file_path=changelog_path, changelog=reader.read(), sources=reader.sources
+    )
+    changelog.add(change_type="added", message="Another feature")
+    changelog.write_to_file()
+
+    assert changelog_path.read_text(encoding="UTF-8").endswith(
+        """
+## [Unreleased]
+### Added
+- New feature
+- Another feature
+
+## [1.0.0] - 2022-03-14
+### Fixed
+* Fixed some   bug  
+"""
+    )
+
+
+def test_sources_collected_on_write(tmp_path, changelog_file, mocker):
+    """Verifies that the original Markdown is only collected when writing"""
+
+    file_path = tmp_path / "CHANGELOG.md"
+    file_path.write_text(changelog_file.read_text("UTF-8"), encoding="UTF-8")
+
+    reader = ChangelogReader(file_path=str(file_path))
+    expected = io.StringIO()
+    Changelog(changelog=reader.read(), sources=reader.sources()).render(expected)
+
+    sources = mocker.patch.object(
+        reader, "sources", autospec=True, side_effect=reader.sources
+    )
+    changelog = Changelog(
+        file_path=str(file_path), changelog=reader.read(), sources=reader.sources
+    )
+    changelog.get()
+    changelog.version()
+    sources.assert_not_called()
+
+    changelog.write_to_file()
+    changelog.write_to_file()
+    sources.assert_called_once_with()
+    assert file_path.read_text("UTF-8") == expected.getvalue()
+
+
+def test_write_to_json_version(changelog_file, tmp_path):
+    """Verifies that a single version can be exported"""
+
+    changelog = Changelog(
+        file_path=changelog_file,
+        changelog=ChangelogReader(file_path=changelog_file).read(),
+    )
+    output = tmp_path / "CHANGELOG.json"
+    changelog.write_to_json(file=str(output), version="1.0.0")
+
+    assert json.loads(output.read_text("UTF-8")) == [
+        get_changelog_expectations()["1.0.0"]
+    ]
+
+
+def test_write_to_files_retains_mode(tmp_path, changelog_file):
+    """Verifies that the permissions of the replaced files are retained"""
+
+    file_path = tmp_path / "CHANGELOG.md"
+    file_path.write_text(changelog_file.read_text("UTF-8"), encoding="UTF-8")
+    os.chmod(file_path, 0o644)
+
+    changelog = Changelog(
+        file_path=str(file_path),
+        changelog=ChangelogReader(file_path=str(file_path)).read(),
+    )
+    write_to_files([changelog])
+
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o644
+
+
+def test_write_to_files_removes_temporary_files(tmp_path, changelog_file, mocker):
+    """Verifies that no temporary files remain when rendering fails"""
+
+    file_path = tmp_path / "CHANGELOG.md"
+    file_path.write_text(changelog_file.read_text("UTF-8"), encoding="UTF-8")
+
+    changelog = Changelog(
+        file_path=str(file_path),
+        changelog=ChangelogReader(file_path=str(file_path)).read(),
+    )
+    mocker.patch.object(Changelog, "render", side_effect=RuntimeError("Failure"))
+
+    with pytest.raises(RuntimeError):
+        write_to_files([changelog])
+
+    assert os.listdir(tmp_path) == ["CHANGELOG.md"]
+
+
+def test_suggest_future_versions():
+    """Verifies that future versions are suggested for a batch of changes"""
+
+    assert suggest_future_versions(
+        [
+            (Version("1.0.0"), ["fixed"]),
+            (Version("1.0.0"), {"added": ["New feature"], "fixed": ["Some bug"]}),
+            (Version("1.0.0"), ["changed", "removed"]),
+            (Version("1.0.0"), []),
+            (None, ["removed"]),
+        ]
+    ) == [
+        Version("1.0.1"),
+        Version("1.1.0"),
+        Version("2.0.0"),
+        Version("1.0.1"),
+        INITIAL_VERSION,
+    ]
+
+
+def test_suggest_batch_versions():
+    """Verifies the suggested versions of a batch, including [Unreleased] sections"""
+
+    assert suggest_batch_versions(
+        [
+            {"name": "a", "version": "1.2.3", "changes": ["added"]},
+            {
+                "name": "b",
+                "version": "1.2.3",
+                "changes": {"metadata": {}, "removed": ["Old API"]},
+            },
+        ]
+    ) == [{"name": "a", "version": "1.3.0"}, {"name": "b", "version": "2.0.0"}]
+
+
+@pytest.mark.parametrize(
+    "changes", [["Added"], "added", ["metadata"], {"unknown": []}, None, 42]
+)
+def test_suggest_batch_versions_invalid(changes):
+    """Verifies that unknown types of change are rejected"""
+
+    with pytest.raises(logging.Error) as exc_info:
+        suggest_batch_versions([{"version": "1.2.3", "changes": changes}])
+
+    assert str(exc_info.value.message) == "Incorrect batch format"
@@ -0,0 +1,96 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+import yaml
+
+import llvm_diagnostics as logging
+
+from changelogmanager.config import ProjectConfig, get_component_from_config
+
+CONFIGURATION = """\
+project:
+  components:
+    - name: Service
+      changelog: service/CHANGELOG.md
+    - name: Library
+      changelog: library/CHANGELOG.md
+    - name: Service
+      changelog: duplicate/CHANGELOG.md
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Project configuration with multiple components"""
+
+    file_path = tmp_path / "config.yml"
+    file_path.write_text(CONFIGURATION, encoding="UTF-8")
+    return str(file_path)
+
+
+def test_component_lookup(config_file):
+    """Verifies the lookup of components by name"""
+
+    project = ProjectConfig.load(config_file)
+
+    assert [c["name"] for c in project.components()] == [
+        "Service",
+        "Library",
+        "Service",
+    ]
+    assert project.component("Library")["changelog"] == "library/CHANGELOG.md"
+    assert project.component("Service")["changelog"] == "service/CHANGELOG.md"
+    assert get_component_from_config(config_file, "Library") == {
+        "name": "Library",
+        "changelog": "library/CHANGELOG.md",
+    }
+
+    with pytest.raises(logging.Error):
+        project.component("Unknown")
+
+
+def test_cached(config_file, mocker):
+    """Verifies that the configuration is only parsed again when modified"""
+
+    spy = mocker.spy(yaml, "load")
+
+    project = ProjectConfig.load(config_file)
+    assert ProjectConfig.load(config_file) is project
+
+    # Touched, but identical contents
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    assert ProjectConfig.load(config_file) is project
+    assert spy.call_count == 1
+
+    with open(config_file, "a", encoding="UTF-8") as file_handle:
+        file_handle.write("    - name: Tool\n      changelog: tool/CHANGELOG.md\n")
+
+    assert ProjectConfig.load(config_file).component("Tool")
+    assert spy.call_count == 2
+
+
+def test_invalid_configuration(tmp_path):
+    """Verifies that invalid configurations are rejected"""
+
+    file_path = tmp_path / "config.yml"
+    file_path.write_text(
+        "project:\n  components:\n    - name: Service\n", encoding="UTF-8"
+    )
+
+    with pytest.raises(logging.Error):
+        ProjectConfig.load(str(file_path))
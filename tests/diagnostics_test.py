@@ -0,0 +1,197 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+import llvm_diagnostics as logging
+
+from click import UsageError
+
+from changelogmanager import __main__, cli
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.diagnostics import (
+    Json,
+    Sarif,
+    StructuredFormatter,
+    close_formatter,
+    get_rule,
+)
+
+from .utils import changelog_file
+
+INVALID_CHANGELOG = """\
+# Changelog
+
+## [Unreleased]
+### Unknown
+- > Quoted entry
+
+## [1.0] - 2022-03-14
+### Added
+- Feature
+"""
+
+
+@pytest.fixture
+def invalid_changelog(tmp_path):
+    """Changelog containing multiple layout errors"""
+
+    file_path = tmp_path / "CHANGELOG.md"
+    file_path.write_text(INVALID_CHANGELOG, encoding="UTF-8")
+    return str(file_path)
+
+
+@pytest.fixture
+def configure():
+    """Configures the provided formatter, restoring the original afterwards"""
+
+    original = logging.formatters.get_config()
+
+    def _configure(formatter):
+        logging.config(formatter)
+        return formatter
+
+    yield _configure
+    logging.config(original)
+
+
+def validate(file_path, formatter, capsys, mocker):
+    """Validates the changelog, returning the document written to stderr"""
+
+    reported = []
+    mocker.patch.object(
+        logging.Error,
+        "report",
+        autospec=True,
+        side_effect=lambda message: reported.append(str(message)),
+    )
+
+    ChangelogReader(file_path=file_path).validate_layout()
+
+    # Diagnostics are only formatted, they are written by the reporter
+    assert capsys.readouterr().err == ""
+
+    close_formatter(formatter)
+    return json.loads("\n".join(reported + [capsys.readouterr().err]))
+
+
+def test_get_rule():
+    """Verifies the mapping of messages onto rules"""
+
+    assert get_rule("Missing version tag") == "version-tag"
+    assert get_rule("Sub-lists are not permitted in changelog entries") == (
+        "entry-format"
+    )
+    assert get_rule("Versions are incorrectly ordered: 1.0.0 -> 1.1.0") == (
+        "version-order"
+    )
+    assert get_rule("Something else") == "general"
+
+
+def test_abstract_formatter():
+    """Verifies that the document layout has to be provided by a subclass"""
+
+    with pytest.raises(TypeError):
+        StructuredFormatter()  # pylint: disable=E0110
+
+
+def test_json(invalid_changelog, configure, capsys, mocker):
+    """Verifies the JSON document, including the statistics"""
+
+    document = validate(invalid_changelog, configure(Json()), capsys, mocker)
+
+    assert [d["rule"] for d in document["diagnostics"]] == [
+        "change-type",
+        "entry-format",
+        "semver",
+    ]
+    assert document["diagnostics"][1] == {
+        "level": "error",
+        "rule": "entry-format",
+        "message": "Block quotes are not permitted in changelog entries",
+        "file": invalid_changelog,
+        "line": 5,
+        "column": 3,
+        "end_column": 4,
+    }
+    assert document["statistics"] == {
+        "total": 3,
+        "levels": {"error": 3},
+        "rules": {"change-type": 1, "entry-format": 1, "semver": 1},
+        "files": {invalid_changelog: 3},
+    }
+
+
+def test_json_without_diagnostics(changelog_file, configure, capsys, mocker):
+    """Verifies that a (complete) document is written without any diagnostics"""
+
+    document = validate(str(changelog_file), configure(Json()), capsys, mocker)
+
+    assert document["diagnostics"] == []
+    assert document["statistics"]["total"] == 0
+
+
+def test_sarif(invalid_changelog, configure, capsys, mocker):
+    """Verifies the SARIF document"""
+
+    document = validate(invalid_changelog, configure(Sarif()), capsys, mocker)
+
+    assert document["version"] == "2.1.0"
+    (run,) = document["runs"]
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == [
+        "change-type",
+        "entry-format",
+        "semver",
+    ]
+    assert run["results"][2] == {
+        "ruleId": "semver",
+        "level": "error",
+        "message": {
+            "text": "Incompatible version '1.0' specified, MUST be SemVer compliant"
+        },
+        "locations": [
+            {
+                "physicalLocation": {
+                    "artifactLocation": {"uri": invalid_changelog},
+                    "region": {"startLine": 7, "startColumn": 5, "endColumn": 8},
+                }
+            }
+        ],
+    }
+    assert run["properties"]["statistics"]["total"] == 3
+
+
+def test_click_exception(configure, capsys, mocker):
+    """Verifies that command line errors are part of the structured document"""
+
+    configure(Json())
+    mocker.patch.object(
+        cli.main, "main", autospec=True, side_effect=UsageError("Invalid option")
+    )
+    reported = []
+    mocker.patch.object(
+        logging.Error,
+        "report",
+        autospec=True,
+        side_effect=lambda message: reported.append(str(message)),
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        __main__.main()
+    assert exc_info.value.code == 1
+
+    document = json.loads("\n".join(reported + [capsys.readouterr().err]))
+    assert [d["message"] for d in document["diagnostics"]] == ["Invalid option"]
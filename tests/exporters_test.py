@@ -0,0 +1,95 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+import llvm_diagnostics as logging
+
+from click.testing import CliRunner
+
+from changelogmanager import exporters
+from changelogmanager.cli import main
+from changelogmanager.changelog import Changelog
+from changelogmanager.changelog_reader import ChangelogReader
+
+from .utils import changelog_file, get_changelog_expectations
+
+
+@pytest.mark.parametrize("export_format", ["json", "compact-json"])
+def test_export_json(changelog_file, tmp_path, export_format):
+    """Verifies that the JSON formats contain an array of releases"""
+
+    changelog = Changelog(
+        file_path=changelog_file,
+        changelog=ChangelogReader(file_path=changelog_file).read(),
+    )
+    output = tmp_path / "CHANGELOG.json"
+    changelog.write_to_json(file=str(output), export_format=export_format)
+
+    assert json.loads(output.read_text("UTF-8")) == list(
+        get_changelog_expectations().values()
+    )
+
+
+def test_export_json_lines():
+    """Verifies that each release is stored on a separate line"""
+
+    releases = list(get_changelog_expectations().values())
+    lines = exporters.export_json_lines(releases).decode("UTF-8").splitlines()
+
+    assert [json.loads(line) for line in lines] == releases
+
+
+def test_export_msgpack():
+    """Verifies the binary MessagePack format"""
+
+    msgpack = pytest.importorskip("msgpack")
+    releases = list(get_changelog_expectations().values())
+
+    assert msgpack.unpackb(exporters.export_msgpack(releases)) == releases
+
+
+def test_export_msgpack_unavailable(mocker):
+    """Verifies that an Exception is raised without the msgpack package"""
+
+    mocker.patch.object(exporters, "msgpack", None)
+
+    with pytest.raises(logging.Error) as exc_info:
+        exporters.export_msgpack([])
+
+    assert "requires the msgpack package" in str(exc_info.value.message)
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        ["--latest", "-1"],
+        ["--version", "1.0.0", "--latest", "1"],
+        ["--version", "1.0.0", "--since", "0.9.4"],
+    ],
+)
+def test_to_json_invalid_selection(changelog_file, tmp_path, arguments):
+    """Verifies that invalid (combinations of) selections are rejected"""
+
+    output = tmp_path / "CHANGELOG.json"
+    result = CliRunner().invoke(
+        main,
+        ["--input-file", str(changelog_file), "to-json", "--file-name", str(output)]
+        + arguments,
+    )
+
+    assert result.exit_code == 2
+    assert not output.exists()
@@ -0,0 +1,78 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import llvm_diagnostics as logging
+
+from changelogmanager.changelog import Changelog
+from changelogmanager.fragments import (
+    collect_fragments,
+    remove_fragments,
+    write_fragment,
+)
+
+
+def test_collect_fragments(tmp_path):
+    """Verifies that fragments are collected in order of creation"""
+
+    directory = str(tmp_path / "changelog.d")
+
+    write_fragment(directory, "fixed", "Fixed some bug")
+    write_fragment(directory, "added", "New feature")
+
+    fragments = collect_fragments(directory)
+
+    assert [(f.change_type, f.message) for f in fragments] == [
+        ("fixed", "Fixed some bug"),
+        ("added", "New feature"),
+    ]
+
+    changelog = Changelog()
+    for fragment in fragments:
+        changelog.add(change_type=fragment.change_type, message=fragment.message)
+
+    assert changelog.get("unreleased")["added"] == ["New feature"]
+
+    remove_fragments(fragments)
+    assert collect_fragments(directory) == []
+
+
+def test_collect_fragments_missing_directory(tmp_path):
+    """Verifies that a missing directory contains no fragments"""
+
+    assert collect_fragments(str(tmp_path / "changelog.d")) == []
+
+
+def test_collect_invalid_fragment(tmp_path):
+    """Verifies that an Exception is raised for unknown change types"""
+
+    (tmp_path / "1-abc.improved.md").write_text("Something", encoding="UTF-8")
+
+    with pytest.raises(logging.Error) as exc_info:
+        collect_fragments(str(tmp_path))
+
+    assert str(exc_info.value.message).startswith("Incompatible fragment name")
+
+
+def test_collect_fragments_ignores_other_files(tmp_path):
+    """Verifies that files which are not shaped like fragments are skipped"""
+
+    (tmp_path / ".gitkeep").write_text("", encoding="UTF-8")
+    (tmp_path / "README.md").write_text("Fragments", encoding="UTF-8")
+    (tmp_path / "1-abc.added.md").write_text("New feature", encoding="UTF-8")
+
+    assert [fragment.message for fragment in collect_fragments(str(tmp_path))] == [
+        "New feature"
+    ]
@@ -0,0 +1,73 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import llvm_diagnostics as logging
+
+from benchmarks.generator import ChangelogGenerator
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.diagnostics import get_rule
+
+
+def test_deterministic():
+    """Verifies that the same seed results in the same changelog"""
+
+    assert str(ChangelogGenerator(releases=50, seed=1)) == str(
+        ChangelogGenerator(releases=50, seed=1)
+    )
+    assert str(ChangelogGenerator(releases=50, seed=1)) != str(
+        ChangelogGenerator(releases=50, seed=2)
+    )
+
+
+def test_valid_changelog(tmp_path):
+    """Verifies that the generated changelog is valid"""
+
+    generator = ChangelogGenerator(releases=200, max_entries=3, line_length=(10, 40))
+    file_path = str(tmp_path / "CHANGELOG.md")
+    line_count = generator.write(file_path)
+
+    with open(file_path, "r", encoding="UTF-8") as file_handle:
+        lines = file_handle.readlines()
+
+    assert line_count == len(lines)
+    assert all(len(line) <= 40 + 20 for line in lines if line.startswith("- "))
+
+    changelog = ChangelogReader(file_path=file_path).read()
+    assert list(changelog) == ["unreleased"] + generator.versions
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_injected_errors(tmp_path, mocker, seed):
+    """Verifies that every injected error is reported at its position"""
+
+    generator = ChangelogGenerator(releases=40, errors=20, seed=seed)
+    file_path = str(tmp_path / "CHANGELOG.md")
+    generator.write(file_path)
+
+    report = mocker.patch.object(logging.Error, "report", autospec=True)
+    assert ChangelogReader(file_path=file_path).validate_layout() == 20
+
+    assert [
+        (call.args[0].line_number.start, get_rule(call.args[0].message))
+        for call in report.call_args_list
+    ] == [(error.line, error.rule) for error in generator.errors]
+
+
+def test_too_many_errors():
+    """Verifies that at most one error per release is injected"""
+
+    with pytest.raises(ValueError):
+        ChangelogGenerator(releases=1, errors=2)
@@ -0,0 +1,158 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import os
+import subprocess  # nosec
+
+import pytest
+
+import llvm_diagnostics as logging
+
+from click.testing import CliRunner
+
+from changelogmanager.cli import main
+from changelogmanager.git import classify_commits, commit_and_tag, commit_messages
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Git repository with a mixture of (Conventional) Commits"""
+
+    def git(*args):
+        subprocess.run(  # nosec
+            ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init")
+    for message in [
+        ["feat(cli): New command"],
+        ["chore: Update dependencies"],
+        ["fix: Crash on empty files"],
+        ["Non conventional commit"],
+        ["perf!: Faster parsing"],
+        ["feat: New format", "Details\n\nBREAKING CHANGE: Old format is dropped"],
+    ]:
+        git("commit", "--allow-empty", *itertools.chain(*(["-m", m] for m in message)))
+    git("tag", "v1.0.0", "HEAD~3")
+
+    return str(tmp_path)
+
+
+def test_classify_commits():
+    """Verifies the mapping of Conventional Commits onto types of change"""
+
+    assert list(
+        classify_commits(
+            [
+                "feat: Added feature",
+                "Fix(parser): Fixed bug",
+                "refactor!: Breaking change",
+                "docs: Not a change",
+                "feat without colon",
+                "security: Fixed CVE",
+                "feat: New API\n\nBREAKING CHANGE: Old API is removed",
+                "fix: Footer-like body\n\nNo BREAKING CHANGE: here",
+            ]
+        )
+    ) == [
+        ("added", "Added feature"),
+        ("fixed", "Fixed bug"),
+        ("removed", "Breaking change"),
+        ("security", "Fixed CVE"),
+        ("removed", "New API"),
+        ("fixed", "Footer-like body"),
+    ]
+
+
+def test_commit_messages(repository):
+    """Verifies that the history is read oldest first"""
+
+    assert list(commit_messages(repository)) == [
+        "feat(cli): New command",
+        "chore: Update dependencies",
+        "fix: Crash on empty files",
+        "Non conventional commit",
+        "perf!: Faster parsing",
+        "feat: New format\n\nDetails\n\nBREAKING CHANGE: Old format is dropped",
+    ]
+    assert list(commit_messages(repository, since="v1.0.0")) == [
+        "Non conventional commit",
+        "perf!: Faster parsing",
+        "feat: New format\n\nDetails\n\nBREAKING CHANGE: Old format is dropped",
+    ]
+
+
+def test_commit_messages_unknown_revision(repository):
+    """Verifies that an unknown revision is reported"""
+
+    with pytest.raises(logging.Error):
+        list(commit_messages(repository, since="unknown"))
+
+
+def test_from_git_skips_known_entries(repository, tmp_path):
+    """Verifies that importing the history twice does not duplicate entries"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    arguments = ["--input-file", str(changelog), "from-git", "--repository", repository]
+
+    CliRunner().invoke(main, arguments, standalone_mode=False, catch_exceptions=False)
+    first = changelog.read_text("UTF-8")
+    assert "### Removed\n- Faster parsing\n- New format\n" in first
+
+    with pytest.raises(logging.Info):
+        CliRunner().invoke(
+            main, arguments, standalone_mode=False, catch_exceptions=False
+        )
+
+    assert changelog.read_text("UTF-8") == first
+
+
+def test_commit_and_tag_existing_tag(repository):
+    """Verifies that an existing tag is only accepted for the release commit"""
+
+    for key, value in [("user.name", "Test"), ("user.email", "test@example.com")]:
+        subprocess.run(  # nosec
+            ["git", "config", key, value], cwd=repository, check=True
+        )
+    changelog = os.path.join(repository, "CHANGELOG.md")
+
+    def release(content):
+        with open(changelog, "w", encoding="UTF-8") as file_handle:
+            file_handle.write(content)
+
+        commit_and_tag(
+            repository, paths=[changelog], tag="v2.0.0", message="Release v2.0.0"
+        )
+
+    release("## [2.0.0]\n")
+
+    # Resuming the completed release
+    release("## [2.0.0]\n")
+
+    # Uncommitted changes, not part of the tagged release commit
+    with pytest.raises(logging.Error) as exc_info:
+        release("## [2.0.0]\n- Modified\n")
+    assert str(exc_info.value.message) == (
+        "Release tag 'v2.0.0' already exists, but does not point at the release commit"
+    )
+
+    # Tag pointing at an older commit
+    with pytest.raises(logging.Error):
+        commit_and_tag(
+            repository, paths=[changelog], tag="v1.0.0", message="Release v1.0.0"
+        )
@@ -0,0 +1,86 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import llvm_diagnostics as logging
+
+from benchmarks.fake_github import FakeGitHubServer
+from changelogmanager.changelog import Changelog
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.github import GitHub
+
+from .utils import changelog_file
+
+
+def github(server):
+    """GitHub client connected to the fake server"""
+    return GitHub(repository="owner/project", token="secret", api_url=server.url)
+
+
+def test_get_releases_paginated():
+    """Verifies that all pages of releases are retrieved"""
+
+    with FakeGitHubServer() as server:
+        for index in range(250):
+            server.create_release({"tag_name": f"v0.0.{index}"})
+
+        releases = github(server).get_releases()
+
+        assert len(releases) == 250
+        assert len({r["id"] for r in releases}) == 250
+        assert server.requests["GET"] == 3
+
+
+def test_delete_draft_releases():
+    """Verifies that only draft releases are deleted"""
+
+    with FakeGitHubServer() as server:
+        server.create_release({"tag_name": "v1.0.0", "draft": False})
+        server.create_release({"tag_name": "v1.1.0", "draft": True})
+        server.create_release({"tag_name": "v1.2.0", "draft": True})
+
+        github(server).delete_draft_releases()
+
+        assert [r["tag_name"] for r in server.releases] == ["v1.0.0"]
+        assert server.requests["DELETE"] == 2
+
+
+def test_create_release(changelog_file):
+    """Verifies the payload of a newly created release"""
+
+    reader = ChangelogReader(file_path=str(changelog_file))
+    changelog = Changelog(
+        file_path=str(changelog_file), changelog=reader.read(), sources=reader.sources()
+    )
+
+    with FakeGitHubServer() as server:
+        github(server).create_release(changelog=changelog, draft=True)
+
+        (release,) = server.releases
+        assert release["tag_name"] == "v1.1.0"
+        assert release["name"] == "Release v1.1.0"
+        assert release["draft"] is True
+        assert release["body"].startswith("## What's changed")
+
+
+@pytest.mark.parametrize(
+    "settings", [{"error_rate": 1.0}, {"rate_limit": 0}], ids=["error", "rate_limit"]
+)
+def test_request_failure(settings):
+    """Verifies that failing requests are reported"""
+
+    with FakeGitHubServer(**settings) as server:
+        with pytest.raises(logging.Error):
+            github(server).get_releases()
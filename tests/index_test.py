@@ -0,0 +1,80 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.index import ChangelogIndex
+
+from .utils import changelog_file, get_changelog_expectations
+
+
+def touch(file_path):
+    """Updates the modification time of the file"""
+
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+
+def test_index(tmp_path, changelog_file, mocker):
+    """Verifies that the sidecar index is created and reused"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(changelog_file.read_text("UTF-8"), encoding="UTF-8")
+    spy = mocker.spy(ChangelogReader, "release_offsets")
+
+    index = ChangelogIndex(file_path=str(changelog))
+    releases = index.releases()
+
+    assert [(r["version"], r["line"], r["end_line"]) for r in releases] == [
+        ("unreleased", 3, 9),
+        ("1.0.0", 10, 16),
+        ("0.9.4", 17, 19),
+    ]
+    assert [r["release_date"] for r in releases] == [None, "2022-03-14", "2022-03-13"]
+    assert os.path.isfile(index.get_index_path())
+
+    # Unmodified, or only touched: the stored index is used
+    ChangelogIndex(file_path=str(changelog)).releases()
+    touch(changelog)
+    ChangelogIndex(file_path=str(changelog)).releases()
+    assert spy.call_count == 1
+
+    offsets = ChangelogIndex(file_path=str(changelog)).offsets()
+    assert ChangelogReader(file_path=str(changelog)).read_releases(offsets[1:2]) == {
+        "1.0.0": get_changelog_expectations()["1.0.0"]
+    }
+
+
+def test_index_regenerated_on_change(tmp_path, changelog_file):
+    """Verifies that the sidecar index is regenerated once the changelog changes"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(changelog_file.read_text("UTF-8"), encoding="UTF-8")
+    index = ChangelogIndex(file_path=str(changelog))
+    index.releases()
+
+    changelog.write_text(
+        changelog.read_text("UTF-8").replace(
+            "## [Unreleased]", "## [1.1.0] - 2022-03-15"
+        ),
+        encoding="UTF-8",
+    )
+    touch(changelog)
+
+    assert [r["version"] for r in index.releases()] == ["1.1.0", "1.0.0", "0.9.4"]
+
+    with open(index.get_index_path(), "r", encoding="UTF-8") as file_handle:
+        assert json.load(file_handle)["releases"][0]["release_date"] == "2022-03-15"
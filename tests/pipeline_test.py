@@ -0,0 +1,159 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import subprocess  # nosec
+
+import pytest
+
+import llvm_diagnostics as logging
+
+from benchmarks.fake_github import FakeGitHubServer
+from changelogmanager.github import GitHub
+from changelogmanager.pipeline import Pipeline, Stage, release_pipeline
+
+from .utils import changelog_file
+
+
+def test_resume_failed_stage(tmp_path):
+    """Verifies that a rerun resumes at the failed stage"""
+
+    calls = []
+    failures = {"publish": 1}
+
+    def action(name):
+        def _action(context):
+            calls.append(name)
+            context.setdefault("order", []).append(name)
+            if failures.get(name):
+                failures[name] -= 1
+                raise logging.Error(message=f"{name} failed")
+
+        return _action
+
+    def pipeline():
+        return Pipeline(
+            stages=[
+                Stage(name="first", action=action("first")),
+                Stage(name="publish", action=action("publish"), after=["first"]),
+                Stage(name="export", action=action("export"), after=["first"]),
+            ],
+            state_file=str(tmp_path / "state"),
+        )
+
+    with pytest.raises(logging.Error):
+        pipeline().run()
+
+    assert sorted(calls) == ["export", "first", "publish"]
+    assert sorted(pipeline().completed()) == ["export", "first"]
+
+    calls.clear()
+    assert pipeline().run() == ["publish"]
+    assert calls == ["publish"]
+    assert not os.path.exists(tmp_path / "state")
+
+
+def test_unknown_dependency(tmp_path):
+    """Verifies that stages can only depend on known stages"""
+
+    with pytest.raises(ValueError):
+        Pipeline(
+            stages=[Stage(name="first", action=print, after=["unknown"])],
+            state_file=str(tmp_path / "state"),
+        )
+
+
+@pytest.mark.freeze_time("2100-12-03 12:34:56")
+def test_release_pipeline(tmp_path, changelog_file):
+    """Verifies the release pipeline, resuming after a failure to publish"""
+
+    def git(*args):
+        return subprocess.run(  # nosec
+            ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+            encoding="UTF-8",
+        ).stdout
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(changelog_file.read_text("UTF-8"), encoding="UTF-8")
+    git("init")
+    git("add", "CHANGELOG.md")
+    git("commit", "-m", "Initial commit")
+    git("config", "user.name", "Test")
+    git("config", "user.email", "test@example.com")
+
+    def pipeline(server):
+        return release_pipeline(
+            str(changelog),
+            repository=str(tmp_path),
+            github=GitHub("owner/project", "secret", api_url=server.url),
+            export=str(tmp_path / "CHANGELOG.json"),
+        )
+
+    with FakeGitHubServer(error_rate=1.0) as server:
+        with pytest.raises(logging.Error):
+            pipeline(server).run()
+
+    assert sorted(pipeline(server).completed()) == [
+        "bump",
+        "export",
+        "tag",
+        "validate",
+        "write",
+    ]
+    assert "## [1.1.0] - 2100-12-03" in changelog.read_text("UTF-8")
+    assert git("tag", "--list") == "v1.1.0\n"
+    assert git("status", "--porcelain", "CHANGELOG.md") == ""
+
+    with open(tmp_path / "CHANGELOG.json", "r", encoding="UTF-8") as file_handle:
+        assert json.load(file_handle)[0]["metadata"]["version"] == "1.1.0"
+
+    with FakeGitHubServer() as server:
+        assert pipeline(server).run() == ["publish"]
+
+        (release,) = server.releases
+        assert release["tag_name"] == "v1.1.0"
+        assert release["body"].startswith("## What's changed")
+
+
+@pytest.mark.freeze_time("2100-12-03 12:34:56")
+def test_release_pipeline_resume_written(tmp_path, changelog_file, mocker):
+    """Verifies that a resumed run does not release an already written version"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(changelog_file.read_text("UTF-8"), encoding="UTF-8")
+    fragment_dir = tmp_path / "changelog.d"
+    fragment_dir.mkdir()
+    (fragment_dir / "1-abc.fixed.md").write_text("Some bug", encoding="UTF-8")
+
+    def pipeline():
+        return release_pipeline(str(changelog), fragment_dir=str(fragment_dir))
+
+    # Interrupted after writing the changelog, before completing the stage
+    mocker.patch(
+        "changelogmanager.pipeline.remove_fragments",
+        side_effect=[OSError("Interrupted"), None],
+        autospec=True,
+    )
+    with pytest.raises(OSError):
+        pipeline().run()
+
+    assert sorted(pipeline().completed()) == ["bump", "validate"]
+    assert "## [1.1.0] - 2100-12-03" in changelog.read_text("UTF-8")
+
+    assert pipeline().run() == ["write"]
+    assert changelog.read_text("UTF-8").count("## [1.1.0]") == 1
@@ -0,0 +1,57 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from changelogmanager.profiling import Tracer
+
+
+def test_disabled_tracer():
+    """Verifies that nothing is recorded unless enabled"""
+
+    tracer = Tracer()
+
+    with tracer.phase("parse"):
+        tracer.count("bytes_read", 123)
+    tracer.record_request(method="GET", url="https://localhost", duration=0.1)
+
+    assert tracer.summary() == {
+        "phases": {},
+        "counters": {},
+        "http": {"requests": 0, "total_ms": 0, "max_ms": 0, "median_ms": 0},
+    }
+
+
+def test_enabled_tracer(tmp_path):
+    """Verifies that phases, counters and requests are recorded"""
+
+    tracer = Tracer()
+    tracer.enabled = True
+
+    for _ in range(2):
+        with tracer.phase("parse"):
+            tracer.count("bytes_read", 100)
+
+    tracer.record_request(method="GET", url="https://localhost", duration=0.002)
+    tracer.record_request(method="POST", url="https://localhost", duration=0.004)
+
+    output = tmp_path / "profile.json"
+    tracer.write(str(output))
+    summary = json.loads(output.read_text("UTF-8"))
+
+    assert summary["phases"]["parse"]["calls"] == 2
+    assert summary["counters"] == {"bytes_read": 200}
+    assert summary["http"]["requests"] == 2
+    assert summary["http"]["max_ms"] == 4
+    assert [request["method"] for request in tracer.requests()] == ["GET", "POST"]
@@ -0,0 +1,67 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from benchmarks.regression import compare, load_baseline, main, report, store
+
+
+def result(lines_per_second):
+    """Benchmark result of a single scenario"""
+    return {
+        "lines": 1000,
+        "seconds": 1000 / lines_per_second,
+        "lines_per_second": lines_per_second,
+    }
+
+
+def test_compare():
+    """Verifies that only throughput decreases beyond the threshold fail"""
+
+    baseline = {"parse": result(1000), "validate": result(1000), "render": result(1000)}
+    results = {
+        "parse": result(800),
+        "validate": result(700),
+        "render": result(3000),
+        "export": result(10),
+    }
+
+    regressions = compare(baseline, results, threshold=0.25)
+    assert regressions == ["validate"]
+
+    table = report(baseline, results, regressions)
+    assert "validate" in table and "-30.0%  REGRESSION" in table
+    assert "export" in table and "new" in table
+
+
+def test_baseline(tmp_path):
+    """Verifies storing and loading baselines"""
+
+    file_path = str(tmp_path / "build" / "baseline.json")
+    assert load_baseline(file_path) == {}
+
+    store(file_path, {"parse": result(1000)})
+    assert load_baseline(file_path) == {"parse": result(1000)}
+
+
+def test_missing_baseline(tmp_path, mocker, capsys):
+    """Verifies that the gate fails, without measuring, unless a baseline exists"""
+
+    measure = mocker.patch("benchmarks.regression.measure", autospec=True)
+    mocker.patch(
+        "sys.argv",
+        ["regression", "--baseline", str(tmp_path / "build" / "baseline.json")],
+    )
+
+    assert main() == 2
+    assert "No baseline found" in capsys.readouterr().out
+    measure.assert_not_called()
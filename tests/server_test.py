@@ -0,0 +1,155 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import socket
+import threading
+
+import pytest
+
+import llvm_diagnostics as logging
+
+from changelogmanager.server import ChangelogServer, query
+
+from .utils import changelog_file, get_changelog_expectations
+
+
+@pytest.fixture
+def server(tmp_path, changelog_file):
+    """Changelog server running in a background thread"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(changelog_file.read_text("UTF-8"), encoding="UTF-8")
+    socket_path = str(tmp_path / "changelog.sock")
+
+    with ChangelogServer(
+        socket_path=socket_path, components={"default": str(changelog)}
+    ) as instance:
+        thread = threading.Thread(
+            target=instance.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        yield socket_path, changelog
+        instance.shutdown()
+
+    assert not os.path.exists(socket_path)
+
+
+def test_query_versions(server):
+    """Verifies that versions can be retrieved from the server"""
+
+    socket_path, _ = server
+
+    assert query(socket_path, {"query": "current"}) == "1.0.0"
+    assert query(socket_path, {"query": "previous"}) == "0.9.4"
+    assert query(socket_path, {"query": "future"}) == "1.1.0"
+
+
+def test_query_json(server):
+    """Verifies that (parts of) the changelog can be retrieved"""
+
+    socket_path, _ = server
+
+    assert query(socket_path, {"query": "json", "version": "0.9.4"}) == (
+        get_changelog_expectations()["0.9.4"]
+    )
+    assert "### :warning: Deprecation" in query(
+        socket_path, {"query": "notes", "version": "0.9.4"}
+    )
+
+
+def test_query_reloads_modified_changelog(server):
+    """Verifies that a modified changelog is re-read"""
+
+    socket_path, changelog = server
+
+    assert query(socket_path, {"query": "future"}) == "1.1.0"
+
+    changelog.write_text(
+        changelog.read_text("UTF-8").replace("### Added", "### Removed"),
+        encoding="UTF-8",
+    )
+    stat = os.stat(changelog)
+    os.utime(changelog, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert query(socket_path, {"query": "future"}) == "2.0.0"
+
+
+def test_query_errors(server):
+    """Verifies that failures are raised on the client side"""
+
+    socket_path, _ = server
+
+    with pytest.raises(logging.Error) as exc_info:
+        query(socket_path, {"component": "unknown"})
+    assert str(exc_info.value.message) == "Unknown component name: unknown"
+
+    with pytest.raises(logging.Warning) as exc_info:
+        query(socket_path, {"query": "json", "version": "123.456.789"})
+    assert (
+        str(exc_info.value.message)
+        == "Version '123.456.789' not available in the Changelog"
+    )
+
+
+def test_query_malformed(server):
+    """Verifies that malformed requests are answered, keeping the connection"""
+
+    socket_path, _ = server
+
+    for request in [[], "current", {"component": []}]:
+        with pytest.raises(logging.Error) as exc_info:
+            query(socket_path, request)
+        assert str(exc_info.value.message) == "Malformed request"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall(b'[]\n{"query": "current"}\n')
+
+        with connection.makefile("rb") as response_handle:
+            assert json.loads(response_handle.readline()) == {
+                "error": "Malformed request"
+            }
+            assert json.loads(response_handle.readline()) == {"result": "1.0.0"}
+
+
+def test_server_keeps_other_files(tmp_path, changelog_file):
+    """Verifies that files which are not stale sockets are never replaced"""
+
+    with pytest.raises(logging.Error):
+        ChangelogServer(
+            socket_path=str(changelog_file), components={"default": "CHANGELOG.md"}
+        )
+    assert os.path.isfile(changelog_file)
+
+    socket_path = str(tmp_path / "changelog.sock")
+    with ChangelogServer(socket_path=socket_path, components={}):
+        with pytest.raises(logging.Error):
+            ChangelogServer(socket_path=socket_path, components={})
+
+        assert os.path.exists(socket_path)
+
+
+def test_server_replaces_stale_socket(tmp_path):
+    """Verifies that a socket without a listening server is replaced"""
+
+    socket_path = str(tmp_path / "changelog.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(socket_path)
+
+    with ChangelogServer(socket_path=socket_path, components={}):
+        assert os.path.exists(socket_path)
+
+    assert not os.path.exists(socket_path)
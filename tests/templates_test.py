@@ -0,0 +1,68 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+import llvm_diagnostics as logging
+
+from changelogmanager.templates import (
+    compile_template,
+    render_release_notes,
+)
+
+from .utils import get_changelog_expectations
+
+
+def test_github_template():
+    """Verifies the layout of the GitHub release notes"""
+
+    release = get_changelog_expectations()["1.0.0"]
+
+    assert render_release_notes(release) == os.linesep.join(
+        [
+            "## What's changed",
+            "",
+            "### :no_entry_sign: Removed",
+            "* Removed deprecated API call",
+            "### :bug: Bug Fixes",
+            "* Fixed some bug",
+        ]
+    )
+
+
+def test_markdown_template():
+    """Verifies the layout of the Markdown release notes"""
+
+    release = get_changelog_expectations()["unreleased"]
+
+    assert render_release_notes(release, template="markdown") == (
+        "### Added\n- New feature\n\n### Changed\n- Changed another feature"
+    )
+
+
+def test_compiled_templates_are_cached():
+    """Verifies that templates are compiled only once"""
+
+    assert compile_template("slack") is compile_template("slack")
+
+
+def test_unknown_template():
+    """Verifies that an Exception is raised for unknown templates"""
+
+    with pytest.raises(logging.Error) as exc_info:
+        render_release_notes({}, template="unknown")
+
+    assert str(exc_info.value.message) == "Unknown template: unknown"
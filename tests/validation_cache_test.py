@@ -0,0 +1,84 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import llvm_diagnostics as logging
+
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.validation_cache import CACHE_FORMAT, ValidationCache
+
+from .utils import changelog_file, get_changelog_expectations
+
+
+def test_only_modified_sections_validated(tmp_path, changelog_file, mocker):
+    """Verifies that only new or modified sections are validated again"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(changelog_file.read_text("UTF-8"), encoding="UTF-8")
+    cache_path = str(tmp_path / "validation.cache")
+    spy = mocker.spy(ChangelogReader, "_ChangelogReader__validate_lines")
+
+    reader = ChangelogReader(str(changelog), cache=ValidationCache(cache_path))
+    assert reader.read() == get_changelog_expectations()
+    assert spy.call_count == 4
+
+    with open(cache_path, "r", encoding="UTF-8") as file_handle:
+        assert len(json.load(file_handle)["sections"]) == 4
+
+    spy.reset_mock()
+    reader = ChangelogReader(str(changelog), cache=ValidationCache(cache_path))
+    assert reader.read() == get_changelog_expectations()
+    assert spy.call_count == 0
+
+    # Modifying the [Unreleased] section only re-validates that section
+    changelog.write_text(
+        changelog.read_text("UTF-8").replace("- New feature", "- Newer feature"),
+        encoding="UTF-8",
+    )
+    ChangelogReader(str(changelog), cache=ValidationCache(cache_path)).read()
+    assert spy.call_count == 1
+    assert spy.call_args.args[1] == 3
+
+
+def test_invalid_sections_not_cached(tmp_path, mocker):
+    """Verifies that sections containing errors are reported on every run"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(
+        "# Changelog\n\n## [Unreleased]\n### Unknown\n- Entry\n", encoding="UTF-8"
+    )
+    cache_path = str(tmp_path / "validation.cache")
+    report = mocker.patch.object(logging.Error, "report", autospec=True)
+
+    for _ in range(2):
+        reader = ChangelogReader(str(changelog), cache=ValidationCache(cache_path))
+        assert reader.validate_layout() == 1
+
+    assert report.call_count == 2
+
+
+def test_incompatible_cache_ignored(tmp_path):
+    """Verifies that caches of a different format, or corrupted ones, are ignored"""
+
+    cache_path = tmp_path / "validation.cache"
+
+    cache_path.write_text(
+        json.dumps({"format": CACHE_FORMAT + 1, "sections": ["digest"]}),
+        encoding="UTF-8",
+    )
+    assert "digest" not in ValidationCache(str(cache_path))
+
+    cache_path.write_text("{", encoding="UTF-8")
+    assert "digest" not in ValidationCache(str(cache_path))
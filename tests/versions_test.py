@@ -0,0 +1,80 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+
+import pytest
+
+from semantic_version import Version
+
+from changelogmanager.versions import get_version, parse_version, precedence_key
+
+VERSIONS = [
+    "0.0.1",
+    "1.0.0-0",
+    "1.0.0-alpha",
+    "1.0.0-alpha.1",
+    "1.0.0-alpha.beta",
+    "1.0.0-beta.2",
+    "1.0.0-beta.11",
+    "1.0.0-rc.1",
+    "1.0.0",
+    "1.0.0+build.001",
+    "1.2.3-a-b",
+    "10.20.30",
+]
+
+
+@pytest.mark.parametrize(
+    "version",
+    ["01.0.0", "1.0", "1.0.0-", "1.0.0-rc.01", "v1.0.0", "1.0.0-a..b", " 1.0.0"],
+)
+def test_parse_invalid_version(version):
+    """Verifies that the same versions as `semantic_version` are rejected"""
+
+    with pytest.raises(ValueError):
+        Version(version)
+
+    with pytest.raises(ValueError):
+        parse_version(version)
+
+
+def test_parse_version():
+    """Verifies that all fields of the version are parsed"""
+
+    version = parse_version("1.2.3-rc.1+build.5")
+
+    assert (version.major, version.minor, version.patch) == (1, 2, 3)
+    assert version.prerelease == ("rc", "1")
+    assert version.build == ("build", "5")
+
+
+def test_precedence_key():
+    """Verifies that the ordering is identical to `semantic_version`"""
+
+    for first, second in itertools.product(VERSIONS, VERSIONS):
+        assert (precedence_key(first) < precedence_key(second)) == (
+            Version(first) < Version(second)
+        )
+        assert (precedence_key(first) <= precedence_key(second)) == (
+            Version(first) <= Version(second)
+        )
+
+
+def test_memoized():
+    """Verifies that repeated versions are parsed only once"""
+
+    assert parse_version("4.5.6") is parse_version("4.5.6")
+    assert get_version("4.5.6") is get_version("4.5.6")
+    assert get_version("4.5.6") == Version("4.5.6")
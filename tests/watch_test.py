@@ -0,0 +1,80 @@
+# Copyright (c) 2022 - 2022 TomTom N.V.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from changelogmanager.changelog_reader import ChangelogReader
+from changelogmanager.watch import ChangelogWatcher
+
+from .utils import changelog_file
+
+
+def test_watch_validates_changed_sections(tmp_path, changelog_file, mocker):
+    """Verifies that only modified sections are re-validated"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(changelog_file.read_text("UTF-8"), encoding="UTF-8")
+
+    spy = mocker.spy(ChangelogReader, "validate_sections")
+    watcher = ChangelogWatcher(file_path=str(changelog))
+
+    assert watcher.poll() == 0
+    assert spy.call_count == 4
+
+    assert watcher.poll() is None
+
+    changelog.write_text(
+        changelog.read_text("UTF-8").replace("- New feature", "- Other feature"),
+        encoding="UTF-8",
+    )
+    stat = os.stat(changelog)
+    os.utime(changelog, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    spy.reset_mock()
+    assert watcher.poll() == 0
+    assert [section.version() for section in spy.call_args.args[1]] == ["unreleased"]
+    assert spy.call_count == 1
+
+
+def test_watch_reports_layout_errors(tmp_path):
+    """Verifies that layout errors are counted"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text("# Changelog\n\n## [Unreleased]\n### Foo\n", encoding="UTF-8")
+
+    assert ChangelogWatcher(file_path=str(changelog)).poll() == 1
+
+
+def test_watch_revalidates_invalid_sections(tmp_path):
+    """Verifies that an invalid section is reported on every save"""
+
+    changelog = tmp_path / "CHANGELOG.md"
+    watcher = ChangelogWatcher(file_path=str(changelog))
+
+    for modification_time in range(2):
+        changelog.write_text(
+            "# Changelog\n\n## [Unreleased]\n### Foo\n", encoding="UTF-8"
+        )
+        stat = os.stat(changelog)
+        os.utime(changelog, ns=(stat.st_atime_ns, modification_time))
+
+        assert watcher.poll() == 1
+
+
+def test_watch_missing_file(tmp_path):
+    """Verifies that a missing file is ignored"""
+
+    watcher = ChangelogWatcher(file_path=str(tmp_path / "CHANGELOG.md"))
+
+    assert watcher.poll() is None